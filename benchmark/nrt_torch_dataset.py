@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from mixins import TimeableMixin
+from torch.utils.data import DataLoader, default_collate, get_worker_info
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+from nested_ragged_tensors.torch import NestedRaggedTensorDataset, NestedRaggedTensorIterableDataset, collate
+
+from .nrt_dataset import NRTDataset
+
+
+class NRTTorchDataset(NRTDataset):
+    """`NRTDataset` read end-to-end through ``nested_ragged_tensors.torch.NestedRaggedTensorDataset``.
+
+    The DataLoader fetches each batch with one `__getitems__` call, which reads all of the batch's rows with a
+    single fancy-index read and caps every sequence at ``max_seq_len`` with one vectorized `truncate`, and the
+    batch is collated through ``nested_ragged_tensors.torch.collate``. `NRTDataset` instead reads, crops and
+    returns each row separately. Sequences are capped by keeping their first ``max_seq_len`` events rather
+    than a random window; the amount of data read and collated is the same.
+    """
+
+    def read(self, read_dir: Path):
+        # Not timed again here: `NRTDataset.read` already times the read under the same key.
+        super().read(read_dir)
+        self.dynamics_fp = read_dir / "dynamics.nrt"
+        self.torch_dataset = NestedRaggedTensorDataset(self.dynamics_fp)
+
+    @TimeableMixin.TimeAs
+    def __getitems__(self, indices: list[int]) -> tuple[list[dict], JointNestedRaggedTensorDict]:
+        rows = [self.index[i][0] for i in indices]
+        dynamics = self.torch_dataset.__getitems__(rows)
+        if self.max_seq_len is not None:
+            dynamics = dynamics.truncate(dim=1, max_len=self.max_seq_len)
+        return [self.static_data[i] for i in rows], dynamics
+
+    @TimeableMixin.TimeAs
+    def collate(self, batch: tuple[list[dict], JointNestedRaggedTensorDict]) -> dict:
+        static_data, dynamics = batch
+        return {**default_collate(static_data), **collate(dynamics)}
+
+
+class _BatchesWithStaticData(NestedRaggedTensorIterableDataset):
+    """Yields each batch of `NestedRaggedTensorIterableDataset` alongside the static data of its rows."""
+
+    def __init__(self, tensors_fp: Path, batch_size: int, static_data: list[dict]):
+        super().__init__(tensors_fp, batch_size)
+        self.static_data = static_data
+
+    def __iter__(self):
+        worker_info = get_worker_info()
+        worker_id, num_workers = (0, 1) if worker_info is None else (worker_info.id, worker_info.num_workers)
+        for b, dynamics in zip(range(worker_id, len(self), num_workers), super().__iter__()):
+            start = b * self.batch_size
+            yield self.static_data[start : start + len(dynamics)], dynamics
+
+
+class NRTTorchIterableDataset(NRTTorchDataset):
+    """`NRTDataset` streamed through ``nested_ragged_tensors.torch.NestedRaggedTensorIterableDataset``.
+
+    Each batch is one contiguous slice of the file, read in file order; the ``shuffle`` argument of the
+    benchmark is therefore ignored. Sequences are capped and batches collated as in `NRTTorchDataset`.
+    """
+
+    def dataloader(self, batch_size: int, shuffle: bool = False, **kwargs) -> DataLoader:
+        batches = _BatchesWithStaticData(self.dynamics_fp, batch_size, self.static_data)
+        return DataLoader(batches, batch_size=None, collate_fn=self.collate, **kwargs)
+
+    @TimeableMixin.TimeAs
+    def collate(self, batch: tuple[list[dict], JointNestedRaggedTensorDict]) -> dict:
+        static_data, dynamics = batch
+        if self.max_seq_len is not None:
+            dynamics = dynamics.truncate(dim=1, max_len=self.max_seq_len)
+        return {**default_collate(static_data), **collate(dynamics)}
@@ -15,6 +15,11 @@ import numpy as np
 import pytest
 
 from benchmark.nrt_dataset import NRTDataset
+from benchmark.nrt_torch_dataset import NRTTorchDataset, NRTTorchIterableDataset
+
+# Maps each benchmarked dataset class to the suffix of its output file. The reference `NRTDataset` keeps the
+# unsuffixed name so its results stay continuous with the existing benchmark history.
+DATASET_CLASSES = {NRTDataset: "", NRTTorchDataset: "_torch", NRTTorchIterableDataset: "_torch_iterable"}
 
 
 def to_val(k: str, v: Any) -> dict:
@@ -86,21 +91,22 @@ def summarize_output(out: dict) -> list[dict]:
     return summary
 
 
+@pytest.mark.parametrize("dataset_cls", list(DATASET_CLASSES), ids=lambda cls: cls.__name__)
 @pytest.mark.parametrize("batch_size", [256])
 @pytest.mark.parametrize("max_seq_len", [512])
 @pytest.mark.parametrize("num_epochs", [5])
-def test_profile(tmp_path: Path, batch_size: int, max_seq_len: int, num_epochs: int):
+def test_profile(tmp_path: Path, dataset_cls: type, batch_size: int, max_seq_len: int, num_epochs: int):
     with open(SAMPLE_DATASET_PATH, mode="rb") as f:
         raw_D = pickle.load(f)
 
     out = {}
-    with NRTDataset.TemporaryDataset(raw_D, tmp_path) as (kwargs, stats):
+    with dataset_cls.TemporaryDataset(raw_D, tmp_path) as (kwargs, stats):
         prep_times, disk_size, prep_mem_stats = stats
         out["prep_mem_stats"] = prep_mem_stats
         out["prep_times"] = prep_times
         out["disk_size"] = disk_size
 
-        D = NRTDataset(**kwargs, max_seq_len=max_seq_len)
+        D = dataset_cls(**kwargs, max_seq_len=max_seq_len)
         batch_sizes, epoch_durations = D.benchmark(
             batch_size=batch_size,
             num_epochs=num_epochs,
@@ -113,6 +119,7 @@ def test_profile(tmp_path: Path, batch_size: int, max_seq_len: int, num_epochs:
 
     final_json_output = summarize_output(out)
 
-    output_fp = OUTPUT_DIR / f"output_{batch_size}_{max_seq_len}_{num_epochs}.json"
+    suffix = DATASET_CLASSES[dataset_cls]
+    output_fp = OUTPUT_DIR / f"output_{batch_size}_{max_seq_len}_{num_epochs}{suffix}.json"
     output_fp.parent.mkdir(parents=True, exist_ok=True)
     output_fp.write_text(json.dumps(final_json_output))
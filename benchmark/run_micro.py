@@ -12,6 +12,8 @@ without the ``test_`` prefix so bare ``pytest`` in the repo root does not auto-c
 """
 
 import json
+import os
+import pickle
 import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -19,7 +21,13 @@ from tempfile import TemporaryDirectory
 import numpy as np
 import rootutils
 
-from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+from nested_ragged_tensors.ragged_numpy import (
+    AnyInRange,
+    DenseBufferPool,
+    JointNestedRaggedTensorDict,
+    RowCache,
+)
+from nested_ragged_tensors.sampling import BlockShuffleSampler
 
 root = rootutils.setup_root(__file__, dotenv=True, pythonpath=True, cwd=False)
 OUTPUT_DIR = root / "benchmark" / "outputs"
@@ -47,6 +55,16 @@ def _make_entry(name, unit, mean, std, count):
     return {"name": name, "unit": unit, "value": mean, "range": std, "extra": f"Count: {count}"}
 
 
+def _drop_page_cache(fp):
+    """Best-effort eviction of *fp* from the OS page cache, so the next read of it is cold (Linux only)."""
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(fp, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
 # ---------------------------------------------------------------------------
 # Synthetic data generators
 # ---------------------------------------------------------------------------
@@ -159,6 +177,27 @@ COLLATE_BATCH_SIZES = [
 ]
 
 
+def bench_to_dense_pooled(results):
+    """Benchmark steady-state to_dense on 3D ragged tensors with outputs drawn from a ``DenseBufferPool``.
+
+    Compare against ``ToDense_3D``; the difference is the cost of allocating and zeroing fresh outputs.
+    """
+    for label, n in SCALE_CONFIGS:
+        J = make_3d(n)
+        pool = DenseBufferPool()
+        pool.release(J.to_dense(out=pool))  # Warm the pool so only recycled buffers are timed.
+        mean, std, count = _time(lambda J=J, pool=pool: pool.release(J.to_dense(out=pool)))
+        results.append(_make_entry(f"CoreOps/ToDense_3D_Pooled/{label}", "seconds", mean, std, count))
+
+
+def bench_to_dense_bucketed(results):
+    """Benchmark to_dense on 3D ragged tensors padded to bucketed shapes, with the inner dim capped."""
+    for label, n in SCALE_CONFIGS:
+        J = make_3d(n)
+        mean, std, count = _time(lambda J=J: J.to_dense(pad_to_multiple_of=8, max_lens={2: 8}))
+        results.append(_make_entry(f"CoreOps/ToDense_3D_Bucketed/{label}", "seconds", mean, std, count))
+
+
 def bench_vstack_to_dense(results):
     """Benchmark the collation path: vstack individual items then to_dense."""
     J = make_2d(1000)
@@ -241,6 +280,211 @@ def bench_disk_getitem(results):
             )
 
 
+def bench_iter_batches(results):
+    """Benchmark a full in-order pass over a disk-backed 3D JNRT: iter_batches vs. per-batch slicing."""
+    batch_size = 64
+    for label, n in SCALE_CONFIGS:
+        J = make_3d(n)
+        with TemporaryDirectory() as tmpdir:
+            fp = Path(tmpdir) / "test.nrt"
+            J.save(fp)
+            J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            len(J_disk)
+
+            def run_sliced(J_disk=J_disk, n=n):
+                for st in range(0, n, batch_size):
+                    J_disk[st : st + batch_size]
+
+            for name, fn in [
+                ("Sliced", run_sliced),
+                ("IterBatches", lambda J_disk=J_disk: list(J_disk.iter_batches(batch_size))),
+                (
+                    "IterBatches_Prefetch",
+                    lambda J_disk=J_disk: list(J_disk.iter_batches(batch_size, prefetch=2)),
+                ),
+            ]:
+                mean, std, count = _time(fn)
+                results.append(_make_entry(f"CoreOps/FullPass_{name}/{label}", "seconds", mean, std, count))
+
+
+def bench_block_shuffle(results):
+    """Benchmark cold-cache batch reads from disk: fully random batches vs. BlockShuffleSampler batches.
+
+    Both are read with integer-array indexing; the coalesced variant also merges the rows of a batch that fall
+    in the same block into a single read.
+    """
+    batch_size, n_batches = 32, 20
+    for label, n in SCALE_CONFIGS:
+        J = make_multikey_2d(n)
+        with TemporaryDirectory() as tmpdir:
+            fp = Path(tmpdir) / "test.nrt"
+            J.save(fp)
+            J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            len(J_disk)
+
+            rng = np.random.default_rng(0)
+            random_batches = [
+                np.sort(rng.choice(n, size=batch_size, replace=False)) for _ in range(n_batches)
+            ]
+            sampler = BlockShuffleSampler(n, batch_size, block_size=4 * batch_size, seed=0)
+            block_batches = [b for b, _ in zip(sampler, range(n_batches))]
+
+            # With a gap as wide as a block, each block-shuffled batch is read with one read per block.
+            J_coalesced = JointNestedRaggedTensorDict(tensors_fp=fp, coalesce_gap=4 * batch_size)
+            len(J_coalesced)
+
+            for name, J_disk, batches in [
+                ("Random", J_disk, random_batches),
+                ("BlockShuffle", J_disk, block_batches),
+                ("BlockShuffle_Coalesced", J_coalesced, block_batches),
+            ]:
+
+                def run(J_disk=J_disk, fp=fp, batches=batches):
+                    _drop_page_cache(fp)
+                    for idx in batches:
+                        J_disk[idx]
+
+                mean, std, count = _time(run)
+                n_rows = sum(len(b) for b in batches)
+                results.append(
+                    _make_entry(
+                        f"CoreOps/ColdRead_{name}/{label}", "seconds", mean / n_rows, std / n_rows, count
+                    )
+                )
+
+
+def bench_parallel_reads(results):
+    """Benchmark slicing and fancy-indexing a wide disk-backed JNRT with serial vs. pooled per-key reads."""
+    for label, n in SCALE_CONFIGS:
+        J = make_multikey_2d(n, n_keys=16)
+        with TemporaryDirectory() as tmpdir:
+            fp = Path(tmpdir) / "test.nrt"
+            J.save(fp)
+            idx = np.random.default_rng(0).choice(n, size=min(n, 256), replace=False)
+            for name, read_workers in [("Serial", 0), ("Pooled4", 4)]:
+                J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, read_workers=read_workers, coalesce_gap=4)
+                len(J_disk)
+                for access, fn in [
+                    ("Slice", lambda J_disk=J_disk, n=n: J_disk[: n // 2]),
+                    ("Fancy", lambda J_disk=J_disk: J_disk[idx]),
+                ]:
+                    mean, std, count = _time(fn)
+                    results.append(
+                        _make_entry(f"CoreOps/WideRead_{access}_{name}/{label}", "seconds", mean, std, count)
+                    )
+
+
+def bench_row_cache(results):
+    """Benchmark repeated int reads of a hot set of rows from a disk-backed 3D JNRT, with and without a cache.
+
+    The RowCache is large enough to hold every hot row and is warmed by an untimed first pass.
+    """
+    for label, n in SCALE_CONFIGS:
+        J = make_3d(n)
+        with TemporaryDirectory() as tmpdir:
+            fp = Path(tmpdir) / "test.nrt"
+            J.save(fp)
+            indices = np.random.default_rng(0).integers(0, min(n, 100), size=1000).tolist()
+            for name, row_cache in [("Uncached", None), ("Cached", RowCache(max_bytes=64 << 20))]:
+                J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, row_cache=row_cache)
+
+                def run(J_disk=J_disk):
+                    for i in indices:
+                        J_disk[i]
+
+                run()
+                mean, std, count = _time(run)
+                results.append(
+                    _make_entry(
+                        f"CoreOps/HotRows_{name}/{label}",
+                        "seconds",
+                        mean / len(indices),
+                        std / len(indices),
+                        count,
+                    )
+                )
+
+
+def bench_filter_rows(results):
+    """Benchmark a selective ``filter_rows`` query with and without row-group zone maps.
+
+    Timestamps increase with the row index (as in a time-sorted cohort) and the query window covers ~1% of
+    rows, so the zone maps let all but one or two row groups be skipped. The ``FullScan`` entry reads the same
+    archive saved without row groups; the ratio of the two is the pushdown speedup.
+    """
+    for label, n in SCALE_CONFIGS:
+        rng = np.random.default_rng(42)
+        lengths = rng.integers(5, 50, size=n)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        J = JointNestedRaggedTensorDict({"T": [list(range(st, st + ln)) for st, ln in zip(starts, lengths)]})
+        lo = int(starts[n // 2])
+        predicate = AnyInRange("T", lo=lo, hi=lo + max(1, n // 100) * int(lengths.mean()))
+
+        with TemporaryDirectory() as tmpdir:
+            for name, save_kwargs in [("FullScan", {}), ("ZoneMap", {"row_group_size": max(1, n // 100)})]:
+                fp = Path(tmpdir) / f"{name}.nrt"
+                J.save(fp, **save_kwargs)
+
+                def run(fp=fp):
+                    JointNestedRaggedTensorDict(tensors_fp=fp).filter_rows(predicate)
+
+                mean, std, count = _time(run)
+                results.append(_make_entry(f"CoreOps/FilterRows_{name}/{label}", "seconds", mean, std, count))
+
+
+def bench_reduce(results):
+    """Benchmark a per-event segment sum against the equivalent padded ``to_dense`` reduction."""
+    for label, n in SCALE_CONFIGS:
+        J = make_3d(n)
+
+        def run_segment(J=J):
+            J.sum(dim=-1)
+
+        def run_dense(J=J):
+            dense = J.to_dense()
+            np.where(dense["dim2/mask"], dense["val"], 0).sum(axis=-1)
+
+        for name, fn in [("Segment", run_segment), ("Dense", run_dense)]:
+            mean, std, count = _time(fn)
+            results.append(_make_entry(f"CoreOps/Reduce_{name}/{label}", "seconds", mean, std, count))
+
+
+def bench_pickle(results):
+    """Benchmark pickling as done when shipping JNRTs to DataLoader workers or other processes.
+
+    Unlike the removed pickle baseline, these entries exercise ``JointNestedRaggedTensorDict.__reduce_ex__``:
+    in-memory instances pickled with out-of-band protocol-5 buffers, and disk-backed instances, which should
+    pickle as just their path and cached metadata. Pickle sizes are reported alongside the timings so a change
+    that starts serializing array data or caches shows up even when it is fast.
+    """
+    for label, n in SCALE_CONFIGS:
+        J = make_multikey_2d(n, n_keys=4)
+
+        def run_oob(J=J):
+            buffers = []
+            payload = pickle.dumps(J, protocol=5, buffer_callback=buffers.append)
+            pickle.loads(payload, buffers=buffers)
+
+        mean, std, count = _time(run_oob)
+        results.append(_make_entry(f"CoreOps/Pickle_OutOfBand/{label}", "seconds", mean, std, count))
+        n_bytes = len(pickle.dumps(J, protocol=5))
+        results.append(_make_entry(f"CoreOps/PickleSize_InBand/{label}", "bytes", n_bytes, 0, 1))
+
+        with TemporaryDirectory() as tmpdir:
+            fp = Path(tmpdir) / "test.nrt"
+            J.save(fp)
+            J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            len(J_disk)  # Prime the cached metadata that is carried along in the pickle.
+
+            def run_disk(J_disk=J_disk):
+                pickle.loads(pickle.dumps(J_disk, protocol=5))
+
+            mean, std, count = _time(run_disk)
+            results.append(_make_entry(f"CoreOps/Pickle_Disk/{label}", "seconds", mean, std, count))
+            n_bytes = len(pickle.dumps(J_disk, protocol=5))
+            results.append(_make_entry(f"CoreOps/PickleSize_Disk/{label}", "bytes", n_bytes, 0, 1))
+
+
 # ---------------------------------------------------------------------------
 # Test entry point
 # ---------------------------------------------------------------------------
@@ -260,11 +504,20 @@ def test_micro_benchmarks():
     bench_to_dense_1d(results)
     bench_to_dense_2d(results)
     bench_to_dense_3d(results)
+    bench_to_dense_pooled(results)
+    bench_to_dense_bucketed(results)
     bench_vstack_to_dense(results)
     bench_concatenate(results)
     bench_save_load(results)
     bench_multikey(results)
     bench_disk_getitem(results)
+    bench_iter_batches(results)
+    bench_block_shuffle(results)
+    bench_parallel_reads(results)
+    bench_row_cache(results)
+    bench_filter_rows(results)
+    bench_reduce(results)
+    bench_pickle(results)
 
     output_fp = OUTPUT_DIR / "micro.json"
     output_fp.parent.mkdir(parents=True, exist_ok=True)
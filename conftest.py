@@ -0,0 +1,11 @@
+"""Root pytest configuration.
+
+``nested_ragged_tensors.torch`` depends on the optional ``torch`` extra; skip collecting its doctests when
+torch is not installed so that ``pytest --doctest-modules`` still runs against the core install.
+"""
+
+import importlib.util
+
+collect_ignore = []
+if importlib.util.find_spec("torch") is None:
+    collect_ignore.append("src/nested_ragged_tensors/torch.py")
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
+import json
+import numbers
+import os
+import pickle
 import re
+import sys
+import threading
 import warnings
-from collections.abc import Iterable, Sequence
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import cached_property
+from functools import cached_property, partial
+from multiprocessing import shared_memory
 from pathlib import Path
 
 import numpy as np
@@ -21,6 +32,19 @@ NUM_LIST_T = list[NUM_T]
 NESTED_NUM_LIST_T = NUM_LIST_T
 NESTED_NUM_LIST_T = list[NESTED_NUM_LIST_T] | NESTED_NUM_LIST_T
 
+# Safetensors header metadata key under which ``JointNestedRaggedTensorDict.save(row_group_size=...)``
+# stores the JSON-encoded row-group zone maps consumed by ``JointNestedRaggedTensorDict.filter_rows``.
+ROW_GROUPS_METADATA_KEY = "nrt/row_groups"
+
+# When searching a sorted key of a disk-backed collection, segments shorter than this many elements are read
+# whole rather than bisected with one read per probe: a read of a few thousand values costs about as much as
+# the one or two reads it would save, and bisecting such a segment takes a dozen reads.
+_WHOLE_SEGMENT_SEARCH_LEN = 4096
+
+# When gathering elements of a disk-backed collection (e.g. the windows kept by ``slice_by_value``), runs of
+# elements at most this many elements apart are read together, for the same reason.
+_ELEMENT_READ_GAP = 4096
+
 
 def pprint_dense(dense_dict: dict[str, np.ndarray]) -> None:
     """Pretty prints a dense dictionary of numpy arrays. Purely used to aid in debugging and display.
@@ -146,6 +170,677 @@ def is_ndim_list(L: Sequence | Sequence[int | float], dim: int = 1) -> bool:
             return False
 
 
+class RowPredicate:
+    """A predicate over the values of a single key, used by `JointNestedRaggedTensorDict.filter_rows`.
+
+    A dim-0 row matches a predicate if *any* of its elements at ``key`` (at whatever depth ``key`` lives)
+    satisfies `element_mask`. Subclasses additionally implement `may_match`, a conservative test against the
+    per-row-group zone maps written by `JointNestedRaggedTensorDict.save` with ``row_group_size=...``: it may
+    only return `False` if no row in the group can possibly match, which lets `filter_rows` skip the group
+    without reading its values.
+
+    Args:
+        key: The user-level key whose values are tested.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def element_mask(self, values: np.ndarray) -> np.ndarray:
+        """Returns a boolean mask over ``values`` marking the elements that satisfy this predicate."""
+        raise NotImplementedError  # pragma: no cover
+
+    def may_match(self, stats: list | None, bitset: np.ndarray | None) -> bool:
+        """Returns `False` only if no element summarized by ``stats`` / ``bitset`` can satisfy the predicate.
+
+        Args:
+            stats: The ``[min, max]`` zone map of ``key`` over the row group, or `None` if the group holds no
+                (non-NaN) values for ``key``.
+            bitset: The unpacked membership bitset of ``key`` over the row group, if one was stored.
+        """
+        return stats is not None
+
+
+class AnyInRange(RowPredicate):
+    """Matches rows with any value of ``key`` in the closed interval ``[lo, hi]``.
+
+    Args:
+        key: The user-level key whose values are tested.
+        lo: The inclusive lower bound, or `None` for no lower bound.
+        hi: The inclusive upper bound, or `None` for no upper bound.
+
+    Examples:
+        >>> P = AnyInRange("T", lo=2, hi=4)
+        >>> P.element_mask(np.array([1, 2, 5, 4]))
+        array([False,  True, False,  True])
+        >>> P.may_match([5, 9], None), P.may_match([0, 2], None), P.may_match(None, None)
+        (False, True, False)
+        >>> AnyInRange("T", hi=0).element_mask(np.array([-1., 0., np.nan]))
+        array([ True,  True, False])
+    """
+
+    def __init__(self, key: str, lo: NUM_T | None = None, hi: NUM_T | None = None):
+        super().__init__(key)
+        self.lo = lo
+        self.hi = hi
+
+    def element_mask(self, values: np.ndarray) -> np.ndarray:
+        mask = np.ones(values.shape, dtype=bool)
+        if self.lo is not None:
+            mask &= values >= self.lo
+        if self.hi is not None:
+            mask &= values <= self.hi
+        return mask
+
+    def may_match(self, stats: list | None, bitset: np.ndarray | None) -> bool:
+        if stats is None:
+            return False
+        mn, mx = stats
+        if self.lo is not None and mx < self.lo:
+            return False
+        if self.hi is not None and mn > self.hi:
+            return False
+        return True
+
+
+class AnyIn(RowPredicate):
+    """Matches rows with any value of ``key`` contained in ``values``.
+
+    When the archive stores a membership bitset for ``key`` (see `JointNestedRaggedTensorDict.save`), row
+    groups none of whose bits are set for ``values`` are skipped, in addition to the min/max zone-map check.
+
+    Args:
+        key: The user-level key whose values are tested.
+        values: The set of values to test membership against.
+
+    Examples:
+        >>> P = AnyIn("code", [3, 7])
+        >>> P.element_mask(np.array([1, 3, 5, 7]))
+        array([False,  True, False,  True])
+        >>> P.may_match([8, 12], None), P.may_match([0, 5], None)
+        (False, True)
+        >>> bits = np.zeros(8, dtype=bool)
+        >>> bits[[1, 4]] = True
+        >>> P.may_match([0, 12], bits), AnyIn("code", [12]).may_match([0, 12], bits)
+        (False, True)
+    """
+
+    def __init__(self, key: str, values: Iterable[NUM_T]):
+        super().__init__(key)
+        self.values = np.unique(np.asarray(list(values)))
+
+    def element_mask(self, values: np.ndarray) -> np.ndarray:
+        return np.isin(values, self.values)
+
+    def may_match(self, stats: list | None, bitset: np.ndarray | None) -> bool:
+        if stats is None:
+            return False
+        mn, mx = stats
+        candidates = self.values[(self.values >= mn) & (self.values <= mx)]
+        if len(candidates) == 0:
+            return False
+        if bitset is not None:
+            return bool(bitset[candidates.astype(np.int64) % len(bitset)].any())
+        return True
+
+
+class RaggedKeyView(np.lib.mixins.NDArrayOperatorsMixin):
+    """An elementwise, numpy-compatible view of the flat values of one key of a ragged tensor collection.
+
+    Views are obtained via `JointNestedRaggedTensorDict.key_view` and support numpy ufuncs (and hence the
+    arithmetic and comparison operators) by applying them directly to the flat value buffer, so the cost of an
+    operation scales with the number of stored elements and the ``dim*/bounds`` arrays are never copied. When
+    views at different dims are combined, the shallower operands are broadcast down to the deepest dim by
+    repeating each value over the segment of elements it owns, as read from the bounds. Plain arrays and
+    scalars are passed through to numpy unchanged, so an array operand must either broadcast against, or be
+    aligned with, the flat buffer (e.g., a per-code lookup table indexed by a view, ``mean[code]``).
+
+    Results are new views sharing the structure of the deepest input; use `JointNestedRaggedTensorDict.assign`
+    to store them back as a key. A view returned by `key_view` wraps the collection's own buffer, so writing
+    to it with ``out=`` (or an augmented assignment such as ``+=``) updates the collection in place without
+    allocating.
+
+    Args:
+        jnrt: The collection whose bounds define the ragged structure of ``values``.
+        dim: The dim at which ``values`` lives.
+        values: The flat values, aligned with the elements of ``jnrt`` at ``dim``.
+
+    Examples:
+        >>> J = JointNestedRaggedTensorDict({
+        ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+        ...     "val": [[[1, 0.5, 0], [3.5, 0], [1, 2.5]], [[3], [3.5, 2, 0]]],
+        ... })
+        >>> val = J.key_view("val")
+        >>> val
+        RaggedKeyView(dim=2, values=array([1. , 0.5, 0. , 3.5, 0. , 1. , 2.5, 3. , 3.5, 2. , 0. ],
+              dtype=float32))
+        >>> (val * 2 + 1).values
+        array([3., 2., 1., 8., 1., 3., 6., 7., 8., 5., 1.], dtype=float32)
+
+        Views at shallower dims broadcast over the elements they own:
+
+        >>> (val - J.key_view("T")).values
+        array([ 0. , -0.5, -1. ,  1.5, -2. , -2. , -0.5, -1. , -1.5, -3. , -5. ], dtype=float32)
+
+        ``out=`` writes into an existing buffer, including the collection's own:
+
+        >>> _ = np.multiply(val, 10, out=val)
+        >>> J.tensors["dim2/val"]
+        array([10.,  5.,  0., 35.,  0., 10., 25., 30., 35., 20.,  0.], dtype=float32)
+
+        Views over differently-structured collections can't be combined, and only elementwise ufunc calls
+        are supported:
+
+        >>> val + JointNestedRaggedTensorDict({"val": [[1.0], [2.0]]}).key_view("val")
+        Traceback (most recent call last):
+            ...
+        ValueError: Can't combine RaggedKeyViews whose collections have different bounds at dim 1.
+        >>> static = JointNestedRaggedTensorDict({"id": [1, 2]}).key_view("id")
+        >>> static + JointNestedRaggedTensorDict({"id": [1, 2, 3]}).key_view("id")
+        Traceback (most recent call last):
+            ...
+        ValueError: Can't combine RaggedKeyViews whose collections have different lengths (2 vs. 3).
+        >>> np.add.reduce(val)
+        Traceback (most recent call last):
+            ...
+        TypeError: operand type(s) all returned NotImplemented from __array_ufunc__(...)...
+    """
+
+    def __init__(self, jnrt: JointNestedRaggedTensorDict, dim: int, values: np.ndarray):
+        self._jnrt = jnrt
+        self.dim = dim
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dim={self.dim}, values={self.values!r})"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is not None and dtype != self.values.dtype:
+            return self.values.astype(dtype)
+        return self.values.copy() if copy else self.values
+
+    def _check_compatible(self, other: RaggedKeyView, dim: int):
+        """Raises a `ValueError` unless ``self`` and ``other`` share their bounds down to ``dim``."""
+        if other._jnrt is self._jnrt:
+            return
+        if len(self._jnrt) != len(other._jnrt):
+            raise ValueError(
+                f"Can't combine {self.__class__.__name__}s whose collections have different lengths "
+                f"({len(self._jnrt)} vs. {len(other._jnrt)})."
+            )
+        for d in range(1, dim + 1):
+            B_self = self._jnrt.tensors.get(f"dim{d}/bounds")
+            B_other = other._jnrt.tensors.get(f"dim{d}/bounds")
+            if B_self is B_other:
+                continue
+            if B_self is None or B_other is None or not np.array_equal(B_self, B_other):
+                raise ValueError(
+                    f"Can't combine {self.__class__.__name__}s whose collections have different bounds at "
+                    f"dim {d}."
+                )
+
+    def _broadcast_to(self, target: RaggedKeyView) -> np.ndarray:
+        """Returns the values repeated so that each element at ``target.dim`` gets the value of its ancestor.
+
+        The segments are read from ``target``'s bounds, so ``self`` only needs to share the bounds down to its
+        own dim.
+        """
+        if target.dim == self.dim:
+            return self.values
+        return np.repeat(self.values, np.diff(target._jnrt._segment_offsets(self.dim, target.dim)))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        if method != "__call__":
+            return NotImplemented
+
+        views = [x for x in inputs + (out or ()) if isinstance(x, RaggedKeyView)]
+        target = max(views, key=lambda v: v.dim)
+        for v in views:
+            target._check_compatible(v, v.dim)
+
+        args = [x._broadcast_to(target) if isinstance(x, RaggedKeyView) else x for x in inputs]
+        if out is not None:
+            for o in out:
+                if isinstance(o, RaggedKeyView) and o.dim != target.dim:
+                    raise ValueError(
+                        f"Output view is at dim {o.dim}, but the operands broadcast to dim {target.dim}."
+                    )
+            kwargs["out"] = tuple(o.values if isinstance(o, RaggedKeyView) else o for o in out)
+
+        result = getattr(ufunc, method)(*args, **kwargs)
+
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(result, tuple):
+            return tuple(self.__class__(target._jnrt, target.dim, r) for r in result)
+        return self.__class__(target._jnrt, target.dim, result)
+
+
+class SharedTensorsHandle:
+    """A picklable handle to the tensors of a ragged tensor collection placed in one shared-memory segment.
+
+    Handles are created by `JointNestedRaggedTensorDict.share_memory`, which copies every ``dim*/*`` array
+    into a single `multiprocessing.shared_memory.SharedMemory` segment at 64-byte-aligned offsets. The handle
+    pickles as just the segment name and the array layout, so it can be passed to worker processes (e.g.,
+    through a DataLoader dataset), each of which calls `attach` to get a collection whose arrays are zero-copy
+    views of the same physical memory.
+
+    Lifecycle is explicit: every process calls `close` once it has dropped the collections it attached, and
+    the creating process (the owner) calls `unlink` once no process needs the segment anymore. Used as a
+    context manager, a handle closes on exit and, in the owner, also unlinks. On Python 3.13+ non-owner
+    attachments are not registered with the resource tracker, so a worker exiting never unlinks the owner's
+    segment; on older versions, processes started via `multiprocessing` share the owner's tracker, so
+    attaching in them is likewise safe.
+
+    Args:
+        name: The name of the shared-memory segment.
+        layout: Maps each tensor key to its ``(dtype string, shape, byte offset)`` within the segment.
+        schema: The schema of the shared collection.
+
+    Examples:
+        >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "val": [[0.5, 1.5, 2.5], [3.5]]})
+        >>> with J.share_memory() as handle:
+        ...     shared = handle.attach()
+        ...     print(shared == J, handle.owner, pickle.loads(pickle.dumps(handle)).owner)
+        ...     del shared
+        True True False
+        >>> handle.attach()
+        Traceback (most recent call last):
+            ...
+        ValueError: Can't attach to shared memory segment ... after the handle has been closed.
+    """
+
+    _ALIGNMENT: int = 64
+
+    def __init__(self, name: str, layout: dict[str, tuple[str, tuple[int, ...], int]], schema: dict):
+        self.name = name
+        self.layout = layout
+        self.schema = schema
+        self.owner = False
+        self._shm: shared_memory.SharedMemory | None = None
+        self._closed = False
+
+    @classmethod
+    def _create(cls, arrays: Iterable[tuple[str, np.ndarray]], schema: dict) -> SharedTensorsHandle:
+        """Copies ``arrays`` into a new shared-memory segment and returns its owning handle."""
+        arrays = list(arrays)
+        layout = {}
+        size = 0
+        for key, T in arrays:
+            size = -(-size // cls._ALIGNMENT) * cls._ALIGNMENT
+            layout[key] = (T.dtype.str, T.shape, size)
+            size += T.nbytes
+        size = -(-size // cls._ALIGNMENT) * cls._ALIGNMENT
+
+        # Zero-size segments are rejected by `SharedMemory`, so always allocate at least one block.
+        shm = shared_memory.SharedMemory(create=True, size=max(size, cls._ALIGNMENT))
+        out = cls(shm.name, layout, schema)
+        out.owner = True
+        out._shm = shm
+        for key, T in arrays:
+            out._view(key)[...] = T
+        return out
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.layout, self.schema))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, keys={sorted(self.layout)}, owner={self.owner})"
+        )
+
+    def __enter__(self) -> SharedTensorsHandle:
+        return self
+
+    def __exit__(self, *exc):
+        if self.owner:
+            self.unlink()
+        self.close()
+
+    def _segment(self) -> shared_memory.SharedMemory:
+        if self._closed:
+            raise ValueError(
+                f"Can't attach to shared memory segment {self.name!r} after the handle has been closed."
+            )
+        if self._shm is None:
+            if sys.version_info >= (3, 13):
+                self._shm = shared_memory.SharedMemory(name=self.name, track=False)
+            else:
+                self._shm = shared_memory.SharedMemory(name=self.name)
+        return self._shm
+
+    def _view(self, key: str) -> np.ndarray:
+        dtype, shape, offset = self.layout[key]
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._segment().buf, offset=offset)
+
+    def attach(self) -> JointNestedRaggedTensorDict:
+        """Returns a collection whose tensors are views of the shared segment, mapping it on first use.
+
+        The returned collection keeps no reference to the handle; keep the handle alive (and un-closed) for
+        as long as the collection is in use.
+        """
+        tensors = {key: self._view(key) for key in self.layout}
+        return JointNestedRaggedTensorDict(processed_tensors=tensors, schema=dict(self.schema))
+
+    def close(self):
+        """Unmaps the segment from this process. Attached collections must be dropped first."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+        self._closed = True
+
+    def unlink(self):
+        """Destroys the segment. Only the owner should call this, once every process is done with it."""
+        if not self.owner:
+            raise ValueError("Only the handle returned by `share_memory` may unlink the segment.")
+        shm = self._shm if self._shm is not None else shared_memory.SharedMemory(name=self.name)
+        shm.unlink()
+        if shm is not self._shm:
+            shm.close()
+        self.owner = False
+
+
+class DenseBufferPool:
+    """A pool of recycled output buffers for `JointNestedRaggedTensorDict.to_dense`.
+
+    Passing a pool as ``to_dense(out=pool)`` makes every dense key and mask a view into a pooled buffer
+    rather than a fresh ``np.zeros`` allocation. Buffers are flat arrays bucketed by dtype and by capacity
+    (rounded up to a power of two, so batches of similar but not identical shapes share buckets), and each
+    remembers the prefix of it that has been handed out since it was last zeroed, so only the part of that
+    prefix a new request covers is re-zeroed before reuse.
+
+    Ownership is explicit: a buffer handed out by `get` (or by ``to_dense``) belongs to the caller until its
+    array is passed back to `release`, or until the `borrowed` block holding it exits, and is never handed
+    out again before that. An array that is never released simply keeps its buffer out of the pool. In a
+    steady-state loop that releases each batch before densifying the next, ``to_dense`` then runs without
+    allocating.
+
+    Attributes:
+        n_allocated: The number of buffers the pool has allocated so far.
+
+    Examples:
+        >>> pool = DenseBufferPool()
+        >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "id": [[[1], [2, 3], []], [[4]]]})
+        >>> for _ in range(5):
+        ...     with pool.borrowed(J.to_dense(out=pool)) as dense:
+        ...         print(dense["id"].tolist())
+        [[[1, 0], [2, 3], [0, 0]], [[4, 0], [0, 0], [0, 0]]]
+        [[[1, 0], [2, 3], [0, 0]], [[4, 0], [0, 0], [0, 0]]]
+        [[[1, 0], [2, 3], [0, 0]], [[4, 0], [0, 0], [0, 0]]]
+        [[[1, 0], [2, 3], [0, 0]], [[4, 0], [0, 0], [0, 0]]]
+        [[[1, 0], [2, 3], [0, 0]], [[4, 0], [0, 0], [0, 0]]]
+
+        Each batch is released before the next is densified, so all five share one set of buffers for the
+        two masks and two keys:
+
+        >>> pool.n_allocated
+        4
+
+        Arrays that have not been released are never handed out again, and released ones are re-zeroed:
+
+        >>> held = pool.get((2, 3), np.int64)
+        >>> held[...] = 7
+        >>> int(pool.get((2, 3), np.int64).sum()), pool.n_allocated
+        (0, 6)
+        >>> pool.release(held)
+        >>> int(pool.get((2, 3), np.int64).sum()), pool.n_allocated
+        (0, 6)
+    """
+
+    _MIN_CAPACITY: int = 64
+
+    def __init__(self):
+        self._free: dict[tuple[str, int], list[list]] = {}
+        self._in_use: dict[int, tuple[np.ndarray, tuple[str, int], list]] = {}
+        self.n_allocated = 0
+
+    def get(self, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Returns a zero-filled array of the given shape and dtype, whose buffer is held until released."""
+        dtype = np.dtype(dtype)
+        n = int(np.prod(shape, dtype=np.int64))
+        capacity = max(self._MIN_CAPACITY, 1 << max(n - 1, 0).bit_length())
+        bucket = (dtype.str, capacity)
+
+        free = self._free.setdefault(bucket, [])
+        if free:
+            entry = free.pop()
+            buf, n_dirty = entry
+            buf[: min(n_dirty, n)] = 0
+            # Anything past ``n`` that an earlier, larger request handed out is still dirty.
+            entry[1] = max(n_dirty, n)
+        else:
+            entry = [np.zeros(capacity, dtype=dtype), n]
+            self.n_allocated += 1
+
+        arr = entry[0][:n].reshape(shape)
+        # The array itself is kept, so its ``id`` cannot be reused by another object until it is released.
+        self._in_use[id(arr)] = (arr, bucket, entry)
+        return arr
+
+    def release(self, arrays: np.ndarray | dict[str, np.ndarray]):
+        """Returns the buffers behind ``arrays`` to the pool for reuse.
+
+        Args:
+            arrays: An array returned by `get`, or a whole ``to_dense(out=pool)`` output. Arrays the pool did
+                not hand out (e.g., the dim-0 keys of a ``to_dense`` output) or that were already released
+                are ignored. Neither the released arrays nor anything derived from them (views, slices or
+                ``torch.from_numpy`` tensors) may be used afterwards, as the pool will overwrite them.
+        """
+        for arr in arrays.values() if isinstance(arrays, dict) else [arrays]:
+            held = self._in_use.pop(id(arr), None)
+            if held is not None:
+                _, bucket, entry = held
+                self._free[bucket].append(entry)
+
+    @contextmanager
+    def borrowed(self, arrays: np.ndarray | dict[str, np.ndarray]):
+        """Yields ``arrays`` (as for `release`) and releases them when the block exits, even on error."""
+        try:
+            yield arrays
+        finally:
+            self.release(arrays)
+
+    def clear(self):
+        """Drops all pooled buffers, free or held; arrays already handed out stay valid."""
+        self._free.clear()
+        self._in_use.clear()
+
+
+def _file_identity(fp: Path) -> tuple[Path, int, int]:
+    """Identifies the current contents of the file at ``fp`` by its path, modification time and size."""
+    stat = fp.stat()
+    return (fp, stat.st_mtime_ns, stat.st_size)
+
+
+class RowCache:
+    """A thread-safe, byte-bounded LRU cache of rows read from disk-backed `JointNestedRaggedTensorDict`s.
+
+    Passing a cache as ``JointNestedRaggedTensorDict(tensors_fp=..., row_cache=cache)`` makes indexing that
+    instance with an `int` or a `tuple` (e.g., ``J[i]`` or ``J[i, :5]``) return the cached result when the
+    same index of the same file (and the same loaded subset of keys) was read before, instead of reading the
+    bounds and values again. One cache can be shared by any number of instances and threads. When the total
+    size of the cached arrays would exceed ``max_bytes``, the least recently used entries are evicted; a
+    result larger than the whole budget is returned but not cached.
+
+    Cached entries are tied to the identity of the file they were read from (its path, modification time and
+    size, checked on every lookup), so when a file is rewritten, its entries are dropped rather than served.
+    Every lookup returns a new collection, so callers may e.g. add or replace its tensors without affecting
+    other callers, but the arrays themselves are shared with the cache and so are made read-only.
+
+    Args:
+        max_bytes: The byte budget for the cached arrays.
+
+    Attributes:
+        max_bytes: The byte budget for the cached arrays.
+        n_bytes: The total size of the cached arrays.
+        hits: The number of lookups that found their entry.
+        misses: The number of lookups that did not.
+        evictions: The number of entries evicted to stay within the budget.
+
+    Raises:
+        ValueError: If ``max_bytes`` is not a non-negative integer.
+
+    Examples:
+        >>> import tempfile
+        >>> cache = RowCache(max_bytes=1 << 20)
+        >>> with tempfile.TemporaryDirectory() as dirpath:
+        ...     fp = Path(dirpath) / "tensors.nrt"
+        ...     JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4, 5], [6]]}).save(fp)
+        ...     J = JointNestedRaggedTensorDict(tensors_fp=fp, row_cache=cache)
+        ...     first, again, other = J[1], J[-2], J[0]
+        ...     print(again == first, again is first, again.to_dense()["T"])
+        ...     print(len(cache), cache.hits, cache.misses)
+        True False [4 5]
+        2 1 2
+        >>> first.tensors["dim0/T"][0] = 7
+        Traceback (most recent call last):
+            ...
+        ValueError: assignment destination is read-only
+        >>> RowCache(max_bytes=-1)
+        Traceback (most recent call last):
+            ...
+        ValueError: max_bytes must be a non-negative integer; got -1
+    """
+
+    def __init__(self, max_bytes: int):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError(f"max_bytes must be a non-negative integer; got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[JointNestedRaggedTensorDict, int]] = OrderedDict()
+        self._identities: dict[Path, tuple[Path, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Locks cannot be pickled; a pickled cache (e.g., one sent to a worker process) arrives empty.
+        return (self.__class__, (self.max_bytes,))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_bytes={self.max_bytes}, n_bytes={self.n_bytes}, "
+            f"n_entries={len(self)}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def _check_identity(self, identity: tuple[Path, int, int]):
+        """Drops the entries of ``identity``'s path if they were read from a different version of the file."""
+        fp = identity[0]
+        if self._identities.get(fp, identity) != identity:
+            for key in [k for k in self._entries if k[0][0] == fp]:
+                self.n_bytes -= self._entries.pop(key)[1]
+        self._identities[fp] = identity
+
+    def get(self, identity: tuple[Path, int, int], key: tuple) -> JointNestedRaggedTensorDict | None:
+        """Returns the entry for ``key`` read from the file version ``identity``, or ``None``."""
+        with self._lock:
+            self._check_identity(identity)
+            entry = self._entries.get((identity, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((identity, key))
+            self.hits += 1
+            return self._share(entry[0])
+
+    @staticmethod
+    def _share(value: JointNestedRaggedTensorDict) -> JointNestedRaggedTensorDict:
+        """Returns a new collection over the arrays of ``value``."""
+        return value.__class__(processed_tensors=dict(value.tensors), schema=dict(value.schema))
+
+    def put(self, identity: tuple[Path, int, int], key: tuple, value: JointNestedRaggedTensorDict):
+        """Caches ``value``'s arrays (making them read-only), evicting least recently used entries as needed.
+
+        The cache keeps its own collection over the arrays, so ``value`` remains the caller's own.
+        """
+        for T in value.tensors.values():
+            T.flags.writeable = False
+        n_bytes = sum(T.nbytes for T in value.tensors.values())
+        with self._lock:
+            self._check_identity(identity)
+            if n_bytes > self.max_bytes or (identity, key) in self._entries:
+                return
+            self._entries[identity, key] = (self._share(value), n_bytes)
+            self.n_bytes += n_bytes
+            while self.n_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.n_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self):
+        """Drops all entries; the hit, miss and eviction counts are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._identities.clear()
+            self.n_bytes = 0
+
+
+# Thread pools for `JointNestedRaggedTensorDict(read_workers=...)` ("nrt-read") and for its async methods
+# ("nrt-async"), shared across instances with the same worker count, and the per-thread archive handles the
+# read threads read through. The two kinds of pool are kept apart so that an async call waiting on pooled
+# reads can never hold the worker those reads need. A safetensors handle is never shared across threads; each
+# read thread opens its own, keyed by the archive's file identity (path, modification time and size) so that
+# a rewritten file is reopened rather than read through a stale mapping.
+_THREAD_POOLS: dict[tuple[str, int], ThreadPoolExecutor] = {}
+_THREAD_POOLS_LOCK = threading.Lock()
+_THREAD_ARCHIVES = threading.local()
+
+
+def _reset_thread_pools_after_fork():
+    """Forgets the parent's pools, lock and handles in a forked child, whose copies of them are unusable.
+
+    A forked child inherits none of the parent's threads, so a pool created before the fork would accept work
+    that no thread ever runs, and the lock may have been copied while held. Any pool is recreated on first use
+    in the child.
+    """
+    global _THREAD_POOLS, _THREAD_POOLS_LOCK, _THREAD_ARCHIVES
+    _THREAD_POOLS = {}
+    _THREAD_POOLS_LOCK = threading.Lock()
+    _THREAD_ARCHIVES = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_pools_after_fork)
+
+
+def _thread_pool(name: str, n_workers: int) -> ThreadPoolExecutor:
+    with _THREAD_POOLS_LOCK:
+        if (name, n_workers) not in _THREAD_POOLS:
+            _THREAD_POOLS[name, n_workers] = ThreadPoolExecutor(n_workers, thread_name_prefix=name)
+        return _THREAD_POOLS[name, n_workers]
+
+
+# The number of archive handles each read thread keeps open. Beyond it, the least recently used handle is
+# closed, so that a thread reading many files (e.g., the shards of a dataset) holds a bounded number of open
+# files and mappings, and does not keep deleted files alive on disk.
+_THREAD_ARCHIVES_PER_THREAD = 8
+
+
+def _thread_archive(identity: tuple[Path, int, int]):
+    handles = _THREAD_ARCHIVES.__dict__.setdefault("handles", OrderedDict())
+    if identity in handles:
+        handles.move_to_end(identity)
+        return handles[identity]
+    stale = [k for k in handles if k[0] == identity[0]]
+    while len(handles) - len(stale) >= _THREAD_ARCHIVES_PER_THREAD:
+        stale.append(next(k for k in handles if k not in stale))
+    for k in stale:
+        handles.pop(k).__exit__(None, None, None)
+    handles[identity] = safe_open(identity[0], framework="np")
+    return handles[identity]
+
+
 class JointNestedRaggedTensorDict:
     """Stores tensors internally in the following dictionary structure:
     {
@@ -163,6 +858,10 @@ class JointNestedRaggedTensorDict:
         tensors_fp: Path | None = None,
         schema: dict[str, np.dtype] | None = None,
         keys: Iterable[str] | None = None,
+        coalesce_gap: int = 0,
+        read_workers: int = 0,
+        max_async_reads: int = 8,
+        row_cache: RowCache | None = None,
     ):
         """Initializes JointNestedRaggedTensorDict with the given tensors.
 
@@ -180,6 +879,20 @@ class JointNestedRaggedTensorDict:
                 the required ``dim*/bounds``). Operations that reference a non-selected key
                 raise ``KeyError``. ``keys`` must be a non-empty iterable of strings; passing a
                 bare ``str``/``bytes`` raises ``TypeError``.
+            coalesce_gap: When indexing a disk-backed instance with an integer array, the requested dim-0
+                rows are sorted and any two whose gap is at most this many rows are fetched with the same
+                read, so that nearby rows cost one read per tensor rather than one each. Larger values trade
+                reading (and discarding) the rows in between for fewer reads. Must be non-negative.
+            read_workers: If positive, the reads a disk-backed instance issues for one slice (one per stored
+                tensor) or for one integer-array index (one per tensor per run of rows) are spread over a
+                shared pool of this many threads, so that they can overlap on storage that serves concurrent
+                requests well. Each thread reads through its own archive handle, and results are identical to
+                serial reads. ``0`` (the default) reads serially.
+            max_async_reads: The maximum number of reads issued through the async methods (`aget`,
+                `agather_dense` and `aiter_batches`) that run at once per event loop; further calls wait.
+            row_cache: A `RowCache` in which the results of indexing this instance with an `int` or a `tuple`
+                are kept, so that repeated reads of the same rows are served from memory. Only valid when
+                ``tensors_fp`` is provided; may be shared between instances and threads.
 
         Examples:
             >>> import tempfile
@@ -353,9 +1066,22 @@ class JointNestedRaggedTensorDict:
 
         if keys is not None and tensors_fp is None:
             raise ValueError("`keys` may only be specified alongside `tensors_fp`.")
+        if row_cache is not None and tensors_fp is None:
+            raise ValueError("`row_cache` may only be specified alongside `tensors_fp`.")
+        if not isinstance(coalesce_gap, int) or coalesce_gap < 0:
+            raise ValueError(f"coalesce_gap must be a non-negative integer; got {coalesce_gap}")
+        if not isinstance(read_workers, int) or read_workers < 0:
+            raise ValueError(f"read_workers must be a non-negative integer; got {read_workers}")
+        if not isinstance(max_async_reads, int) or max_async_reads <= 0:
+            raise ValueError(f"max_async_reads must be a positive integer; got {max_async_reads}")
 
         self._subset_keys: list[str] | None = None
+        self._tensors_fp: Path | None = None
         self._schema = schema if schema is not None else {}
+        self._coalesce_gap = coalesce_gap
+        self._read_workers = read_workers
+        self._max_async_reads = max_async_reads
+        self._row_cache = row_cache
         if raw_tensors is not None:
             self._initialize_tensors(raw_tensors)
         elif processed_tensors is not None:
@@ -520,6 +1246,135 @@ class JointNestedRaggedTensorDict:
     def __str__(self) -> str:
         return self.__repr__()
 
+    _PICKLED_DISK_CACHES: tuple[str, ...] = ("_tensor_keys", "_cached_len", "_cached_row_groups")
+
+    def __reduce_ex__(self, protocol: int):
+        """Pickles in-memory tensors as out-of-band buffers and disk-backed instances as their path.
+
+        With pickle protocol 5 or above, each in-memory array is exposed as a `pickle.PickleBuffer`, so a
+        ``buffer_callback`` (e.g., a shared-memory or zero-copy transport) receives the raw array memory
+        without it being copied into the pickle stream. Instances whose tensors have not been loaded from
+        ``tensors_fp`` pickle as just their constructor arguments and the cached archive metadata, so their
+        pickles stay small no matter how large the archive is, and are rebuilt through `__init__`.
+
+        Examples:
+            >>> import pickle, tempfile
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "val": [[0.5, 1.5, 2.5], [3.5]]})
+            >>> buffers = []
+            >>> payload = pickle.dumps(J, protocol=5, buffer_callback=buffers.append)
+            >>> len(buffers)
+            3
+            >>> J2 = pickle.loads(payload, buffers=buffers)
+            >>> J2 == J, J2.schema == J.schema
+            (True, True)
+            >>> pickle.loads(pickle.dumps(J, protocol=4)) == J
+            True
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, keys={"T"})
+            ...     _ = len(J_disk)
+            ...     J_disk2 = pickle.loads(pickle.dumps(J_disk, protocol=5))
+            ...     (J_disk2._tensors, J_disk2.keys(), len(J_disk2), J_disk2 == J_disk)
+            (None, {'T'}, 2, True)
+        """
+        if self._tensors is None:
+            caches = {k: self.__dict__[k] for k in self._PICKLED_DISK_CACHES if k in self.__dict__}
+            keys = None
+            if self._subset_keys is not None:
+                keys = sorted({k.split("/", 1)[1] for k in self._subset_keys} - {"bounds"})
+            state = (
+                self._tensors_fp,
+                keys,
+                dict(self._schema),
+                caches,
+                self._coalesce_gap,
+                self._read_workers,
+                self._max_async_reads,
+                self._row_cache,
+            )
+            return (self.__class__._unpickle_from_disk, state)
+
+        if protocol >= 5:
+            tensors = {}
+            for k, T in self._tensors.items():
+                if T.dtype.hasobject:
+                    tensors[k] = T
+                    continue
+                T = np.ascontiguousarray(T)
+                tensors[k] = (T.dtype.str, T.shape, pickle.PickleBuffer(T))
+        else:
+            tensors = dict(self._tensors)
+        return (self.__class__._unpickle_in_memory, (tensors, dict(self._schema)))
+
+    @classmethod
+    def _unpickle_in_memory(cls, tensors: dict, schema: dict) -> JointNestedRaggedTensorDict:
+        """Rebuilds an in-memory instance pickled by `__reduce_ex__`."""
+        arrays = {}
+        for k, T in tensors.items():
+            if isinstance(T, tuple):
+                dtype, shape, buf = T
+                T = np.frombuffer(buf, dtype=dtype).reshape(shape)
+            arrays[k] = T
+        return cls(processed_tensors=arrays, schema=schema)
+
+    @classmethod
+    def _unpickle_from_disk(
+        cls,
+        tensors_fp: Path,
+        keys: list[str] | None,
+        schema: dict,
+        caches: dict,
+        coalesce_gap: int = 0,
+        read_workers: int = 0,
+        max_async_reads: int = 8,
+        row_cache: RowCache | None = None,
+    ) -> JointNestedRaggedTensorDict:
+        """Rebuilds a disk-backed instance pickled by `__reduce_ex__`.
+
+        The instance is constructed through `__init__`, so it has every attribute a new instance has; only the
+        archive header is read (to resolve ``keys``), and the cached archive metadata is restored as pickled.
+        """
+        out = cls(
+            tensors_fp=tensors_fp,
+            schema=schema,
+            keys=keys,
+            coalesce_gap=coalesce_gap,
+            read_workers=read_workers,
+            max_async_reads=max_async_reads,
+            row_cache=row_cache,
+        )
+        out.__dict__.update(caches)
+        return out
+
+    def share_memory(self) -> SharedTensorsHandle:
+        """Copies all tensors into one shared-memory segment and returns the owning handle.
+
+        Pass the returned `SharedTensorsHandle` (not this collection) to worker processes and call
+        `SharedTensorsHandle.attach` there, so that every process reads the same physical copy of the data
+        rather than loading its own or duplicating pages through copy-on-write. Disk-backed instances are
+        copied key by key straight from the archive, without materializing `tensors` first.
+
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "id": [[[1], [2, 3], []], [[4]]]})
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     with J_disk.share_memory() as handle:
+            ...         shared = handle.attach()
+            ...         print(J_disk._tensors, shared == J, sorted(handle.layout))
+            ...         del shared
+            None True ['dim1/T', 'dim1/bounds', 'dim2/bounds', 'dim2/id']
+        """
+        schema = dict(self.schema)
+        with self._archive_ctx() as archive:
+            if archive is None:
+                return SharedTensorsHandle._create(self.tensors.items(), schema)
+            keys = sorted(self._tensor_keys)
+            return SharedTensorsHandle._create(((k, archive.get_tensor(k)) for k in keys), schema)
+
     @property
     def schema(self) -> dict[str, np.dtype]:
         if not self._schema:
@@ -625,6 +1480,38 @@ class JointNestedRaggedTensorDict:
             with safe_open(self._tensors_fp, framework="np") as f:
                 yield f.get_slice(key)
 
+    def _read_tensors(self, reads: list[tuple[str, Callable]], archive=None) -> list[np.ndarray]:
+        """Returns ``[fn(T) for key, fn in reads]``, where ``T`` is the tensor (or archive slice) at ``key``.
+
+        With ``read_workers`` set on a disk-backed instance, the reads run concurrently on the shared read
+        pool, each through its worker thread's own archive handle; results are in ``reads`` order either way.
+
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "val": [[0.5, 1.5, 2.5], [3.5]]})
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, read_workers=2)
+            ...     J_disk._read_tensors([("dim1/val", lambda T: T[1:3]), ("dim1/T", lambda T: T[0:2])])
+            [array([1.5, 2.5], dtype=float32), array([1, 2], dtype=uint8)]
+        """
+        if self._read_workers == 0 or self._tensors is not None or len(reads) < 2:
+            out = []
+            for key, fn in reads:
+                with self._tensor_at_key(key, archive=archive) as T:
+                    out.append(fn(T))
+            return out
+
+        identity = _file_identity(self._tensors_fp)
+
+        def run(read: tuple[str, Callable]) -> np.ndarray:
+            key, fn = read
+            with self._tensor_at_key(key, archive=_thread_archive(identity)) as T:
+                return fn(T)
+
+        return list(_thread_pool("nrt-read", self._read_workers).map(run, reads))
+
     @classmethod
     def _get_lengths_and_values(
         cls, T: NESTED_NUM_LIST_T, curr_lengths: list[list[int]] = None
@@ -940,11 +1827,25 @@ class JointNestedRaggedTensorDict:
 
             self._tensors[f"{dim_str}/{k}"] = np.array(flat_vals, dtype=self._schema[k])
 
-    def save(self, fp: Path):
+    def save(
+        self,
+        fp: Path,
+        row_group_size: int | None = None,
+        bitset_keys: Iterable[str] | None = None,
+        bitset_n_bits: int = 1024,
+    ):
         """Saves the tensor to a file. See `JointNestedRaggedTensorDict.load` for examples.
 
         Args:
             fp: The path to which the tensors will be saved.
+            row_group_size: If set, dim-0 rows are partitioned into contiguous groups of this many rows and
+                the per-group ``[min, max]`` of every key is stored as a zone map in the safetensors header
+                metadata. `filter_rows` uses these zone maps to skip groups that cannot match a predicate
+                without reading their values. The tensors themselves are stored exactly as without row
+                groups, as rows are already contiguous on disk.
+            bitset_keys: Integer-valued keys (e.g., codes) for which to additionally store a per-group
+                bloom-style membership bitset, used by `AnyIn` predicates. Only valid with ``row_group_size``.
+            bitset_n_bits: The number of bits in each membership bitset. Must be a positive multiple of 8.
 
         Examples:
             >>> import tempfile
@@ -966,35 +1867,266 @@ class JointNestedRaggedTensorDict:
             Traceback (most recent call last):
                 ...
             ValueError: Already saved to .../tensors.nrt!
+
+            Saving with ``row_group_size`` stores zone maps for predicate pushdown; the stored tensors are
+            unchanged:
+
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp, row_group_size=1, bitset_keys=["id"])
+            ...     J2 = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     assert J == J2
+            ...     J2.row_groups
+            [(0, 1), (1, 2)]
+            >>> J.save("unused.nrt", bitset_keys=["id"])
+            Traceback (most recent call last):
+                ...
+            ValueError: `bitset_keys` may only be specified alongside `row_group_size`.
         """
         if self._tensors is None:
             raise ValueError(f"Already saved to {self._tensors_fp}!")
-        save_file(self.tensors, fp)
+        if row_group_size is None:
+            if bitset_keys is not None:
+                raise ValueError("`bitset_keys` may only be specified alongside `row_group_size`.")
+            save_file(self.tensors, fp)
+            return
 
-    @property
-    def max_n_dims(self) -> int:
-        """Returns the maximum number of dimensions of any tensor in the dictionary.
+        row_groups = self._build_row_group_metadata(row_group_size, bitset_keys, bitset_n_bits)
+        save_file(self.tensors, fp, metadata={ROW_GROUPS_METADATA_KEY: json.dumps(row_groups)})
+
+    def _build_row_group_metadata(
+        self, row_group_size: int, bitset_keys: Iterable[str] | None, bitset_n_bits: int
+    ) -> dict:
+        """Computes the per-row-group zone maps (and optional membership bitsets) stored by `save`.
+
+        Each group records, for every key, the ``[min, max]`` of the key's flat values across all the group's
+        rows (ignoring NaNs), or `None` if the group holds no such values. Bitsets are stored as the hex of
+        the packed bits, with bit ``v % bitset_n_bits`` set for every value ``v`` in the group.
 
         Examples:
             >>> J = JointNestedRaggedTensorDict({
-            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
-            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
-            ...     "val": [[[1, 0.2, 0], [3.1, 0], [1, 2.2]], [[3], [3.3, 2, 0]]],
+            ...     "T":  [[1, 2, 3], [4, 5], [6]],
+            ...     "id": [[[1, 2], [3], []], [[9], [8, 7]], [[]]],
             ... })
-            >>> J.max_n_dims
-            3
+            >>> meta = J._build_row_group_metadata(2, ["id"], 8)
+            >>> meta["bitset_n_bits"], [(g["start"], g["stop"]) for g in meta["groups"]]
+            (8, [(0, 2), (2, 3)])
+            >>> meta["groups"][0]["stats"], meta["groups"][1]["stats"]
+            ({'T': [1, 5], 'id': [1, 9]}, {'T': [6, 6], 'id': None})
+            >>> meta["groups"][0]["bitsets"]
+            {'id': 'f1'}
+            >>> J._build_row_group_metadata(0, None, 8)
+            Traceback (most recent call last):
+                ...
+            ValueError: `row_group_size` must be a positive int; got 0
+            >>> J._build_row_group_metadata(2, ["id"], 12)
+            Traceback (most recent call last):
+                ...
+            ValueError: `bitset_n_bits` must be a positive multiple of 8; got 12
+            >>> J._build_row_group_metadata(2, ["foo"], 8)
+            Traceback (most recent call last):
+                ...
+            KeyError: "Bitset keys ['foo'] not found in 'T', 'id'"
+            >>> JointNestedRaggedTensorDict({"v": [[0.5], [1.5]]})._build_row_group_metadata(2, ["v"], 8)
+            Traceback (most recent call last):
+                ...
+            ValueError: Membership bitsets require integer-valued keys; 'v' has dtype float32
         """
-        return max(int(k.split("/")[0][3:]) for k in self._tensor_keys) + 1
+        if not isinstance(row_group_size, int) or row_group_size < 1:
+            raise ValueError(f"`row_group_size` must be a positive int; got {row_group_size}")
+        if bitset_n_bits < 8 or bitset_n_bits % 8 != 0:
+            raise ValueError(f"`bitset_n_bits` must be a positive multiple of 8; got {bitset_n_bits}")
 
-    @property
-    def min_n_dims(self) -> int:
-        """Returns the minimum number of dimensions of any tensor in the dictionary.
+        bitset_keys = set(bitset_keys) if bitset_keys is not None else set()
+        missing = bitset_keys - self.keys()
+        if missing:
+            keys = "', '".join(sorted(self.keys()))
+            raise KeyError(f"Bitset keys {sorted(missing)} not found in '{keys}'")
 
-        Examples:
-            >>> J = JointNestedRaggedTensorDict({
-            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
-            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
-            ...     "val": [[[1, 0.2, 0], [3.1, 0], [1, 2.2]], [[3], [3.3, 2, 0]]],
+        n = len(self)
+        starts = range(0, n, row_group_size)
+        groups = [
+            {"start": st, "stop": min(st + row_group_size, n), "stats": {}, "bitsets": {}} for st in starts
+        ]
+
+        for key in sorted(self.keys()):
+            dim = self._get_dim(key)
+            vals = self.tensors[f"dim{dim}/{key}"]
+            if key in bitset_keys and vals.dtype.kind not in "iub":
+                raise ValueError(
+                    f"Membership bitsets require integer-valued keys; '{key}' has dtype {vals.dtype}"
+                )
+            offsets = self._segment_offsets(0, dim)
+            for group in groups:
+                group_vals = vals[offsets[group["start"]] : offsets[group["stop"]]]
+                if vals.dtype.kind == "f":
+                    group_vals = group_vals[~np.isnan(group_vals)]
+                if len(group_vals) == 0:
+                    group["stats"][key] = None
+                else:
+                    group["stats"][key] = [group_vals.min().item(), group_vals.max().item()]
+                if key in bitset_keys:
+                    bits = np.zeros(bitset_n_bits, dtype=bool)
+                    bits[group_vals.astype(np.int64) % bitset_n_bits] = True
+                    group["bitsets"][key] = np.packbits(bits).tobytes().hex()
+
+        return {"row_group_size": row_group_size, "bitset_n_bits": bitset_n_bits, "groups": groups}
+
+    def _row_group_metadata(self, archive=None) -> dict | None:
+        """Returns the row-group zone maps stored in the backing archive, or `None` if there are none.
+
+        The parsed metadata is cached on the instance. In-memory instances never have row groups.
+        """
+        if "_cached_row_groups" not in self.__dict__:
+            raw = None
+            if self._tensors_fp is not None:
+                if archive is not None:
+                    raw = archive.metadata()
+                else:
+                    with safe_open(self._tensors_fp, framework="np") as f:
+                        raw = f.metadata()
+            if raw and ROW_GROUPS_METADATA_KEY in raw:
+                self.__dict__["_cached_row_groups"] = json.loads(raw[ROW_GROUPS_METADATA_KEY])
+            else:
+                self.__dict__["_cached_row_groups"] = None
+        return self.__dict__["_cached_row_groups"]
+
+    @property
+    def row_groups(self) -> list[tuple[int, int]] | None:
+        """The ``(start, stop)`` dim-0 row ranges of the archive's row groups, or `None` if there are none.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4, 5], [6]]})
+            >>> print(J.row_groups)
+            None
+        """
+        meta = self._row_group_metadata()
+        if meta is None:
+            return None
+        return [(g["start"], g["stop"]) for g in meta["groups"]]
+
+    def filter_rows(self, predicate: RowPredicate | Sequence[RowPredicate]) -> np.ndarray:
+        """Returns the dim-0 indices of the rows matching ``predicate``.
+
+        A row matches a `RowPredicate` if any of its elements at the predicate's key satisfies it; a sequence
+        of predicates matches the rows that match all of them. Only the predicates' keys (and the bounds
+        needed to attribute their values to rows) are read. If this instance is backed by an archive saved
+        with ``row_group_size``, row groups whose zone maps rule out a match are skipped without reading any
+        of their values, so selective queries only touch the candidate groups. Use ``J[J.filter_rows(...)]``
+        to materialize the matching rows.
+
+        Args:
+            predicate: The predicate, or sequence of predicates, to filter by.
+
+        Raises:
+            ValueError: If ``predicate`` is an empty sequence.
+            KeyError: If a predicate references a key that is not present.
+
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[1, 2, 3],           [4, 5],          [6],    [7, 8]],
+            ...     "code": [[[1, 2], [3], [4]], [[9], [8, 7]], [[5]], [[2], [2, 1]]],
+            ... })
+            >>> J.filter_rows(AnyInRange("T", lo=5, hi=6))
+            array([1, 2])
+            >>> J.filter_rows([AnyIn("code", [2, 9]), AnyInRange("T", hi=4)])
+            array([0, 1])
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp, row_group_size=2, bitset_keys=["code"])
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     J_disk.filter_rows(AnyIn("code", [5]))
+            array([2])
+            >>> J.filter_rows(AnyIn("code", [100]))
+            array([], dtype=int64)
+            >>> J.filter_rows([])
+            Traceback (most recent call last):
+                ...
+            ValueError: `predicate` must be a RowPredicate or a non-empty sequence of them.
+            >>> J.filter_rows(AnyIn("foo", [1]))
+            Traceback (most recent call last):
+                ...
+            KeyError: "Predicate keys ['foo'] not found in 'T', 'code'"
+        """
+        if isinstance(predicate, RowPredicate):
+            predicates = [predicate]
+        else:
+            predicates = list(predicate)
+        if not predicates or not all(isinstance(p, RowPredicate) for p in predicates):
+            raise ValueError("`predicate` must be a RowPredicate or a non-empty sequence of them.")
+
+        pred_keys = {p.key for p in predicates}
+        missing = pred_keys - self.keys()
+        if missing:
+            keys = "', '".join(sorted(self.keys()))
+            raise KeyError(f"Predicate keys {sorted(missing)} not found in '{keys}'")
+
+        max_pred_dim = max(self._get_dim(k) for k in pred_keys)
+
+        matches = []
+        with self._archive_ctx() as archive:
+            meta = self._row_group_metadata(archive=archive)
+            if meta is None:
+                groups = [{"start": 0, "stop": len(self), "stats": None, "bitsets": {}}]
+            else:
+                groups = meta["groups"]
+
+            for group in groups:
+                if group["stats"] is not None:
+                    bitsets = {
+                        k: np.unpackbits(np.frombuffer(bytes.fromhex(v), dtype=np.uint8)).astype(bool)
+                        for k, v in group["bitsets"].items()
+                    }
+                    if not all(p.may_match(group["stats"][p.key], bitsets.get(p.key)) for p in predicates):
+                        continue
+
+                st, end = group["start"], group["stop"]
+                indices = self._get_slice_indices_internal(slice(st, end), 0, {}, archive=archive)
+                indices = {
+                    k: S
+                    for k, S in indices.items()
+                    if k.split("/")[1] in pred_keys
+                    or (k.endswith("/bounds") and self._get_dim_from_key_str(k) <= max_pred_dim)
+                }
+                rows = self._slice_single(indices, archive=archive)
+
+                row_mask = np.ones(end - st, dtype=bool)
+                for p in predicates:
+                    dim = self._get_dim(p.key)
+                    hits = np.concatenate([[0], np.cumsum(p.element_mask(rows.tensors[f"dim{dim}/{p.key}"]))])
+                    offsets = rows._segment_offsets(0, dim)
+                    row_mask &= (hits[offsets[1:]] - hits[offsets[:-1]]) > 0
+                matches.append(st + np.flatnonzero(row_mask))
+
+        if not matches:
+            return np.array([], dtype=np.int64)
+        return np.concatenate(matches)
+
+    @property
+    def max_n_dims(self) -> int:
+        """Returns the maximum number of dimensions of any tensor in the dictionary.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ...     "val": [[[1, 0.2, 0], [3.1, 0], [1, 2.2]], [[3], [3.3, 2, 0]]],
+            ... })
+            >>> J.max_n_dims
+            3
+        """
+        return max(int(k.split("/")[0][3:]) for k in self._tensor_keys) + 1
+
+    @property
+    def min_n_dims(self) -> int:
+        """Returns the minimum number of dimensions of any tensor in the dictionary.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ...     "val": [[[1, 0.2, 0], [3.1, 0], [1, 2.2]], [[3], [3.3, 2, 0]]],
             ... })
             >>> J.min_n_dims
             2
@@ -1066,6 +2198,56 @@ class JointNestedRaggedTensorDict:
         keys = "', '".join(sorted(self.keys()))
         raise KeyError(f"Key '{key}' not found in '{keys}'")
 
+    def _segment_offsets(self, from_dim: int, to_dim: int) -> np.ndarray:
+        """Returns the flat offsets at ``to_dim`` of the segments owned by each element at ``from_dim``.
+
+        The result has one more entry than there are elements at ``from_dim``; the elements at ``to_dim``
+        that descend from element ``i`` at ``from_dim`` are ``offsets[i]:offsets[i + 1]``. It is computed by
+        composing the ``dim*/bounds`` arrays between the two dims, without any Python-level loop over
+        elements.
+
+        Args:
+            from_dim: The outer dimension whose elements define the segments.
+            to_dim: The inner dimension into which the offsets index. Must be ``>= from_dim``.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ... })
+            >>> J._segment_offsets(0, 1)
+            array([0, 3, 5])
+            >>> J._segment_offsets(1, 2)
+            array([ 0,  3,  5,  7,  8, 11])
+            >>> J._segment_offsets(0, 2)
+            array([ 0,  7, 11])
+            >>> J._segment_offsets(1, 1)
+            array([0, 1, 2, 3, 4, 5])
+        """
+        if from_dim == 0:
+            n = len(self)
+        else:
+            B = self.tensors[f"dim{from_dim}/bounds"]
+            n = int(B[-1]) if len(B) else 0
+
+        offsets = np.arange(n + 1)
+        for dim in range(from_dim + 1, to_dim + 1):
+            offsets = np.concatenate([[0], self.tensors[f"dim{dim}/bounds"]])[offsets]
+        return offsets
+
+    def _n_elements_at_dim(self, dim: int) -> int:
+        """Returns the total number of elements stored at ``dim``.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ... })
+            >>> J._n_elements_at_dim(0), J._n_elements_at_dim(1), J._n_elements_at_dim(2)
+            (2, 5, 11)
+        """
+        return len(self) if dim == 0 else int(self._segment_offsets(dim - 1, dim)[-1])
+
     def keys_at_dim(self, dim: int) -> set[str]:
         """Returns the keys for tensors that are at that dimensionality.
 
@@ -1082,6 +2264,112 @@ class JointNestedRaggedTensorDict:
         """
         return {k for k in self.keys() if self._get_dim(k) == dim}
 
+    def key_view(self, key: str) -> RaggedKeyView:
+        """Returns a `RaggedKeyView` over the flat values of ``key`` for elementwise numpy operations.
+
+        The view wraps the stored buffer itself (no copy), so in-place operations on it (``out=``, ``+=``)
+        modify this collection. See `RaggedKeyView` for the broadcasting rules.
+
+        Args:
+            key: The user-level key to view.
+
+        Raises:
+            KeyError: If ``key`` is not in this collection.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "code": [[1, 2, 1], [2, 2]],
+            ...     "val":  [[1.0, 4.0, 3.0], [1.0, 2.0]],
+            ... })
+            >>> mean, std = np.array([0.0, 2.0, 1.0]), np.array([1.0, 1.0, 2.0])
+            >>> val, code = J.key_view("val"), J.key_view("code")
+            >>> (val - mean[code]) / std[code]
+            RaggedKeyView(dim=1, values=array([-1. ,  1.5,  1. ,  0. ,  0.5]))
+            >>> J.key_view("missing")
+            Traceback (most recent call last):
+                ...
+            KeyError: "Key 'missing' not found in 'code', 'val'"
+        """
+        dim = self._get_dim(key)
+        return RaggedKeyView(self, dim, self.tensors[f"dim{dim}/{key}"])
+
+    def assign(self, **kwargs: RaggedKeyView | np.ndarray) -> JointNestedRaggedTensorDict:
+        """Returns a new collection with the given keys' values replaced or added.
+
+        All other tensors, including every ``dim*/bounds`` array, are shared with this collection rather than
+        copied.
+
+        Args:
+            **kwargs: A mapping from user-level keys to their new values. A `RaggedKeyView` (e.g., the result
+                of an arithmetic expression over views) is stored at the view's dim, and may introduce a new
+                key. A plain array replaces the flat values of an existing key at that key's dim.
+
+        Raises:
+            ValueError: If a key is a reserved meta-name (``bounds`` or ``mask``), a view's structure doesn't
+                match this collection, or the length of new values does not match the number of elements at
+                their dim.
+            KeyError: If a plain array is given for a key that does not exist.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "val": [[[1, 0.2, 0], [3.1, 0], [1, 2.2]], [[3], [3.3, 2, 0]]],
+            ... })
+            >>> val = J.key_view("val")
+            >>> J2 = J.assign(val=val - val.values.mean(), T_scaled=J.key_view("T") / 10)
+            >>> J2.to_dense()["T_scaled"]
+            array([[0.1, 0.2, 0.3],
+                   [0.4, 0.5, 0. ]])
+            >>> J2.tensors["dim2/bounds"] is J.tensors["dim2/bounds"]
+            True
+            >>> J.assign(T=np.array([7, 8, 9, 10, 11])).to_dense()["T"]
+            array([[ 7,  8,  9],
+                   [10, 11,  0]])
+            >>> J.assign(T=np.array([1, 2]))
+            Traceback (most recent call last):
+                ...
+            ValueError: Got 2 values for key 'T', but there are 5 elements at dim 1.
+            >>> J.assign(id=np.array([1, 2]))
+            Traceback (most recent call last):
+                ...
+            KeyError: "Key 'id' not found in 'T', 'val'"
+            >>> J.assign(mask=J.key_view("T") > 2)
+            Traceback (most recent call last):
+                ...
+            ValueError: Reserved meta-names ['mask'] cannot be used as user tensor names;
+                they collide with internal ragged-structure tensors.
+        """
+        reserved = set(self._RESERVED_SUBSET_NAMES) & set(kwargs)
+        if reserved:
+            raise ValueError(
+                f"Reserved meta-names {sorted(reserved)} cannot be used as user tensor "
+                "names; they collide with internal ragged-structure tensors."
+            )
+
+        out_tensors = dict(self.tensors)
+        out_schema = dict(self.schema)
+
+        for key, value in kwargs.items():
+            if isinstance(value, RaggedKeyView):
+                RaggedKeyView(self, value.dim, value.values)._check_compatible(value, value.dim)
+                dim, values = value.dim, value.values
+            else:
+                dim, values = self._get_dim(key), np.asarray(value)
+
+            n_elements = self._n_elements_at_dim(dim)
+            if len(values) != n_elements:
+                raise ValueError(
+                    f"Got {len(values)} values for key '{key}', but there are {n_elements} elements at "
+                    f"dim {dim}."
+                )
+
+            for k in [k for k in out_tensors if k.split("/")[1] == key]:
+                del out_tensors[k]
+            out_tensors[f"dim{dim}/{key}"] = values
+            out_schema[key] = values.dtype
+
+        return self.__class__(processed_tensors=out_tensors, schema=out_schema)
+
     def __getitem__(self, idx: int | slice | tuple | np.ndarray):
         """Returns either a slice of the tensors in this collection or the tensor at the given key.
 
@@ -1265,17 +2553,336 @@ class JointNestedRaggedTensorDict:
                 ...
             IndexError: Too many indices for JointNestedRaggedTensorDict: got 3 indices but max_n_dims is 2.
         """
+        cache_key = self._row_cache_key(idx)
+        if cache_key is not None:
+            # The file identity is taken before reading, so a result read from a file rewritten mid-read is
+            # filed under the old identity and dropped at the next lookup rather than served.
+            identity = _file_identity(self._tensors_fp)
+            out = self._row_cache.get(identity, cache_key)
+            if out is not None:
+                return out
+
+        with self._archive_ctx() as archive:
+            if isinstance(idx, np.ndarray) and idx.dtype in (NP_INT_TYPES + NP_UINT_TYPES) and idx.ndim == 1:
+                return self._take_rows(idx, archive=archive)
+            out = self._slice(self._get_slice_indices(idx, archive=archive), archive=archive)
+
+        if cache_key is not None:
+            self._row_cache.put(identity, cache_key, out)
+        return out
+
+    def _row_cache_key(self, idx: int | slice | tuple | np.ndarray) -> tuple | None:
+        """Returns the `RowCache` key for ``self[idx]``, or ``None`` if that result is not cached.
+
+        Only integer (of any integral type but `bool`) and `tuple` indices of disk-backed instances with a row
+        cache are cached. Integers are keyed as `int`s and negative dim-0 indices are resolved against
+        ``len(self)``, so ``J[-1]``, ``J[len(J) - 1]`` and ``J[np.int64(len(J) - 1)]`` share an entry, and
+        slices are replaced by their (hashable) fields. The loaded subset of keys is part of the key, as
+        instances over the same file with different subsets return different results.
+
+        Examples:
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     JointNestedRaggedTensorDict({"T": [[1, 2], [3]], "id": [1, 2]}).save(fp)
+            ...     J = JointNestedRaggedTensorDict(tensors_fp=fp, keys={"T"}, row_cache=RowCache(1024))
+            ...     print(J._row_cache_key(-1), J._row_cache_key((0, slice(None, 1))), J._row_cache_key(0.5))
+            ...     print(J._row_cache_key(np.int64(1)), J._row_cache_key(True))
+            (('dim1/T', 'dim1/bounds'), 1) (('dim1/T', 'dim1/bounds'), (0, (None, 1, None))) None
+            (('dim1/T', 'dim1/bounds'), 1) None
+            >>> print(JointNestedRaggedTensorDict({"T": [1, 2]})._row_cache_key(0))
+            None
+        """
+        if self._tensors is not None or self._row_cache is None:
+            return None
+
+        def is_int(i) -> bool:
+            return isinstance(i, numbers.Integral) and not isinstance(i, bool)
+
+        match idx:
+            case _ if is_int(idx):
+                parts = (int(idx),)
+            case tuple() if idx and all(is_int(i) or isinstance(i, slice) for i in idx):
+                parts = tuple((i.start, i.stop, i.step) if isinstance(i, slice) else int(i) for i in idx)
+            case _:
+                return None
+        if isinstance(parts[0], int) and parts[0] < 0:
+            parts = (parts[0] + len(self), *parts[1:])
+        subset = tuple(self._subset_keys) if self._subset_keys is not None else None
+        return (subset, parts[0] if is_int(idx) else parts)
+
+    def iter_batches(
+        self, batch_size: int, drop_last: bool = False, prefetch: int = 0
+    ) -> Iterator[JointNestedRaggedTensorDict]:
+        """Iterates over contiguous batches of ``batch_size`` dim-0 rows, in order.
+
+        This is equivalent to ``(self[st : st + batch_size] for st in range(0, len(self), batch_size))``, but
+        is cheaper for full passes: the archive is opened once for the whole iteration, each batch costs
+        exactly one read per stored tensor, and bounds are rebased against the element offsets carried over
+        from the previous batch instead of being re-derived for every slice.
+
+        Args:
+            batch_size: The number of dim-0 rows per batch.
+            drop_last: If ``True``, the final batch is dropped when it has fewer than ``batch_size`` rows.
+            prefetch: The number of batches to read ahead on a background thread while the current batch is
+                being consumed. ``0`` reads each batch on demand.
+
+        Yields:
+            The batches, as new collections.
+
+        Raises:
+            ValueError: If ``batch_size`` is not a positive integer or ``prefetch`` is negative.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T": [[1, 2, 3], [4, 5], [6], [7, 8]],
+            ...     "id": [[[1, 2, 3], [3, 4], [1, 2]], [[3], [3, 2, 2]], [[7]], [[8], [9]]],
+            ... })
+            >>> for batch in J.iter_batches(3):
+            ...     print(batch.to_dense()["T"].tolist())
+            [[1, 2, 3], [4, 5, 0], [6, 0, 0]]
+            [[7, 8]]
+            >>> batches = list(J.iter_batches(3, drop_last=True, prefetch=2))
+            >>> len(batches), batches[0] == J[:3]
+            (1, True)
+            >>> J.iter_batches(0)
+            Traceback (most recent call last):
+                ...
+            ValueError: batch_size must be a positive integer; got 0
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer; got {batch_size}")
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ValueError(f"prefetch must be a non-negative integer; got {prefetch}")
+
+        batches = self._iter_batches(batch_size, drop_last)
+        return batches if prefetch == 0 else self._prefetched(batches, prefetch)
+
+    def _iter_batches(
+        self, batch_size: int, drop_last: bool, tensor_keys: set[str] | None = None
+    ) -> Iterator[JointNestedRaggedTensorDict]:
+        # Only the stored ``tensor_keys`` (all of them by default) are read; bounds are read down to the
+        # deepest dim whose bounds are among them.
+        tensor_keys = self._tensor_keys if tensor_keys is None else tensor_keys
+        N = len(self)
+        n_batches = N // batch_size if drop_last else -(-N // batch_size)
+        max_n_dims = 1 + max(
+            (d for d in range(1, self.max_n_dims) if f"dim{d}/bounds" in tensor_keys), default=0
+        )
+        value_keys = sorted(k for k in tensor_keys if not k.endswith("/bounds"))
+
+        def read_range(key: str, st: int, end: int, archive) -> np.ndarray:
+            with self._tensor_at_key(key, archive) as T:
+                if st and end <= st:
+                    # The archive rejects empty slices at the end of a tensor, so empty ranges are cut from
+                    # the element before them instead (which also gives them the tensor's dtype).
+                    return np.asarray(T[st - 1 : st][:0])
+                return np.asarray(T[st:end])
+
         with self._archive_ctx() as archive:
-            return self._slice(self._get_slice_indices(idx, archive=archive), archive=archive)
+            # offsets[d] is the index, among all elements at dim d, of the current batch's first element.
+            offsets = [0] * max_n_dims
+            for b in range(n_batches):
+                st = b * batch_size
+                ranges = [(st, min(st + batch_size, N))]
+                tensors = {}
+                for dim in range(1, max_n_dims):
+                    bounds = read_range(f"dim{dim}/bounds", *ranges[-1], archive)
+                    end = int(bounds[-1]) if len(bounds) else offsets[dim]
+                    tensors[f"dim{dim}/bounds"] = bounds - offsets[dim]
+                    ranges.append((offsets[dim], end))
+                    offsets[dim] = end
+
+                schema = {}
+                for k in value_keys:
+                    tensors[k] = read_range(k, *ranges[self._get_dim_from_key_str(k)], archive)
+                    schema[k.split("/", 1)[1]] = tensors[k].dtype
+                yield self.__class__(processed_tensors=tensors, schema=schema)
+
+    @staticmethod
+    def _prefetched(items: Iterator, n_ahead: int) -> Iterator:
+        """Drives ``items`` on a background thread, keeping up to ``n_ahead`` items ready ahead of the caller.
+
+        The single worker thread runs the ``next`` calls one at a time and in submission order, so the
+        underlying generator is never entered concurrently. Closing the returned generator early cancels the
+        pending reads and closes ``items`` (and any archive it holds open) before returning.
+        """
+        done = object()
+
+        def advance():
+            return next(items, done)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque(executor.submit(advance) for _ in range(n_ahead))
+            try:
+                while True:
+                    item = pending.popleft().result()
+                    if item is done:
+                        return
+                    pending.append(executor.submit(advance))
+                    yield item
+            finally:
+                for future in pending:
+                    future.cancel()
+                for future in pending:
+                    if not future.cancelled():
+                        future.exception()
+                items.close()
+
+    def _async_limit(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """The semaphore bounding this instance's in-flight async reads on ``loop`` (created on first use)."""
+        limits = self.__dict__.setdefault("_async_limits", weakref.WeakKeyDictionary())
+        if loop not in limits:
+            limits[loop] = asyncio.Semaphore(self._max_async_reads)
+        return limits[loop]
+
+    async def _run_async(self, fn: Callable, *args):
+        """Runs ``fn(*args)`` on the async read pool once one of this instance's async read slots is free.
+
+        A call cancelled while waiting for a slot never starts. A call cancelled while its read is running
+        returns immediately, but, as the read itself cannot be interrupted, its slot is only freed once the
+        read finishes, so the bound on concurrent reads holds even under cancellation.
+        """
+        loop = asyncio.get_running_loop()
+        limit = self._async_limit(loop)
+        await limit.acquire()
+        try:
+            future = _thread_pool("nrt-async", self._max_async_reads).submit(fn, *args)
+        except BaseException:
+            limit.release()
+            raise
+
+        def release_slot(_):
+            # A cancelled call's read can outlive its event loop (e.g., once ``asyncio.run`` has returned);
+            # its slot then belongs to no live loop and needs no release.
+            if loop.is_closed():
+                return
+            try:
+                loop.call_soon_threadsafe(limit.release)
+            except RuntimeError:  # The loop closed since the check above.
+                pass
+
+        future.add_done_callback(release_slot)
+        return await asyncio.wrap_future(future)
+
+    async def aget(self, idx: int | slice | tuple | np.ndarray) -> JointNestedRaggedTensorDict:
+        """Returns ``self[idx]`` without blocking the event loop.
+
+        The read runs on a worker thread; at most ``max_async_reads`` async reads of this collection run at
+        once (per event loop), and further calls wait their turn without occupying a thread. Cancelling the
+        awaiting task abandons the result.
+
+        Examples:
+            >>> import asyncio
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4, 5], [6]]})
+            >>> async def lookup():
+            ...     return await asyncio.gather(J.aget(2), J.aget(slice(0, 2)), J.aget(np.array([2, 0])))
+            >>> [out.to_dense()["T"].tolist() for out in asyncio.run(lookup())]
+            [[6], [[1, 2, 3], [4, 5, 0]], [[6, 0, 0], [1, 2, 3]]]
+        """
+        return await self._run_async(self.__getitem__, idx)
+
+    async def agather_dense(
+        self, indices: Sequence[int] | np.ndarray, **dense_kwargs
+    ) -> dict[str, np.ndarray]:
+        """Returns ``self[indices].to_dense(**dense_kwargs)`` without blocking the event loop.
+
+        Both the read of the rows ``indices`` and their densification run on a worker thread, under the same
+        concurrency bound as `aget`.
+
+        Examples:
+            >>> import asyncio
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4, 5], [6]]})
+            >>> asyncio.run(J.agather_dense([2, 1], padding_side="left"))["T"]
+            array([[0, 6],
+                   [4, 5]], dtype=uint8)
+        """
+        return await self._run_async(self._gather_dense, np.asarray(indices, dtype=np.int64), dense_kwargs)
+
+    def _gather_dense(self, indices: np.ndarray, dense_kwargs: dict) -> dict[str, np.ndarray]:
+        return self[indices].to_dense(**dense_kwargs)
+
+    async def aiter_batches(
+        self, batch_size: int, drop_last: bool = False, prefetch: int = 0
+    ) -> AsyncIterator[JointNestedRaggedTensorDict]:
+        """Asynchronously iterates over the batches of `iter_batches`, reading each on a worker thread.
 
-    def to_dense(self, padding_side: str = "right") -> dict[str, np.ndarray]:
+        Each batch is read under the same concurrency bound as `aget`, so other lookups on the collection
+        proceed between batches. Leaving the loop early (or cancelling it) closes the underlying iterator, and
+        with it the archive, once any read in flight has finished.
+
+        Examples:
+            >>> import asyncio
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4, 5], [6]]})
+            >>> async def collect():
+            ...     return [batch.to_dense()["T"].tolist() async for batch in J.aiter_batches(2, prefetch=1)]
+            >>> asyncio.run(collect())
+            [[[1, 2, 3], [4, 5, 0]], [[6]]]
+        """
+        batches = self.iter_batches(batch_size, drop_last=drop_last, prefetch=prefetch)
+        # A generator may only be advanced (or closed) by one thread at a time; a cancelled read may still be
+        # advancing it when the loop exits, so closing waits for it on this lock.
+        lock = threading.Lock()
+        done = object()
+
+        def advance():
+            with lock:
+                return next(batches, done)
+
+        def close():
+            with lock:
+                batches.close()
+
+        try:
+            while (batch := await self._run_async(advance)) is not done:
+                yield batch
+        finally:
+            _thread_pool("nrt-async", self._max_async_reads).submit(close)
+
+    def to_dense(
+        self,
+        padding_side: str = "right",
+        out: dict[str, np.ndarray] | DenseBufferPool | None = None,
+        pad_to_multiple_of: int | None = None,
+        max_lens: dict[int, int] | None = None,
+        truncate_side: str = "right",
+        keys: Iterable[str] | None = None,
+        masks: Iterable[int] | None = None,
+    ) -> dict[str, np.ndarray]:
         """Returns a dense view of these ragged tensors.
 
+        Each value is scattered straight to its position in the dense output, so the cost scales with the
+        number of stored elements rather than with the number of (nested) sequences.
+
         Args:
             padding_side: The side on which to pad sequences. Must be either "left" or "right".
+            out: Where to write the dense keys and masks instead of freshly allocated arrays. Either a
+                dictionary of preallocated arrays (any output key it holds must have exactly the output's
+                shape and dtype, and is zeroed and refilled in place; keys it lacks are allocated as usual),
+                or a `DenseBufferPool`, from which every output array is drawn (and to which the caller
+                returns them with `DenseBufferPool.release`). Keys at dim 0 are returned as-is and never
+                copied into ``out``.
+            pad_to_multiple_of: If specified, every padded dim is rounded up to a multiple of this, so that
+                batches with similar lengths share a shape (e.g., for shape-specialized kernels or compile
+                caches). The rounded size never exceeds that dim's ``max_lens`` cap.
+            max_lens: Maps a dim (1 or deeper) to the most elements any sequence at that dim may keep. Longer
+                sequences are truncated while filling, along with everything nested under the dropped
+                elements, and the dim is sized to at most this cap.
+            truncate_side: Which elements of an over-long sequence are dropped: "right" keeps the first
+                ``max_lens[dim]``, "left" keeps the last.
+            keys: If specified, only these keys are densified. Keys that aren't requested are never read
+                (from disk, for disk-backed instances), and neither are any dims deeper than the deepest
+                requested key or mask.
+            masks: The dims whose masks to return. Defaults to every dim holding a requested key; pass an
+                empty list to return no masks.
 
         Raises:
-            ValueError: If ``padding_side`` is not "left" or "right".
+            ValueError: If ``padding_side`` or ``truncate_side`` is not "left" or "right", if
+                ``pad_to_multiple_of`` or a ``max_lens`` cap is not a positive integer, if a ``max_lens``
+                or ``masks`` dim is out of range, or if an array in an ``out`` dictionary doesn't match the
+                shape or dtype of the corresponding output.
+            TypeError: If ``keys`` is a bare ``str``/``bytes`` rather than an iterable of them.
+            KeyError: If a requested key is not present.
 
         Examples:
             >>> J = JointNestedRaggedTensorDict({
@@ -1336,97 +2943,1187 @@ class JointNestedRaggedTensorDict:
                     [0, 3, 4],
                     [0, 1, 2]],
             <BLANKLINE>
-                   [[0, 0, 0],
-                    [0, 0, 3],
+                   [[0, 0, 0],
+                    [0, 0, 3],
+                    [3, 2, 2]]], dtype=uint8)
+            >>> dense_dict['val']
+            array([[[1. , 0.2, 0. ],
+                    [0. , 3.1, 0. ],
+                    [0. , 1. , 2.2]],
+            <BLANKLINE>
+                   [[0. , 0. , 0. ],
+                    [0. , 0. , 3. ],
+                    [3.3, 2. , 0. ]]], dtype=float32)
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3]]})
+            >>> dense_dict = J.to_dense()
+            >>> assert dense_dict.keys() == {'T', 'dim1/mask'}
+            >>> dense_dict['dim1/mask']
+            array([[ True,  True,  True]])
+            >>> dense_dict['T']
+            array([[1, 2, 3]], dtype=uint8)
+            >>> J.to_dense(padding_side="up")
+            Traceback (most recent call last):
+                ...
+            ValueError: padding_side must be 'left' or 'right'; got 'up'
+
+            Preallocated output arrays are filled in place:
+
+            >>> buf = np.full((1, 3), 9, dtype=np.uint8)
+            >>> J.to_dense(out={"T": buf})["T"] is buf, buf
+            (True, array([[1, 2, 3]], dtype=uint8))
+            >>> J.to_dense(out={"T": np.zeros((1, 4), dtype=np.uint8)})
+            Traceback (most recent call last):
+                ...
+            ValueError: out['T'] must have shape (1, 3) and dtype uint8; got shape (1, 4) and dtype uint8
+
+            Dims can be padded to bucketed sizes and capped, truncating over-long sequences during the fill:
+
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T": [[1, 2, 3], [4, 5]],
+            ...     "id": [[[1, 2, 3], [3, 4], [1, 2]], [[3], [3, 2, 2]]],
+            ... })
+            >>> dense_dict = J.to_dense(pad_to_multiple_of=4)
+            >>> dense_dict['T']
+            array([[1, 2, 3, 0],
+                   [4, 5, 0, 0]], dtype=uint8)
+            >>> dense_dict['id'].shape
+            (2, 4, 4)
+            >>> dense_dict = J.to_dense(max_lens={1: 2, 2: 1}, truncate_side="left")
+            >>> dense_dict['T']
+            array([[2, 3],
+                   [4, 5]], dtype=uint8)
+            >>> dense_dict['id']
+            array([[[4],
+                    [2]],
+            <BLANKLINE>
+                   [[3],
+                    [2]]], dtype=uint8)
+            >>> J.to_dense(max_lens={2: 2}, pad_to_multiple_of=4)['id']
+            array([[[1, 2],
+                    [3, 4],
+                    [1, 2],
+                    [0, 0]],
+            <BLANKLINE>
+                   [[3, 0],
+                    [3, 2],
+                    [0, 0],
+                    [0, 0]]], dtype=uint8)
+            >>> J.to_dense(max_lens={3: 2})
+            Traceback (most recent call last):
+                ...
+            ValueError: max_lens dims must be in [1, 2]; got 3
+
+            Only the requested keys and masks are built:
+
+            >>> dense_dict = J.to_dense(keys=["T"], masks=[1, 2])
+            >>> sorted(dense_dict)
+            ['T', 'dim1/mask', 'dim2/mask']
+            >>> sorted(J.to_dense(keys=["id"], masks=[]))
+            ['id']
+            >>> J.to_dense(keys=["value"])
+            Traceback (most recent call last):
+                ...
+            KeyError: "Key 'value' not found in 'T', 'id'"
+            >>> J.to_dense(keys="T")
+            Traceback (most recent call last):
+                ...
+            TypeError: `keys` must be an iterable of strings, not a bare str/bytes.
+        """
+
+        if isinstance(keys, (str, bytes)):
+            raise TypeError("`keys` must be an iterable of strings, not a bare str/bytes.")
+        if padding_side not in ("left", "right"):
+            raise ValueError(f"padding_side must be 'left' or 'right'; got '{padding_side}'")
+        if truncate_side not in ("left", "right"):
+            raise ValueError(f"truncate_side must be 'left' or 'right'; got '{truncate_side}'")
+        if pad_to_multiple_of is not None and (
+            not isinstance(pad_to_multiple_of, int | np.integer) or pad_to_multiple_of <= 0
+        ):
+            raise ValueError(f"pad_to_multiple_of must be a positive integer; got {pad_to_multiple_of}")
+        max_lens = dict(max_lens or {})
+        for dim, max_len in max_lens.items():
+            if not (1 <= dim < self.max_n_dims):
+                raise ValueError(f"max_lens dims must be in [1, {self.max_n_dims - 1}]; got {dim}")
+            if not isinstance(max_len, int | np.integer) or max_len <= 0:
+                raise ValueError(f"max_lens[{dim}] must be a positive integer; got {max_len}")
+
+        def alloc(key: str, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+            if isinstance(out, DenseBufferPool):
+                return out.get(shape, dtype)
+            if out is None or key not in out:
+                return np.zeros(shape=shape, dtype=dtype)
+            arr = out[key]
+            if arr.shape != shape or arr.dtype != dtype:
+                raise ValueError(
+                    f"out[{key!r}] must have shape {shape} and dtype {np.dtype(dtype)}; got shape "
+                    f"{arr.shape} and dtype {arr.dtype}"
+                )
+            arr.fill(0)
+            return arr
+
+        def scatter(arr: np.ndarray, flat_idx: np.ndarray, values: np.ndarray | bool):
+            if arr.flags.c_contiguous:
+                arr.reshape(-1)[flat_idx] = values
+            else:
+                arr[np.unravel_index(flat_idx, arr.shape)] = values
+
+        with self._archive_ctx() as archive:
+
+            def read(key: str) -> np.ndarray:
+                with self._tensor_at_key(key, archive) as T:
+                    return T[:]
+
+            if keys is None:
+                keys_by_dim = {dim: self.keys_at_dim(dim) for dim in range(self.max_n_dims)}
+            else:
+                keys_by_dim = {}
+                for key in keys:
+                    keys_by_dim.setdefault(self._get_dim(key), set()).add(key)
+            if masks is None:
+                mask_dims = {dim for dim, dim_keys in keys_by_dim.items() if dim > 0 and dim_keys}
+            else:
+                mask_dims = set(masks)
+                for dim in mask_dims:
+                    if not (1 <= dim < self.max_n_dims):
+                        raise ValueError(f"masks dims must be in [1, {self.max_n_dims - 1}]; got {dim}")
+
+            # Dims past the deepest requested key or mask are never visited, so neither their bounds nor
+            # their values are read.
+            last_dim = max([0, *mask_dims, *(dim for dim, dim_keys in keys_by_dim.items() if dim_keys)])
+
+            dense = {key: read(f"dim0/{key}") for key in keys_by_dim.get(0, ())}
+
+            # Each element at the current dim is tracked by its flat index into the dense array of the dims
+            # so far; ``kept`` marks the elements (and, through their parents, the subtrees) that survive
+            # truncation.
+            shape = [len(self)]
+            flat_idx = np.arange(len(self), dtype=np.int64)
+            kept = np.ones(len(self), dtype=bool)
+
+            for dim in range(1, last_dim + 1):
+                B = read(f"dim{dim}/bounds")
+                L = np.diff(B, prepend=0)
+                starts = B - L
+                parent = np.repeat(np.arange(len(B)), L)
+                pos = np.arange(len(parent), dtype=np.int64) - starts[parent]
+
+                kept_L = L.copy()
+                kept_L[~kept] = 0
+                if dim in max_lens:
+                    kept_L = np.minimum(kept_L, max_lens[dim])
+                    if truncate_side == "left":
+                        pos = pos - (L - kept_L)[parent]
+                kept = kept[parent] & (pos >= 0) & (pos < kept_L[parent])
+
+                max_ln = int(kept_L.max()) if len(kept_L) else 0
+                if pad_to_multiple_of is not None:
+                    max_ln = -(-max_ln // pad_to_multiple_of) * pad_to_multiple_of
+                    if dim in max_lens:
+                        max_ln = min(max_ln, int(max_lens[dim]))
+
+                if padding_side == "left":
+                    pos = pos + (max_ln - kept_L)[parent]
+                flat_idx = flat_idx[parent] * max_ln + pos
+                shape.append(max_ln)
+
+                dim_keys = keys_by_dim.get(dim, set())
+                if dim not in mask_dims and not dim_keys:
+                    continue
+                kept_idx = flat_idx[kept]
+
+                if dim in mask_dims:
+                    dense[f"dim{dim}/mask"] = alloc(f"dim{dim}/mask", tuple(shape), bool)
+                    scatter(dense[f"dim{dim}/mask"], kept_idx, True)
+
+                for key in dim_keys:
+                    T = read(f"dim{dim}/{key}")
+                    if len(T) == 0:
+                        continue
+                    dense[key] = alloc(key, tuple(shape), T.dtype)
+                    scatter(dense[key], kept_idx, T[kept])
+
+        return dense
+
+    def to_dense_memmap(
+        self,
+        dirpath: Path,
+        chunk_size: int = 1024,
+        padding_side: str = "right",
+        pad_to_multiple_of: int | None = None,
+        max_lens: dict[int, int] | None = None,
+        truncate_side: str = "right",
+        keys: Iterable[str] | None = None,
+        masks: Iterable[int] | None = None,
+    ) -> dict[str, np.memmap]:
+        """Densifies into memory-mapped ``.npy`` files, ``chunk_size`` dim-0 rows at a time.
+
+        The output for every key and mask is created up front with `np.lib.format.open_memmap`, sized by the
+        longest segment at each dim as read from the ``dim*/bounds`` arrays (which are themselves scanned in
+        blocks). Chunks of rows are then read as in `iter_batches` (reading, when backed by disk, only the
+        selected ``keys`` and the bounds down to the deepest output), densified with `to_dense` and written
+        into their slices of the outputs, so peak memory is bounded by the dense size of one chunk rather
+        than of the whole collection.
+        Files are named after the output keys, with ``/`` replaced by ``.`` (e.g., ``dim1.mask.npy``).
+
+        Args:
+            dirpath: The directory in which to write the ``.npy`` files; created if needed.
+            chunk_size: The number of dim-0 rows densified at a time.
+            padding_side: As in `to_dense`.
+            pad_to_multiple_of: As in `to_dense`.
+            max_lens: As in `to_dense`. Dims are sized from the bounds alone, so when an outer dim is
+                truncated, inner dims are sized to fit the untruncated data and may be larger than the
+                corresponding `to_dense` output.
+            truncate_side: As in `to_dense`.
+            keys: As in `to_dense`.
+            masks: As in `to_dense`.
+
+        Returns:
+            The memory-mapped outputs, keyed as in `to_dense`.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not a positive integer, or for any `to_dense` argument error.
+            TypeError: If ``keys`` is a bare ``str``/``bytes``, as in `to_dense`.
+
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T": [[1, 2, 3], [4, 5], [6]],
+            ...     "id": [[[1, 2, 3], [3, 4], [1, 2]], [[3], [3, 2, 2]], [[7]]],
+            ... })
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     out = J.to_dense_memmap(Path(dirpath), chunk_size=2, padding_side="left")
+            ...     print(sorted(p.name for p in Path(dirpath).iterdir()))
+            ...     expected = J.to_dense(padding_side="left")
+            ...     same = all(np.array_equal(out[k], expected[k]) for k in expected)
+            ...     print(same, out.keys() == expected.keys())
+            ...     del out
+            ['T.npy', 'dim1.mask.npy', 'dim2.mask.npy', 'id.npy']
+            True True
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer; got {chunk_size}")
+        if isinstance(keys, (str, bytes)):
+            raise TypeError("`keys` must be an iterable of strings, not a bare str/bytes.")
+        max_lens = dict(max_lens or {})
+        dense_kwargs = dict(
+            padding_side=padding_side,
+            pad_to_multiple_of=pad_to_multiple_of,
+            max_lens=max_lens,
+            truncate_side=truncate_side,
+            keys=keys,
+            masks=masks,
+        )
+        if keys is None:
+            keys_by_dim = {dim: self.keys_at_dim(dim) for dim in range(self.max_n_dims)}
+        else:
+            keys_by_dim = {}
+            for key in keys:
+                keys_by_dim.setdefault(self._get_dim(key), set()).add(key)
+        if masks is None:
+            mask_dims = {dim for dim, dim_keys in keys_by_dim.items() if dim > 0 and dim_keys}
+        else:
+            mask_dims = set(masks)
+        last_dim = max([0, *mask_dims, *(dim for dim, dim_keys in keys_by_dim.items() if dim_keys)])
+
+        tensor_keys = {f"dim{dim}/bounds" for dim in range(1, last_dim + 1)}
+        tensor_keys.update(f"dim{dim}/{key}" for dim, dim_keys in keys_by_dim.items() for key in dim_keys)
+        batches = self._iter_batches(chunk_size, drop_last=False, tensor_keys=tensor_keys)
+        # The first chunk is densified before any file is created, which validates the arguments (on an empty
+        # selection if there are no rows).
+        first_batch = next(batches, None)
+        first_chunk = (self[:0] if first_batch is None else first_batch).to_dense(**dense_kwargs)
+
+        N = len(self)
+        shape = [N]
+        # The dim-d bounds have one entry per element at dim d - 1: ``N`` at dim 1, and the last bound read at
+        # each deeper dim.
+        n_segments = N
+        with self._archive_ctx() as archive:
+            for dim in range(1, last_dim + 1):
+                max_ln = 0
+                with self._tensor_at_key(f"dim{dim}/bounds", archive) as B:
+                    block = max(chunk_size, 1 << 16)
+                    prev_end = 0
+                    for st in range(0, n_segments, block):
+                        B_block = B[st : min(st + block, n_segments)]
+                        max_ln = max(max_ln, int(np.diff(B_block, prepend=prev_end).max()))
+                        prev_end = int(B_block[-1])
+                n_segments = prev_end
+                if dim in max_lens:
+                    max_ln = min(max_ln, int(max_lens[dim]))
+                if pad_to_multiple_of is not None:
+                    max_ln = -(-max_ln // pad_to_multiple_of) * pad_to_multiple_of
+                    if dim in max_lens:
+                        max_ln = min(max_ln, int(max_lens[dim]))
+                shape.append(max_ln)
+
+        dirpath = Path(dirpath)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        out = {}
+        for dim in range(last_dim + 1):
+            if dim in mask_dims:
+                out[f"dim{dim}/mask"] = (tuple(shape[: dim + 1]), bool)
+            for key in keys_by_dim.get(dim, ()):
+                out[key] = (tuple(shape[: dim + 1]), self.schema[key])
+        out = {
+            k: np.lib.format.open_memmap(dirpath / f"{k.replace('/', '.')}.npy", "w+", dtype, out_shape)
+            for k, (out_shape, dtype) in out.items()
+        }
+
+        # `to_dense` omits keys with no elements in a chunk; their rows of the output are left as padding.
+        chunks = itertools.chain([first_chunk], (batch.to_dense(**dense_kwargs) for batch in batches))
+        for st, dense in zip(range(0, N, chunk_size), chunks):
+            for k, chunk in dense.items():
+                dst = [slice(st, st + chunk.shape[0])]
+                for size, full_size in zip(chunk.shape[1:], out[k].shape[1:]):
+                    dst.append(
+                        slice(full_size - size, full_size) if padding_side == "left" else slice(0, size)
+                    )
+                out[k][tuple(dst)] = chunk
+
+        for arr in out.values():
+            arr.flush()
+        return out
+
+    def filter(
+        self, mask: RaggedKeyView | np.ndarray, dim: int | None = None, prune_empty: bool = False
+    ) -> JointNestedRaggedTensorDict:
+        """Keeps only the elements at ``dim`` selected by a boolean ``mask`` over that dim's flat elements.
+
+        Every key at ``dim`` is compacted with ``mask``, every element at deeper dims that descends from a
+        dropped element is dropped too, and the affected ``dim*/bounds`` arrays are recomputed from a
+        cumulative count of the kept elements; no nested lists or dense arrays are built.
+
+        Args:
+            mask: A boolean mask with one entry per element at ``dim``, either as a `RaggedKeyView` (e.g.,
+                ``J.key_view("val") > 0``) or as a flat array.
+            dim: The dim whose elements ``mask`` selects. Inferred from ``mask`` if it is a `RaggedKeyView`;
+                required otherwise. May be negative.
+            prune_empty: If `True`, parent elements that had children before filtering but have none after it
+                are dropped as well, recursively all the way up to dim 0. Parents that were already empty are
+                kept.
+
+        Returns:
+            A new `JointNestedRaggedTensorDict` holding the kept elements. Tensors at dims shallower than
+            ``dim`` are shared with this collection unless pruning touches them.
+
+        Raises:
+            ValueError: If ``dim`` is missing or out of range, or ``mask`` is not a boolean mask of the right
+                length.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[1,        2,        3       ], [4,     5    ]],
+            ...     "code": [[[1, 2, 3], [3, 4],   [1, 2]  ], [[3],   [4, 2]]],
+            ...     "val":  [[[1, 0, 0], [3, 0.5], [1, 2.5]], [[0.5], [0, 0]]],
+            ... })
+            >>> F = J.filter(J.key_view("val") != 0)
+            >>> F.tensors["dim2/code"], F.tensors["dim2/bounds"]
+            (array([1, 3, 4, 1, 2, 3], dtype=uint8), array([1, 3, 5, 6, 6]))
+            >>> F.to_dense()["code"]
+            array([[[1, 0],
+                    [3, 4],
+                    [1, 2]],
+            <BLANKLINE>
+                   [[3, 0],
+                    [0, 0],
+                    [0, 0]]], dtype=uint8)
+
+            With ``prune_empty=True`` the event at ``T == 5``, which lost all of its measurements, is dropped:
+
+            >>> J.filter(J.key_view("val") != 0, prune_empty=True).to_dense()["T"]
+            array([[1, 2, 3],
+                   [4, 0, 0]], dtype=uint8)
+
+            Pruning continues up to dim 0, and dropping elements at a dim drops everything beneath them:
+
+            >>> J.filter(J.key_view("code") == 1, prune_empty=True).to_dense()["T"]
+            array([[1, 3]], dtype=uint8)
+            >>> J.filter(np.array([False, True]), dim=0).tensors["dim2/code"]
+            array([3, 4, 2], dtype=uint8)
+
+            Errors are raised for invalid masks:
+
+            >>> J.filter(np.array([True, False]))
+            Traceback (most recent call last):
+                ...
+            ValueError: `dim` must be specified when `mask` is not a RaggedKeyView.
+            >>> J.filter(np.array([True, False]), dim=1)
+            Traceback (most recent call last):
+                ...
+            ValueError: Got a mask of length 2, but there are 5 elements at dim 1.
+            >>> J.filter(J.key_view("val"))
+            Traceback (most recent call last):
+                ...
+            ValueError: `mask` must be boolean; got float32.
+        """
+        if isinstance(mask, RaggedKeyView):
+            RaggedKeyView(self, mask.dim, mask.values)._check_compatible(mask, mask.dim)
+            dim, mask = mask.dim, mask.values
+        elif dim is None:
+            raise ValueError("`dim` must be specified when `mask` is not a RaggedKeyView.")
+
+        mask = np.asarray(mask)
+        if dim < 0:
+            dim = self.max_n_dims + dim
+        if not 0 <= dim < self.max_n_dims:
+            raise ValueError(f"dim must be in [{-self.max_n_dims}, {self.max_n_dims}); got {dim}")
+        if mask.dtype != bool:
+            raise ValueError(f"`mask` must be boolean; got {mask.dtype}.")
+        n_elements = self._n_elements_at_dim(dim)
+        if len(mask) != n_elements:
+            raise ValueError(
+                f"Got a mask of length {len(mask)}, but there are {n_elements} elements at dim {dim}."
+            )
+
+        out = self
+        while True:
+            tensors = dict(out.tensors)
+            old_lengths = np.diff(out._segment_offsets(dim - 1, dim)) if dim > 0 else None
+
+            elem_mask = mask
+            for d in range(dim, out.max_n_dims):
+                if d > dim:
+                    parent_mask = elem_mask
+                    elem_mask = np.repeat(parent_mask, np.diff(out._segment_offsets(d - 1, d)))
+                if d > 0:
+                    kept_before = np.concatenate([[0], np.cumsum(elem_mask)])
+                    bounds = kept_before[out.tensors[f"dim{d}/bounds"]]
+                    tensors[f"dim{d}/bounds"] = bounds if d == dim else bounds[parent_mask]
+                for key in out.keys_at_dim(d):
+                    tensors[f"dim{d}/{key}"] = out.tensors[f"dim{d}/{key}"][elem_mask]
+
+            out = self.__class__(processed_tensors=tensors, schema=dict(self.schema))
+            if not prune_empty or dim == 0:
+                return out
+
+            emptied = (old_lengths > 0) & (np.diff(out._segment_offsets(dim - 1, dim)) == 0)
+            if not emptied.any():
+                return out
+            dim, mask = dim - 1, ~emptied
+
+    @staticmethod
+    def _concat_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """Returns the concatenation of ``np.arange(s, s + n)`` over ``zip(starts, lengths)``, vectorized.
+
+        Examples:
+            >>> JointNestedRaggedTensorDict._concat_ranges(np.array([5, 0, 9, 2]), np.array([2, 0, 1, 3]))
+            array([5, 6, 9, 2, 3, 4])
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        run_starts = np.cumsum(lengths) - lengths
+        return np.repeat(np.asarray(starts, dtype=np.int64) - run_starts, lengths) + np.arange(lengths.sum())
+
+    @staticmethod
+    def _coalesced_runs(idx: np.ndarray, gap: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Groups the (non-negative) positions ``idx`` into runs to be read with one read each.
+
+        The positions are sorted (unless they already are) and merged into runs wherever the gap between
+        consecutive positions is at most ``gap``; repeated positions fall in the same run.
+
+        Returns:
+            The run starts and (exclusive) stops, and the position of each entry of ``idx`` in the
+            concatenation of the runs.
+
+        Examples:
+            >>> JointNestedRaggedTensorDict._coalesced_runs(np.array([9, 3, 5, 0, 3]), 1)
+            (array([0, 3, 9]), array([ 1,  6, 10]), array([4, 1, 3, 0, 1]))
+            >>> JointNestedRaggedTensorDict._coalesced_runs(np.array([0, 1, 1, 4]), 0)
+            (array([0, 4]), array([2, 5]), array([0, 1, 1, 2]))
+        """
+        is_sorted = bool((np.diff(idx) >= 0).all())
+        rows = idx if is_sorted else np.sort(idx)
+        is_break = np.diff(rows) > gap + 1
+        breaks = np.flatnonzero(is_break)
+        starts = rows[np.concatenate([[0], breaks + 1])]
+        stops = rows[np.concatenate([breaks, [len(rows) - 1]])] + 1
+        run_offsets = np.cumsum(stops - starts) - (stops - starts)
+        if is_sorted:  # Sorted positions (the common case) find their runs without a search.
+            run = np.concatenate([[0], np.cumsum(is_break)])
+        else:
+            run = np.searchsorted(starts, idx, side="right") - 1
+        return starts, stops, run_offsets[run] + idx - starts[run]
+
+    def _gather(self, key: str, idx: np.ndarray, archive=None) -> np.ndarray:
+        """Returns ``self.tensors[key][idx]``, reading only the runs of positions ``idx`` covers from disk.
+
+        Positions at most ``_ELEMENT_READ_GAP`` elements apart share a read (see `_coalesced_runs`), so e.g.
+        a contiguous window of elements, or a cluster of nearby windows, costs one read.
+
+        Examples:
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     JointNestedRaggedTensorDict({"T": [5, 6, 7, 8, 9]}).save(fp)
+            ...     J = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     J._gather("dim0/T", np.array([3, 1, 1]))
+            array([8, 6, 6], dtype=uint8)
+        """
+        with self._tensor_at_key(key, archive=archive) as T:
+            if self._tensors is not None:
+                return T[idx]
+            if len(idx) == 0:
+                return T[0:0]
+            starts, stops, positions = self._coalesced_runs(idx, _ELEMENT_READ_GAP)
+            return np.concatenate([T[st:end] for st, end in zip(starts.tolist(), stops.tolist())])[positions]
+
+    def _gather_ranges(self, key: str, starts: np.ndarray, lengths: np.ndarray, archive=None) -> np.ndarray:
+        """Returns the concatenation of ``self.tensors[key][s : s + n]`` over ``zip(starts, lengths)``.
+
+        This is ``self._gather(key, self._concat_ranges(starts, lengths))``, but when backed by disk, ranges
+        in ascending order that do not overlap (as a selection of windows and their descendants are) are read
+        as they are, with no work per element, and ranges at most ``_ELEMENT_READ_GAP`` elements apart share
+        a read.
+
+        Examples:
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     JointNestedRaggedTensorDict({"T": list(range(10))}).save(fp)
+            ...     J = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     J._gather_ranges("dim0/T", np.array([1, 4, 8]), np.array([2, 0, 2]))
+            array([1, 2, 8, 9], dtype=uint8)
+        """
+        nonempty = lengths > 0
+        starts, lengths = starts[nonempty], lengths[nonempty]
+        ends = starts + lengths
+        if self._tensors is not None or len(starts) == 0 or (starts[1:] < ends[:-1]).any():
+            return self._gather(key, self._concat_ranges(starts, lengths), archive=archive)
+
+        gaps = starts[1:] - ends[:-1]
+        is_break = gaps > _ELEMENT_READ_GAP
+        breaks = np.flatnonzero(is_break)
+        run_starts = starts[np.concatenate([[0], breaks + 1])]
+        run_stops = ends[np.concatenate([breaks, [len(starts) - 1]])]
+        with self._tensor_at_key(key, archive=archive) as T:
+            runs = [T[st:end] for st, end in zip(run_starts.tolist(), run_stops.tolist())]
+        out = runs[0] if len(runs) == 1 else np.concatenate(runs)
+        if not gaps[~is_break].any():
+            return out  # The runs hold exactly the ranges.
+
+        run_lengths = run_stops - run_starts
+        run = np.concatenate([[0], np.cumsum(is_break)])
+        offsets = (np.cumsum(run_lengths) - run_lengths)[run] + starts - run_starts[run]
+        return out[self._concat_ranges(offsets, lengths)]
+
+    def _take_subtree(
+        self, dim: int, idx: np.ndarray, bounds: np.ndarray | None, archive=None
+    ) -> JointNestedRaggedTensorDict:
+        """Returns a collection holding the elements ``idx`` at ``dim`` together with all their descendants.
+
+        Tensors at shallower dims are shared with this collection (and so, when backed by disk, are read in
+        full, as every one of their elements is part of the result). The caller is responsible for ensuring
+        that ``idx`` is grouped by parent element consistently with ``bounds``, the new ``dim{dim}/bounds``
+        (which is ignored for ``dim == 0``). When backed by disk, each tensor at ``dim`` or deeper is read
+        only over the ranges of elements the selection covers (see `_gather_ranges`).
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ... })
+            >>> J._take_subtree(1, np.array([2, 0, 4]), np.array([2, 3])).to_dense()["id"]
+            array([[[1, 2, 0],
+                    [1, 2, 3]],
+            <BLANKLINE>
+                   [[3, 2, 2],
+                    [0, 0, 0]]], dtype=uint8)
+        """
+        if self._tensors is not None:
+            tensors = dict(self._tensors)
+        else:
+            tensors = {}
+            for k in sorted(self._tensor_keys):
+                if self._get_dim_from_key_str(k) < dim:
+                    with self._tensor_at_key(k, archive=archive) as T:
+                        tensors[k] = T[:]
+        if dim > 0:
+            tensors[f"dim{dim}/bounds"] = bounds
+
+        # The selection at each dim is tracked as ranges of consecutive elements: the descendants of a range
+        # form one range at the next dim, so finding and reading them costs one step per range, not element.
+        if len(idx):
+            first = np.concatenate([[0], np.flatnonzero(np.diff(idx) != 1) + 1])
+            starts, lengths = idx[first], np.diff(np.concatenate([first, [len(idx)]]))
+        else:
+            starts, lengths = idx, idx
+        for key in self.keys_at_dim(dim):
+            tensors[f"dim{dim}/{key}"] = self._gather_ranges(f"dim{dim}/{key}", starts, lengths, archive)
+
+        for d in range(dim + 1, self.max_n_dims):
+            # Each range's elements' ends, after that of the element before it (or 0, for a range at 0).
+            has_prev = (starts > 0).astype(np.int64)
+            ends = self._gather_ranges(f"dim{d}/bounds", starts - has_prev, lengths + has_prev, archive)
+            ends_starts = np.cumsum(lengths + has_prev) - (lengths + has_prev)
+            ends = np.insert(ends.astype(np.int64), ends_starts[has_prev == 0], 0)
+            range_starts = np.cumsum(lengths + 1) - (lengths + 1)
+
+            element_pos = self._concat_ranges(range_starts, lengths)
+            tensors[f"dim{d}/bounds"] = np.cumsum(ends[element_pos + 1] - ends[element_pos])
+            starts, lengths = ends[range_starts], ends[range_starts + lengths] - ends[range_starts]
+            for key in self.keys_at_dim(d):
+                tensors[f"dim{d}/{key}"] = self._gather_ranges(f"dim{d}/{key}", starts, lengths, archive)
+
+        return self.__class__(processed_tensors=tensors, schema=dict(self.schema))
+
+    def _take_rows(self, idx: np.ndarray, archive=None) -> JointNestedRaggedTensorDict:
+        """Returns the dim-0 rows ``idx`` (in order, with repeats), as ``self[idx]`` does for integer arrays.
+
+        In memory this is a single vectorized gather. When backed by disk, the distinct requested rows are
+        sorted and merged into runs wherever the gap between consecutive rows is at most ``coalesce_gap``
+        rows; each run costs one read per tensor (see `_read_row_runs`), and the requested rows are then
+        gathered back, in the requested order, from the in-memory result.
+
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T": [[1, 2, 3], [4, 5], [6], [7, 8]],
+            ...     "id": [[[1, 2, 3], [3, 4], [1, 2]], [[3], [3, 2, 2]], [[7]], [[8], [9]]],
+            ... })
+            >>> J._take_rows(np.array([3, 0, 3])).to_dense()["T"]
+            array([[7, 8, 0],
+                   [1, 2, 3],
+                   [7, 8, 0]], dtype=uint8)
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, coalesce_gap=1)
+            ...     J_disk._take_rows(np.array([3, 0, -1, 1])) == J._take_rows(np.array([3, 0, 3, 1]))
+            True
+            >>> J._take_rows(np.array([0, 4]))
+            Traceback (most recent call last):
+                ...
+            IndexError: Index 4 is out of range at dim 0 (length 4).
+        """
+        N = len(self)
+        idx = idx.astype(np.int64)
+        out_of_range = (idx < -N) | (idx >= N)
+        if out_of_range.any():
+            self._bounds_check_int(int(idx[out_of_range][0]), N, 0)
+        idx = np.where(idx < 0, idx + N, idx)
+
+        if self._tensors is not None:
+            return self._take_subtree(0, idx, None)
+        if len(idx) == 0:
+            return self._slice(self._get_slice_indices(slice(0, 0), archive=archive), archive=archive)
+
+        starts, stops, positions = self._coalesced_runs(idx, self._coalesce_gap)
+        covered = self._read_row_runs(starts, stops, archive=archive)
+        return covered._take_subtree(0, positions, None)
+
+    def _read_row_runs(
+        self, starts: np.ndarray, stops: np.ndarray, archive=None
+    ) -> JointNestedRaggedTensorDict:
+        """Reads the dim-0 row ranges ``[starts[i], stops[i])`` into one in-memory collection, in order.
+
+        Each range of rows spans one contiguous range of elements at every deeper dim, so every stored tensor
+        is read with exactly one slice per range: values directly, and bounds together with the end of the
+        preceding segment, from which that range's segment lengths (and the next dim's element range) follow.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T": [[1, 2, 3], [4, 5], [6], [7, 8]],
+            ...     "id": [[[1, 2, 3], [3, 4], [1, 2]], [[3], [3, 2, 2]], [[7]], [[8], [9]]],
+            ... })
+            >>> J._read_row_runs(np.array([0, 2]), np.array([1, 4])) == J[np.array([0, 2, 3])]
+            True
+        """
+
+        def read_ranges(T, ranges: list[tuple[int, int]]) -> list[np.ndarray]:
+            return [np.asarray(T[st:end]) for st, end in ranges]
+
+        def read_all(keys: list[str], ranges: list[tuple[int, int]]) -> dict[str, list[np.ndarray]]:
+            # With a read pool, each key's ranges are split into one batch of reads per worker; serially, each
+            # key is read as one batch.
+            n_batches = max(1, min(self._read_workers, len(ranges)))
+            batches = [ranges[i::n_batches] for i in range(n_batches)]
+            reads = [(key, partial(read_ranges, ranges=b)) for key in keys for b in batches]
+            parts = self._read_tensors(reads, archive=archive)
+            return {
+                key: [parts[k * n_batches + i % n_batches][i // n_batches] for i in range(len(ranges))]
+                for k, key in enumerate(keys)
+            }
+
+        tensors, schema = {}, {}
+        for dim in range(self.max_n_dims):
+            if dim > 0:
+                bounds_ranges = [(max(int(st) - 1, 0), int(end)) for st, end in zip(starts, stops)]
+                lengths, new_starts, new_stops = [], [], []
+                bounds_key = f"dim{dim}/bounds"
+                for st, ends in zip(starts, read_all([bounds_key], bounds_ranges)[bounds_key]):
+                    first = 0 if st == 0 else (int(ends[0]) if len(ends) else 0)
+                    ends = ends if st == 0 else ends[1:]
+                    lengths.append(np.diff(ends, prepend=first))
+                    new_starts.append(first)
+                    new_stops.append(int(ends[-1]) if len(ends) else first)
+                tensors[f"dim{dim}/bounds"] = np.cumsum(np.concatenate(lengths))
+                starts, stops = new_starts, new_stops
+
+            # The archive rejects empty reads at the end of a tensor, so empty ranges are skipped (and a key
+            # whose ranges are all empty reads the empty range at the start instead).
+            ranges = [(int(st), int(end)) for st, end in zip(starts, stops) if end > st] or [(0, 0)]
+            keys = sorted(self.keys_at_dim(dim))
+            for key, parts in read_all([f"dim{dim}/{key}" for key in keys], ranges).items():
+                tensors[key] = np.concatenate(parts)
+                schema[key.split("/", 1)[1]] = tensors[key].dtype
+        return self.__class__(processed_tensors=tensors, schema=schema)
+
+    def _sort_order(self, by: str | Sequence[str], descending: bool) -> tuple[int, np.ndarray, np.ndarray]:
+        """Returns the dim of ``by``, the segment lengths at that dim and a stable in-segment sort order."""
+        by = [by] if isinstance(by, str) else list(by)
+        dims = {self._get_dim(k) for k in by}
+        if len(dims) != 1:
+            raise ValueError(
+                f"All sort keys must be at the same dim; got {sorted(by)} at dims {sorted(dims)}."
+            )
+        dim = dims.pop()
+
+        lengths = np.diff(self._segment_offsets(dim - 1, dim)) if dim > 0 else np.array([len(self)])
+        segment_ids = np.repeat(np.arange(len(lengths)), lengths)
+
+        sort_keys = []
+        for key in reversed(by):
+            values = self.tensors[f"dim{dim}/{key}"]
+            if descending:
+                values = -np.unique(values, return_inverse=True)[1]
+            sort_keys.append(values)
+        sort_keys.append(segment_ids)
+
+        return dim, lengths, np.lexsort(sort_keys)
+
+    def sort(self, by: str | Sequence[str], descending: bool = False) -> JointNestedRaggedTensorDict:
+        """Sorts the elements at the dim of ``by`` within each segment defined by that dim's bounds.
+
+        All keys at that dim are permuted consistently, and each element carries its descendants at deeper
+        dims along with it. The order is computed by a single ``np.lexsort`` over (segment id, sort keys), so
+        the sort is stable: elements with equal keys keep their original relative order, in both directions.
+
+        Args:
+            by: The key, or a list of keys at the same dim in order of priority, to sort by.
+            descending: If `True`, sort from largest to smallest.
+
+        Raises:
+            ValueError: If the keys in ``by`` are not all at the same dim.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[3,                 1,         2     ], [5,   4        ]],
+            ...     "code": [[[7,     2,   7  ], [3,   1 ], [4,  2]], [[3], [9, 1,  9]]],
+            ...     "val":  [[[0.5, 1.5, 2.5], [3.5, 0], [1, 2]], [[3], [3, 2., 0]]],
+            ... })
+            >>> S = J.sort("code")
+            >>> S.tensors["dim2/code"], S.tensors["dim2/val"]
+            (array([2, 7, 7, 1, 3, 2, 4, 3, 1, 9, 9], dtype=uint8),
+             array([1.5, 0.5, 2.5, 0. , 3.5, 2. , 1. , 3. , 2. , 3. , 0. ], dtype=float32))
+            >>> J.sort("code", descending=True).tensors["dim2/val"]
+            array([0.5, 2.5, 1.5, 3.5, 0. , 1. , 2. , 3. , 3. , 0. , 2. ], dtype=float32)
+            >>> J.sort(["code", "val"], descending=True).tensors["dim2/val"]
+            array([2.5, 0.5, 1.5, 3.5, 0. , 1. , 2. , 3. , 3. , 0. , 2. ], dtype=float32)
+
+            Sorting at an outer dim moves each element's nested values with it:
+
+            >>> S = J.sort("T")
+            >>> S.tensors["dim1/T"]
+            array([1, 2, 3, 4, 5], dtype=uint8)
+            >>> S.to_dense()["code"]
+            array([[[3, 1, 0],
+                    [4, 2, 0],
+                    [7, 2, 7]],
+            <BLANKLINE>
+                   [[9, 1, 9],
+                    [3, 0, 0],
+                    [0, 0, 0]]], dtype=uint8)
+            >>> J.sort(["T", "code"])
+            Traceback (most recent call last):
+                ...
+            ValueError: All sort keys must be at the same dim; got ['T', 'code'] at dims [1, 2].
+        """
+        dim, _, order = self._sort_order(by, descending)
+        return self._take_subtree(dim, order, self.tensors.get(f"dim{dim}/bounds"))
+
+    def topk(
+        self, key: str, k: int, largest: bool = True, sorted: bool = True
+    ) -> JointNestedRaggedTensorDict:
+        """Keeps the ``k`` elements with the largest (or smallest) ``key`` in each segment at ``key``'s dim.
+
+        Segments with fewer than ``k`` elements are kept whole. Ties are broken in favor of the element that
+        comes first. All keys at that dim, and all deeper dims, are selected consistently.
+
+        Args:
+            key: The key to rank elements by.
+            k: The maximum number of elements to keep per segment.
+            largest: If `True`, keep the largest values; otherwise, keep the smallest.
+            sorted: If `True`, the kept elements are ordered by ``key`` (descending if ``largest``); otherwise
+                they keep their original relative order.
+
+        Raises:
+            ValueError: If ``k`` is negative.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[3,                 1,         2     ], [5,   4        ]],
+            ...     "code": [[[7,     2,   7  ], [3,   1 ], [4,  2]], [[3], [9, 1,  9]]],
+            ... })
+            >>> J.topk("T", k=2).tensors["dim1/T"]
+            array([3, 2, 5, 4], dtype=uint8)
+            >>> J.topk("T", k=2, sorted=False).tensors["dim1/T"]
+            array([3, 2, 5, 4], dtype=uint8)
+            >>> J.topk("T", k=2, largest=False).to_dense()["code"]
+            array([[[3, 1, 0],
+                    [4, 2, 0]],
+            <BLANKLINE>
+                   [[9, 1, 9],
+                    [3, 0, 0]]], dtype=uint8)
+            >>> T = J.topk("code", k=1)
+            >>> T.tensors["dim2/code"], T.tensors["dim2/bounds"]
+            (array([7, 3, 4, 3, 9], dtype=uint8), array([1, 2, 3, 4, 5]))
+            >>> J.topk("code", k=-1)
+            Traceback (most recent call last):
+                ...
+            ValueError: k must be non-negative; got -1
+        """
+        if k < 0:
+            raise ValueError(f"k must be non-negative; got {k}")
+
+        dim, lengths, order = self._sort_order(key, descending=largest)
+        segment_starts = np.cumsum(lengths) - lengths
+        rank_in_segment = np.arange(len(order)) - np.repeat(segment_starts, lengths)
+        idx = order[rank_in_segment < k]
+        if not sorted:
+            idx = np.sort(idx)
+        return self._take_subtree(dim, idx, np.cumsum(np.minimum(lengths, k)))
+
+    def truncate(self, dim: int, max_len: int, side: str = "right") -> JointNestedRaggedTensorDict:
+        """Clips every segment at ``dim`` to at most ``max_len`` elements, across all rows at once.
+
+        The kept elements, and all of their descendants at deeper dims, are gathered with one fancy-index per
+        key, and the bounds at ``dim`` and every deeper dim are recomputed from the clipped lengths.
+
+        Args:
+            dim: The (possibly negative) dim whose segments are clipped. Must be at least 1.
+            max_len: The maximum number of elements to keep per segment.
+            side: Which side to truncate from, as in Hugging Face's ``truncation_side``: ``"right"`` keeps the
+                first ``max_len`` elements and ``"left"`` keeps the last ``max_len`` elements.
+
+        Raises:
+            ValueError: If ``dim``, ``max_len`` or ``side`` is invalid.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "id":  [[[1, 2,   3], [3,   4], [1, 2  ]], [[3], [3,   2, 2]]],
+            ... })
+            >>> J.truncate(dim=1, max_len=2, side="left").to_dense()["id"]
+            array([[[3, 4, 0],
+                    [1, 2, 0]],
+            <BLANKLINE>
+                   [[3, 0, 0],
                     [3, 2, 2]]], dtype=uint8)
-            >>> dense_dict['val']
-            array([[[1. , 0.2, 0. ],
-                    [0. , 3.1, 0. ],
-                    [0. , 1. , 2.2]],
+            >>> J.truncate(dim=-1, max_len=1).to_dense()["id"]
+            array([[[1],
+                    [3],
+                    [1]],
             <BLANKLINE>
-                   [[0. , 0. , 0. ],
-                    [0. , 0. , 3. ],
-                    [3.3, 2. , 0. ]]], dtype=float32)
-            >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3]]})
-            >>> dense_dict = J.to_dense()
-            >>> assert dense_dict.keys() == {'T', 'dim1/mask'}
-            >>> dense_dict['dim1/mask']
-            array([[ True,  True,  True]])
-            >>> dense_dict['T']
-            array([[1, 2, 3]], dtype=uint8)
-            >>> J.to_dense(padding_side="up")
+                   [[3],
+                    [3],
+                    [0]]], dtype=uint8)
+            >>> T = J.truncate(dim=2, max_len=2, side="left")
+            >>> T.tensors["dim2/id"], T.tensors["dim2/bounds"]
+            (array([2, 3, 3, 4, 1, 2, 3, 2, 2], dtype=uint8), array([2, 4, 6, 7, 9]))
+            >>> J.truncate(dim=0, max_len=1)
             Traceback (most recent call last):
                 ...
-            ValueError: padding_side must be 'left' or 'right'; got 'up'
+            ValueError: Can only truncate dims 1 through 2 (or -2 through -1); got 0
+            >>> J.truncate(dim=1, max_len=1, side="middle")
+            Traceback (most recent call last):
+                ...
+            ValueError: side must be 'left' or 'right'; got 'middle'
         """
+        target_dim = self.max_n_dims + dim if dim < 0 else dim
+        if not 1 <= target_dim < self.max_n_dims:
+            raise ValueError(
+                f"Can only truncate dims 1 through {self.max_n_dims - 1} "
+                f"(or {1 - self.max_n_dims} through -1); got {dim}"
+            )
+        if max_len < 0:
+            raise ValueError(f"max_len must be non-negative; got {max_len}")
 
-        out = {key: self.tensors[f"dim0/{key}"] for key in self.keys_at_dim(0)}
-
-        shape = [len(self)]
-        L = shape
-        indices = [tuple([])]
+        offsets = self._segment_offsets(target_dim - 1, target_dim)
+        lengths = np.diff(offsets)
+        kept = np.minimum(lengths, max_len)
 
-        match padding_side:
+        match side:
+            case "right":
+                starts = offsets[:-1]
             case "left":
+                starts = offsets[1:] - kept
+            case _:
+                raise ValueError(f"side must be 'left' or 'right'; got '{side}'")
 
-                def offset_fn(ln: int, max_ln: int) -> int:
-                    return max_ln - ln
+        return self._take_subtree(target_dim, self._concat_ranges(starts, kept), np.cumsum(kept))
 
-            case "right":
+    @staticmethod
+    def _segment_searchsorted(
+        values: np.ndarray | Callable[[np.ndarray], np.ndarray],
+        offsets: np.ndarray,
+        targets: NUM_T | np.ndarray,
+        side: str = "left",
+    ) -> np.ndarray:
+        """Returns, for each segment ``values[offsets[i]:offsets[i + 1]]``, the absolute insertion point of
+        ``targets[i]`` (or of the scalar ``targets``) as `np.searchsorted` would find it in that segment.
+
+        All segments are bisected together, so this takes ``O(log(max segment length))`` vectorized steps over
+        the segments rather than a Python loop over them. Each segment must be sorted in ascending order.
+        ``values`` may also be a function returning the values at an (ascending) array of positions, so that
+        only the probed values need to be read.
+
+        Examples:
+            >>> vals = np.array([1, 3, 3, 5, 2, 4, 9])
+            >>> offsets = np.array([0, 4, 4, 7])
+            >>> JointNestedRaggedTensorDict._segment_searchsorted(vals, offsets, 3)
+            array([1, 4, 5])
+            >>> JointNestedRaggedTensorDict._segment_searchsorted(vals, offsets, 3, side="right")
+            array([3, 4, 5])
+            >>> JointNestedRaggedTensorDict._segment_searchsorted(vals, offsets, np.array([6, 0, 10]))
+            array([4, 4, 7])
+        """
+        if side not in ("left", "right"):
+            raise ValueError(f"side must be 'left' or 'right'; got '{side}'")
+
+        lo, hi = offsets[:-1].copy(), offsets[1:].copy()
+        targets = np.broadcast_to(targets, lo.shape)
+        if isinstance(values, np.ndarray):
+            while (active := lo < hi).any():
+                mid = (lo + hi) // 2
+                v = values[np.minimum(mid, len(values) - 1)]
+                go_right = active & ((v < targets) if side == "left" else (v <= targets))
+                lo = np.where(go_right, mid + 1, lo)
+                hi = np.where(active & ~go_right, mid, hi)
+            return lo
+
+        # Each probe may read from disk, so only the segments still being searched are probed.
+        while len(active := np.flatnonzero(lo < hi)):
+            mid = (lo[active] + hi[active]) // 2
+            v = values(mid)
+            go_right = (v < targets[active]) if side == "left" else (v <= targets[active])
+            lo[active[go_right]] = mid[go_right] + 1
+            hi[active[~go_right]] = mid[~go_right]
+        return lo
+
+    def _sorted_key_segments(
+        self, key: str, archive=None
+    ) -> tuple[int, np.ndarray | Callable[[np.ndarray], np.ndarray], np.ndarray]:
+        """Returns the dim of ``key``, its values (for `_segment_searchsorted`) and its segments' offsets.
+
+        In memory, the values are the flat tensor. When backed by disk, only the bounds at ``key``'s dim (the
+        offsets of every segment searched) are read up front, and the values are returned as a function
+        reading just the probed positions. Segments shorter than ``_WHOLE_SEGMENT_SEARCH_LEN`` are instead
+        read whole up front (see `_gather_ranges`), as probing them would cost more reads than values; if
+        every segment is, the values are the flat tensor, as in memory.
 
-                def offset_fn(ln: int, max_ln: int) -> int:
-                    return 0
+        Examples:
+            >>> import tempfile
+            >>> J = JointNestedRaggedTensorDict({"T": [[1, 3, 3, 5], [2, 4, 9]], "id": [1, 2]})
+            >>> dim, values, offsets = J._sorted_key_segments("T")
+            >>> dim, values, offsets
+            (1, array([1, 3, 3, 5, 2, 4, 9], dtype=uint8), array([0, 4, 7]))
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+            ...     J_disk._sorted_key_segments("T")  # Both segments are short enough to read whole.
+            (1, array([1, 3, 3, 5, 2, 4, 9], dtype=uint8), array([0, 4, 7]))
+            >>> J._sorted_key_segments("id")
+            Traceback (most recent call last):
+                ...
+            ValueError: Key 'id' is at dim 0, so it has no per-row segments to search.
+        """
+        dim = self._get_dim(key)
+        if dim == 0:
+            raise ValueError(f"Key '{key}' is at dim 0, so it has no per-row segments to search.")
+        with self._tensor_at_key(f"dim{dim}/bounds", archive=archive) as B:
+            offsets = np.concatenate([[0], B[:]])
+        key = f"dim{dim}/{key}"
+        if self._tensors is not None:
+            return dim, self._tensors[key], offsets
+
+        lengths = np.diff(offsets)
+        whole = lengths < _WHOLE_SEGMENT_SEARCH_LEN
+        read_lengths = np.where(whole, lengths, 0)
+        read_offsets = np.cumsum(read_lengths) - read_lengths
+        read_vals = self._gather_ranges(key, offsets[:-1], read_lengths, archive) if whole.any() else None
+        if whole.all():
+            return dim, read_vals, offsets
+
+        def probe(positions: np.ndarray) -> np.ndarray:
+            if read_vals is None:
+                return self._gather(key, positions, archive=archive)
+            segment = np.searchsorted(offsets, positions, side="right") - 1
+            was_read = whole[segment]
+            out = np.empty(len(positions), dtype=read_vals.dtype)
+            s = segment[was_read]
+            out[was_read] = read_vals[read_offsets[s] + positions[was_read] - offsets[s]]
+            if not was_read.all():
+                out[~was_read] = self._gather(key, positions[~was_read], archive=archive)
+            return out
+
+        return dim, probe, offsets
+
+    def searchsorted(self, key: str, values: NUM_T | np.ndarray, side: str = "left") -> np.ndarray:
+        """Finds, within each row, where ``values`` would be inserted into ``key`` to maintain its order.
+
+        This is a batched `np.searchsorted` over the segments at ``key``'s dim (one per element at the
+        dim above it), which must each be sorted in ascending order (e.g., timestamps within each subject).
 
-            case _:
-                raise ValueError(f"padding_side must be 'left' or 'right'; got '{padding_side}'")
+        Args:
+            key: The sorted key to search. Must be at dim 1 or deeper.
+            values: The value to search for in every segment, or an array with one value per segment.
+            side: As in `np.searchsorted`: ``"left"`` returns the first suitable position and ``"right"`` the
+                last.
 
-        def pad_slice(ln: int, max_ln: int) -> slice:
-            offset = offset_fn(ln, max_ln)
-            return slice(offset, offset + ln)
+        Returns:
+            The insertion points, relative to the start of each segment.
 
-        for dim in range(1, self.max_n_dims):
-            old_max_ln = max(L)
-            indices = list(
-                itertools.chain.from_iterable(
-                    (base_idx + (offset_fn(ln, old_max_ln) + j,) for j in range(ln))
-                    for base_idx, ln in zip(indices, L)
-                )
-            )
+        Raises:
+            ValueError: If ``key`` is at dim 0 or ``side`` is invalid.
 
-            B = self.tensors[f"dim{dim}/bounds"]
-            L = np.concatenate([[B[0]], np.diff(B, axis=0)], axis=0)
-            max_ln = max(L)
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[1,     3,    3,   5  ], [2,   4,     9    ]],
+            ...     "code": [[[1, 2], [3], [4], [5]], [[6], [7, 8], [9]]],
+            ... })
+            >>> J.searchsorted("T", 3)
+            array([1, 1])
+            >>> J.searchsorted("T", 3, side="right")
+            array([3, 1])
+            >>> J.searchsorted("T", np.array([6, 0]))
+            array([4, 0])
+            >>> J.searchsorted("code", 5)
+            array([2, 1, 1, 0, 0, 0, 0])
+        """
+        with self._archive_ctx() as archive:
+            dim, T, offsets = self._sorted_key_segments(key, archive=archive)
+            return self._segment_searchsorted(T, offsets, values, side=side) - offsets[:-1]
 
-            shape.append(max_ln)
+    def slice_by_value(
+        self, key: str, lo: NUM_T | np.ndarray | None = None, hi: NUM_T | np.ndarray | None = None
+    ) -> JointNestedRaggedTensorDict:
+        """Keeps, within each row, the elements whose sorted ``key`` lies in the half-open ``[lo, hi)``.
 
-            slice_indices = [idx + (pad_slice(ln, max_ln),) for idx, ln in zip(indices, L)]
+        The window edges are found with `searchsorted`, and the kept elements (with all of their descendants)
+        are gathered in one pass. When backed by disk, the bounds at ``key``'s dim, the probed values of
+        ``key`` (see `_sorted_key_segments`), the keys at shallower dims and, at ``key``'s dim and deeper,
+        only the elements within the windows (with nearby windows sharing reads, see `_gather_ranges`) are
+        read.
 
-            if self.keys_at_dim(dim):
-                out[f"dim{dim}/mask"] = np.zeros(shape=tuple(shape), dtype=bool)
-                for idx in slice_indices:
-                    out[f"dim{dim}/mask"][idx] = True
+        Args:
+            key: The key to window by, sorted in ascending order within each segment. Must be at dim 1 or
+                deeper.
+            lo: The inclusive lower edge, as a scalar or with one value per segment. `None` means unbounded.
+            hi: The exclusive upper edge, as a scalar or with one value per segment. `None` means unbounded.
 
-            for key in self.keys_at_dim(dim):
-                if len(self.tensors[f"dim{dim}/{key}"]) == 0:
-                    continue
+        Raises:
+            ValueError: If ``key`` is at dim 0.
 
-                out[key] = np.zeros(shape=tuple(shape), dtype=self.tensors[f"dim{dim}/{key}"].dtype)
-                st = 0
-                for idx, b in zip(slice_indices, B):
-                    out[key][idx] = self.tensors[f"dim{dim}/{key}"][st:b]
-                    st = b
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[1,     3,    3,   5  ], [2,   4,     9    ]],
+            ...     "code": [[[1, 2], [3], [4], [5]], [[6], [7, 8], [9]]],
+            ... })
+            >>> W = J.slice_by_value("T", 3, 9)
+            >>> W.tensors["dim1/T"], W.tensors["dim2/code"]
+            (array([3, 3, 5, 4], dtype=uint8), array([3, 4, 5, 7, 8], dtype=uint8))
+            >>> W.to_dense()["T"]
+            array([[3, 3, 5],
+                   [4, 0, 0]], dtype=uint8)
 
-        return out
+            Per-row windows, e.g. a different history cut-off for each subject, are given as arrays:
+
+            >>> J.slice_by_value("T", hi=np.array([3, 10])).to_dense()["T"]
+            array([[1, 0, 0],
+                   [2, 4, 9]], dtype=uint8)
+
+            Disk-backed collections give the same result:
+
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as dirpath:
+            ...     fp = Path(dirpath) / "tensors.nrt"
+            ...     J.save(fp)
+            ...     JointNestedRaggedTensorDict(tensors_fp=fp).slice_by_value("T", 3, 9) == W
+            True
+        """
+        with self._archive_ctx() as archive:
+            dim, T, offsets = self._sorted_key_segments(key, archive=archive)
+            starts = offsets[:-1] if lo is None else self._segment_searchsorted(T, offsets, lo)
+            ends = offsets[1:] if hi is None else self._segment_searchsorted(T, offsets, hi)
+            kept = np.maximum(ends - starts, 0)
+            return self._take_subtree(
+                dim, self._concat_ranges(starts, kept), np.cumsum(kept), archive=archive
+            )
+
+    def expand_to_dim(self, key: str, dim: int, out_key: str | None = None) -> JointNestedRaggedTensorDict:
+        """Broadcasts an outer key down to every element at the deeper ``dim`` that descends from it.
+
+        Each value is repeated over the segment of elements it owns at ``dim``, with segment lengths composed
+        from the bounds (no dense intermediate). This is the standalone form of ``flatten(fill="repeat")``.
+
+        Args:
+            key: The key to broadcast.
+            dim: The (possibly negative) dim to broadcast ``key`` to. Must be at least as deep as ``key``.
+            out_key: The name of the resulting key at ``dim``. If `None`, ``key`` itself is moved to ``dim``;
+                otherwise, ``key`` is kept and ``out_key`` is added (or replaced) alongside it.
+
+        Raises:
+            ValueError: If ``dim`` is out of range or shallower than the dim of ``key``.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "S":   [1,                                  2                 ],
+            ...     "T":   [[1,           2,        3       ], [4,   5          ]],
+            ...     "val": [[[1, 0.5, 0], [3.5, 0], [1, 2.5]], [[3], [3.5, 2, 0]]],
+            ... })
+            >>> E = J.expand_to_dim("T", dim=2, out_key="T_val")
+            >>> E.tensors["dim2/T_val"]
+            array([1, 1, 1, 2, 2, 3, 3, 4, 5, 5, 5], dtype=uint8)
+            >>> sorted(E.keys())
+            ['S', 'T', 'T_val', 'val']
+            >>> E = J.expand_to_dim("S", dim=-1)
+            >>> E.tensors["dim2/S"]
+            array([1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2], dtype=uint8)
+            >>> sorted(E.keys_at_dim(0)), sorted(E.keys_at_dim(2))
+            ([], ['S', 'val'])
+            >>> J.expand_to_dim("val", dim=1)
+            Traceback (most recent call last):
+                ...
+            ValueError: Can't expand key 'val' at dim 2 to the shallower dim 1.
+        """
+        src_dim = self._get_dim(key)
+        target_dim = self.max_n_dims + dim if dim < 0 else dim
+        if not 0 <= target_dim < self.max_n_dims:
+            raise ValueError(f"dim must be in [{-self.max_n_dims}, {self.max_n_dims}); got {dim}")
+        if target_dim < src_dim:
+            raise ValueError(f"Can't expand key '{key}' at dim {src_dim} to the shallower dim {target_dim}.")
+
+        lengths = np.diff(self._segment_offsets(src_dim, target_dim))
+        values = np.repeat(self.tensors[f"dim{src_dim}/{key}"], lengths)
+        return self.assign(**{out_key or key: RaggedKeyView(self, target_dim, values)})
 
     def squeeze(self, dim: int) -> JointNestedRaggedTensorDict:
-        """Squeeze these tensors to remove an existing, singleton first dimension.
+        """Squeeze these tensors to remove an existing singleton dimension.
+
+        Dim ``d`` is a singleton if every element at ``d - 1`` owns exactly one element at ``d`` (or, for
+        ``d == 0``, if there is a single row). Keys at ``d`` move up to ``d - 1`` and deeper dims shift up by
+        one; only the ``dim{d}/bounds`` array is dropped, and every other array is reused without copying.
+
+        Squeezing dim 0 requires exactly one row. Earlier versions accepted any number of rows and merged
+        them all into one sequence; ``flatten(start_dim=0, end_dim=1)`` still does that.
 
         Args:
-            dim: This is added for compatibility with the PyTorch signature, but must be 0 here.
+            dim: The (possibly negative) dimension to remove.
 
         Raises:
-            ValueError: If dim != 0 or if the tensors do not have a singleton dimension at the specified
-                level.
+            ValueError: If ``dim`` is out of range or if the tensors do not have a singleton dimension at the
+                specified level (for dim 0, if there is not exactly one row). Errors report ``dim`` as given.
 
         Examples:
             >>> J = JointNestedRaggedTensorDict({
@@ -1456,7 +4153,35 @@ class JointNestedRaggedTensorDict:
             >>> J.squeeze(dim=1)
             Traceback (most recent call last):
                 ...
-            ValueError: Only supports dim = 0 for now; got 1
+            ValueError: Can't squeeze dim 1: not every element at dim 0 has exactly one element at dim 1.
+
+            Inner singleton dims can be squeezed too:
+
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":  [[1,        2     ], [3     ]],
+            ...     "id": [[[[1, 2]], [[3]]], [[[4]]]],
+            ... })
+            >>> S = J.squeeze(dim=2)
+            >>> S.to_dense()["id"]
+            array([[[1, 2],
+                    [3, 0]],
+            <BLANKLINE>
+                   [[4, 0],
+                    [0, 0]]], dtype=uint8)
+            >>> S.tensors["dim2/id"] is J.tensors["dim3/id"]
+            True
+            >>> J.squeeze(dim=-1)
+            Traceback (most recent call last):
+                ...
+            ValueError: Can't squeeze dim -1: not every element at dim 2 has exactly one element at dim 3.
+            >>> J.squeeze(dim=-5)
+            Traceback (most recent call last):
+                ...
+            ValueError: dim must be in [-4, 4); got -5
+            >>> J.squeeze(dim=0)
+            Traceback (most recent call last):
+                ...
+            ValueError: Can't squeeze dim 0: there are 2 rows, not 1.
 
             A squeezed tensor is interchangeable with one constructed directly from the
             unwrapped data — they have the same schema and can be concatenated:
@@ -1472,8 +4197,17 @@ class JointNestedRaggedTensorDict:
             >>> J.squeeze(0).schema == J_direct.schema
             True
         """
-        if dim != 0:
-            raise ValueError(f"Only supports dim = 0 for now; got {dim}")
+        given_dim = dim
+        if dim < 0:
+            dim = self.max_n_dims + dim
+        if not 0 <= dim < self.max_n_dims:
+            raise ValueError(f"dim must be in [{-self.max_n_dims}, {self.max_n_dims}); got {given_dim}")
+
+        if dim > 0:
+            return self._squeeze_inner(dim, given_dim)
+
+        if len(self) != 1:
+            raise ValueError(f"Can't squeeze dim {given_dim}: there are {len(self)} rows, not 1.")
 
         out_tensors = {}
         out_schema = {}
@@ -1492,14 +4226,38 @@ class JointNestedRaggedTensorDict:
 
         return self.__class__(processed_tensors=out_tensors, schema=out_schema)
 
+    def _squeeze_inner(self, dim: int, given_dim: int) -> JointNestedRaggedTensorDict:
+        """Removes the singleton dimension ``dim >= 1``, passed to `squeeze` as ``given_dim``."""
+        B = self.tensors[f"dim{dim}/bounds"]
+        if len(B) and (B[0] != 1 or np.any(np.diff(B) != 1)):
+            raise ValueError(
+                f"Can't squeeze dim {given_dim}: not every element at dim {dim - 1} has exactly one element "
+                f"at dim {dim}."
+            )
+
+        out_tensors = {}
+        for k, T in self.tensors.items():
+            d, key = self._get_dim_from_key_str(k), k.split("/")[1]
+            if d < dim:
+                out_tensors[k] = T
+            elif d > dim or key != "bounds":
+                out_tensors[f"dim{d - 1}/{key}"] = T
+
+        return self.__class__(processed_tensors=out_tensors, schema=self.schema)
+
     def unsqueeze(self, dim: int) -> JointNestedRaggedTensorDict:
-        """Expands these tensors to have a new, singleton first dimension.
+        """Expands these tensors to have a new singleton dimension at ``dim``.
+
+        As in `torch.unsqueeze`, every key that spans dim ``dim - 1`` or deeper gains the new dimension: keys
+        at ``dim - 1`` move down into the new dim ``dim`` (which gives each of their elements exactly one
+        child) and deeper dims shift down by one, while shallower keys are unchanged. Only the new
+        ``dim{dim}/bounds`` array (an ``arange``) is created; every other array is reused without copying.
 
         Args:
-            dim: This is added for compatibility with the PyTorch signature, but must be 0 here.
+            dim: The (possibly negative) position of the new dimension, in ``[0, max_n_dims]``.
 
         Raises:
-            ValueError: If dim != 0 or if the tensors are exclusively non-ragged 1D tensors.
+            ValueError: If ``dim`` is out of range.
 
         Examples:
             >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3]]}, schema={"T": int})
@@ -1530,13 +4288,45 @@ class JointNestedRaggedTensorDict:
                     [[3. , 0. , 0. ],
                      [3.3, 2. , 0. ],
                      [0. , 0. , 0. ]]]])
-            >>> J.unsqueeze(dim=1)
+
+            New dims can be added at any depth and are undone by `squeeze`:
+
+            >>> U = J.unsqueeze(dim=2)
+            >>> U.tensors["dim2/bounds"], sorted(U.keys_at_dim(1)), sorted(U.keys_at_dim(3))
+            (array([1, 2, 3, 4, 5]), [], ['id', 'val'])
+            >>> U.to_dense()["id"].shape
+            (2, 3, 1, 3)
+            >>> U.squeeze(dim=2) == J
+            True
+            >>> J.unsqueeze(dim=-1).to_dense()["id"].shape
+            (2, 3, 3, 1)
+            >>> J.unsqueeze(dim=1).to_dense()["T"]
+            array([[1],
+                   [2]])
+            >>> J.unsqueeze(dim=4)
+            Traceback (most recent call last):
+                ...
+            ValueError: dim must be in [-4, 3]; got 4
+            >>> J.unsqueeze(dim=-6)
             Traceback (most recent call last):
                 ...
-            ValueError: Only supports dim = 0 for now; got 1
+            ValueError: dim must be in [-4, 3]; got -6
         """
-        if dim != 0:
-            raise ValueError(f"Only supports dim = 0 for now; got {dim}")
+        given_dim = dim
+        if dim < 0:
+            dim = self.max_n_dims + 1 + dim
+        if not 0 <= dim <= self.max_n_dims:
+            raise ValueError(f"dim must be in [{-self.max_n_dims - 1}, {self.max_n_dims}]; got {given_dim}")
+
+        if dim > 0:
+            out_tensors = {f"dim{dim}/bounds": np.arange(1, self._n_elements_at_dim(dim - 1) + 1)}
+            for k, T in self.tensors.items():
+                d, key = self._get_dim_from_key_str(k), k.split("/")[1]
+                if d < dim - 1 or (d == dim - 1 and key == "bounds"):
+                    out_tensors[k] = T
+                else:
+                    out_tensors[f"dim{d + 1}/{key}"] = T
+            return self.__class__(processed_tensors=out_tensors, schema=self.schema)
 
         out_tensors = {}
 
@@ -1558,18 +4348,35 @@ class JointNestedRaggedTensorDict:
 
         return self.__class__(processed_tensors=out_tensors, schema=self.schema)
 
-    def flatten(self, dim: int = -1) -> JointNestedRaggedTensorDict:
-        """Flattens these tensors along the specified dimension. Currently, only supports dim = -1.
+    def flatten(
+        self,
+        dim: int | None = None,
+        *,
+        start_dim: int | None = None,
+        end_dim: int | None = None,
+        fill: str = "zero",
+    ) -> JointNestedRaggedTensorDict:
+        """Flattens the run of adjacent dims ``start_dim`` through ``end_dim`` into a single dim.
 
-        If a tensor exists at the dimension that greater dimensions will be flattened into, it will be filled
-        with zeros at all added positions.
-        TODO(mmd): Consider supporting other modes, such as duplicating the value.
+        The merged dim has one element per element at ``end_dim``, and its bounds (the segments owned by each
+        element at ``start_dim - 1``) are composed from the bounds of the merged dims without densifying. Keys
+        at ``end_dim`` and deeper keep their values unchanged. Keys at the collapsed outer dims
+        (``start_dim`` through ``end_dim - 1``) are expanded onto the positions of the merged dim according to
+        ``fill``; values of elements that own no positions at ``end_dim`` are dropped in either mode.
 
         Args:
-            dim: The dimension along which to flatten the tensors. Must be -1 currently.
+            dim: The legacy single-dim form: ``flatten(dim=d)`` merges dim ``d`` into dim ``d - 1`` and is
+                equivalent to ``flatten(start_dim=d - 1, end_dim=d)``. Defaults to ``-1`` if neither
+                ``start_dim`` nor ``end_dim`` is given. May not be combined with them.
+            start_dim: The first (outermost) dim to merge, as in `torch.flatten`. Defaults to ``0``.
+            end_dim: The last (innermost) dim to merge, as in `torch.flatten`. Defaults to ``-1``.
+            fill: How keys at the collapsed outer dims are expanded. ``"zero"`` places each value at the first
+                position its element owns and fills the rest with zeros; ``"repeat"`` broadcasts each value to
+                every position its element owns.
 
         Raises:
-            ValueError: If dim != -1.
+            ValueError: If the dims are out of range or do not span at least two dims, if ``dim`` is combined
+                with ``start_dim`` / ``end_dim``, or if ``fill`` is invalid.
 
         Examples:
             >>> J = JointNestedRaggedTensorDict({
@@ -1648,7 +4455,50 @@ class JointNestedRaggedTensorDict:
             >>> J.flatten(dim=0)
             Traceback (most recent call last):
                 ...
-            ValueError: Only supports dim = -1 or 3 for now; got 0
+            ValueError: Can only flatten a run of at least two dims within [0, 3]; got start_dim=-1, end_dim=0
+
+        Any run of adjacent dims can be merged. Here the event and measurement dims of 4-dim data are merged
+        while the innermost dim is kept, and the event-level key is broadcast to every measurement:
+
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "S":  [1, 2],
+            ...     "ts": [[1,                   2       ], [3               ]],
+            ...     "id": [[[1,      2        ], [3      ]], [[4,      5    ]]],
+            ...     "D":  [[[[5, 6], [7, 8, 9]], [[10]]  ], [[[11, 12], [13]]]],
+            ... })
+            >>> F = J.flatten(start_dim=1, end_dim=2, fill="repeat")
+            >>> F.tensors["dim1/ts"], F.tensors["dim1/id"], F.tensors["dim1/bounds"]
+            (array([1, 1, 2, 3, 3], dtype=uint8), array([1, 2, 3, 4, 5], dtype=uint8), array([3, 5]))
+            >>> F.to_dense()["D"]
+            array([[[ 5,  6,  0],
+                    [ 7,  8,  9],
+                    [10,  0,  0]],
+            <BLANKLINE>
+                   [[11, 12,  0],
+                    [13,  0,  0],
+                    [ 0,  0,  0]]], dtype=uint8)
+            >>> J.flatten(start_dim=1).to_dense()["ts"]
+            array([[1, 0, 0, 0, 0, 2],
+                   [3, 0, 0, 0, 0, 0]], dtype=uint8)
+            >>> F = J.flatten(start_dim=0, end_dim=1, fill="repeat")
+            >>> len(F), F.tensors["dim0/S"]
+            (3, array([1, 1, 2], dtype=uint8))
+
+        Elements that own no positions at ``end_dim`` contribute no values, including when they come last:
+
+            >>> J = JointNestedRaggedTensorDict({"T": [1, 2, 3], "id": [[1, 2], [3], []]})
+            >>> J.flatten().tensors["dim0/T"]
+            array([1, 0, 2], dtype=uint8)
+            >>> J.flatten(fill="repeat").tensors["dim0/T"]
+            array([1, 1, 2], dtype=uint8)
+            >>> J.flatten(0, start_dim=0)
+            Traceback (most recent call last):
+                ...
+            ValueError: `dim` may not be combined with `start_dim` or `end_dim`.
+            >>> J.flatten(fill="mean")
+            Traceback (most recent call last):
+                ...
+            ValueError: fill must be 'zero' or 'repeat'; got 'mean'
 
         The length should expand after flattening.
 
@@ -1678,67 +4528,416 @@ class JointNestedRaggedTensorDict:
             >>> str(caught[0].message)  # doctest: +ELLIPSIS
             "flatten(): all inner ragged rows are empty, ... key(s) ['T'] will be dropped..."
         """
-        if dim < 0:
-            target_dim = self.max_n_dims + dim
+        if dim is not None and (start_dim is not None or end_dim is not None):
+            raise ValueError("`dim` may not be combined with `start_dim` or `end_dim`.")
+        if fill not in ("zero", "repeat"):
+            raise ValueError(f"fill must be 'zero' or 'repeat'; got '{fill}'")
+
+        if start_dim is None and end_dim is None:
+            dim = -1 if dim is None else dim
+            end_dim = self.max_n_dims + dim if dim < 0 else dim
+            start_dim = end_dim - 1
         else:
-            target_dim = dim
+            start_dim = 0 if start_dim is None else start_dim
+            end_dim = -1 if end_dim is None else end_dim
+            start_dim = self.max_n_dims + start_dim if start_dim < 0 else start_dim
+            end_dim = self.max_n_dims + end_dim if end_dim < 0 else end_dim
 
-        if target_dim != self.max_n_dims - 1:
-            raise ValueError(f"Only supports dim = -1 or {self.max_n_dims - 1} for now; got {dim}")
+        if not 0 <= start_dim < end_dim < self.max_n_dims:
+            raise ValueError(
+                f"Can only flatten a run of at least two dims within [0, {self.max_n_dims - 1}]; got "
+                f"start_dim={start_dim}, end_dim={end_dim}"
+            )
 
+        shift = end_dim - start_dim
         out_tensors = {}
 
-        for d in range(0, target_dim - 1):
+        for d in range(0, start_dim):
             if d > 0:
                 out_tensors[f"dim{d}/bounds"] = self.tensors[f"dim{d}/bounds"]
             for k in self.keys_at_dim(d):
                 out_tensors[f"dim{d}/{k}"] = self.tensors[f"dim{d}/{k}"]
 
-        if target_dim == 1:
-            prev_bounds = np.array([len(self)])
+        if start_dim > 0:
+            out_tensors[f"dim{start_dim}/bounds"] = self._segment_offsets(start_dim - 1, end_dim)[1:]
+
+        for d in range(end_dim, self.max_n_dims):
+            if d > end_dim:
+                out_tensors[f"dim{d - shift}/bounds"] = self.tensors[f"dim{d}/bounds"]
+            for k in self.keys_at_dim(d):
+                out_tensors[f"dim{d - shift}/{k}"] = self.tensors[f"dim{d}/{k}"]
+
+        L = self._n_elements_at_dim(end_dim)
+        outer_keys = {k for d in range(start_dim, end_dim) for k in self.keys_at_dim(d)}
+        if outer_keys and L == 0:
+            # All inner ragged rows were empty, so the flattened length is 0 and
+            # there are no positions to broadcast outer-dim values into. The
+            # zero-length output is semantically correct (flatten is a reshape,
+            # not a reduction), but the outer-dim data *is* dropped silently
+            # without a warning — see #46.
+            warnings.warn(
+                f"flatten(): all inner ragged rows are empty, so the flattened "
+                f"length is 0. Values at outer-dim key(s) {sorted(outer_keys)} "
+                f"will be dropped because there are no positions to broadcast "
+                f"them into.",
+                stacklevel=2,
+            )
+
+        for d in range(start_dim, end_dim):
+            offsets = self._segment_offsets(d, end_dim)
+            lengths = np.diff(offsets)
+            for k in self.keys_at_dim(d):
+                old_T = self.tensors[f"dim{d}/{k}"]
+                if fill == "repeat":
+                    new_T = np.repeat(old_T, lengths)
+                else:
+                    new_T = np.zeros(shape=(L,), dtype=old_T.dtype)
+                    nonempty = lengths > 0
+                    new_T[offsets[:-1][nonempty]] = old_T[nonempty]
+                out_tensors[f"dim{start_dim}/{k}"] = new_T
+
+        return self.__class__(processed_tensors=out_tensors, schema=self.schema)
+
+    _REDUCTION_OPS: tuple[str, ...] = ("sum", "mean", "min", "max", "count", "any")
+
+    def reduce(
+        self,
+        op: str,
+        dim: int = -1,
+        keys: Iterable[str] | None = None,
+        skipna: bool = False,
+        fill_value: NUM_T | None = None,
+    ) -> JointNestedRaggedTensorDict:
+        """Reduces the values at ``dim`` and all deeper dims into one value per element of ``dim - 1``.
+
+        Reductions operate directly on the flat values with segment ops (``np.add.reduceat`` and friends) over
+        segments derived from the ``dim*/bounds`` arrays, so their cost scales with the number of stored
+        elements, not the padded volume of `to_dense`. Every key at ``dim`` or deeper (or only those in
+        ``keys``) is reduced over all of its elements that descend from each element at ``dim - 1`` and
+        becomes a key at ``dim - 1``; keys and bounds at shallower dims are kept unchanged, and all other
+        deeper keys are dropped. Reducing the last dim therefore returns a collection with one fewer dim.
+
+        Args:
+            op: The reduction. One of ``"sum"``, ``"mean"``, ``"min"``, ``"max"``, ``"count"``, or ``"any"``.
+                ``"count"`` returns the number of elements in each segment.
+            dim: The (possibly negative) dimension to collapse. Must be at least 1.
+            keys: The keys to reduce. Defaults to all keys at ``dim`` or deeper.
+            skipna: If `True`, ``NaN`` values are ignored: they are excluded from sums, means, mins, maxes and
+                counts and are treated as `False` for ``"any"``. If `False`, ``NaN`` propagates as in numpy.
+                Has no effect on non-floating keys.
+            fill_value: The value for segments that have no elements to reduce (empty segments, or all-``NaN``
+                segments when ``skipna=True``) under ``"mean"``, ``"min"`` and ``"max"``, which have no
+                identity. Defaults to ``NaN`` for floating outputs and ``0`` otherwise (matching the zero
+                padding of `to_dense`). Empty segments reduce to ``0`` under ``"sum"`` and ``"count"`` and to
+                `False` under ``"any"``.
+
+        Returns:
+            A new `JointNestedRaggedTensorDict` holding the reduced keys at ``dim - 1``.
+
+        Raises:
+            ValueError: If ``op`` or ``dim`` is invalid.
+            KeyError: If ``keys`` contains keys that are not at ``dim`` or deeper.
+
+        Examples:
+            >>> nan = float("nan")
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":   [[1,               2,          3        ], [4,     5 ]],
+            ...     "id":  [[[1,   2,   3  ], [3,   4  ], [1,   2  ]], [[3  ], []]],
+            ...     "val": [[[1.0, 0.5, 0.0], [3.0, nan], [1.0, 2.0]], [[3.0], []]],
+            ... })
+            >>> pprint_dense(J.reduce("sum", keys=["val"]).to_dense())
+            dim1/mask
+            [[ True  True  True]
+             [ True  True False]]
+            .
+            T
+            [[1 2 3]
+             [4 5 0]]
+            .
+            val
+            [[1.5 nan 3. ]
+             [3.  0.  0. ]]
+            >>> J.reduce("sum", keys=["val"], skipna=True).tensors["dim1/val"]
+            array([1.5, 3. , 3. , 3. , 0. ], dtype=float32)
+            >>> J.reduce("count").tensors["dim1/id"]
+            array([3, 2, 2, 1, 0])
+            >>> J.reduce("max", keys=["id"]).tensors["dim1/id"]
+            array([3, 4, 2, 3, 0], dtype=uint8)
+            >>> J.reduce("max", keys=["id"], fill_value=255).tensors["dim1/id"]
+            array([  3,   4,   2,   3, 255], dtype=uint8)
+            >>> J.reduce("mean", keys=["val"], skipna=True).tensors["dim1/val"]
+            array([0.5, 3. , 1.5, 3. , nan], dtype=float32)
+            >>> J.reduce("any", keys=["id"]).tensors["dim1/id"]
+            array([ True,  True,  True,  True, False])
+
+            Reducing an inner dim collapses every deeper dim too, e.g. to get one value per subject:
+
+            >>> J.reduce("mean", dim=1, keys=["val"], skipna=True).tensors
+            {'dim0/val': array([1.25, 3.  ], dtype=float32)}
+            >>> J.reduce("count", dim=1).tensors
+            {'dim0/T': array([3, 2]), 'dim0/id': array([7, 1]), 'dim0/val': array([7, 1])}
+
+            The convenience methods `sum`, `mean`, `min`, `max`, `count` and `any` forward to this method:
+
+            >>> J.min(keys=["id"]) == J.reduce("min", keys=["id"])
+            True
+
+            Errors are raised for invalid reductions:
+
+            >>> J.reduce("median")
+            Traceback (most recent call last):
+                ...
+            ValueError: op must be one of ('sum', 'mean', 'min', 'max', 'count', 'any'); got 'median'
+            >>> J.reduce("sum", dim=0)
+            Traceback (most recent call last):
+                ...
+            ValueError: Can only reduce over dims 1 through 2 (or -2 through -1); got 0
+            >>> J.reduce("sum", dim=2, keys=["T"])
+            Traceback (most recent call last):
+                ...
+            KeyError: "Keys ['T'] are not at dim 2 or deeper."
+        """
+        if op not in self._REDUCTION_OPS:
+            raise ValueError(f"op must be one of {self._REDUCTION_OPS}; got '{op}'")
+
+        target_dim = self.max_n_dims + dim if dim < 0 else dim
+        if not 1 <= target_dim < self.max_n_dims:
+            raise ValueError(
+                f"Can only reduce over dims 1 through {self.max_n_dims - 1} "
+                f"(or {1 - self.max_n_dims} through -1); got {dim}"
+            )
+
+        reduce_keys = {k for k in self.keys() if self._get_dim(k) >= target_dim}
+        if keys is not None:
+            keys = set(keys)
+            if keys - reduce_keys:
+                raise KeyError(f"Keys {sorted(keys - reduce_keys)} are not at dim {target_dim} or deeper.")
+            reduce_keys = keys
+
+        out_tensors = {}
+        out_schema = {}
+        for k_str, T in self.tensors.items():
+            d, key = self._get_dim_from_key_str(k_str), k_str.split("/")[1]
+            if d < target_dim:
+                out_tensors[k_str] = T
+            elif key in reduce_keys:
+                offsets = self._segment_offsets(target_dim - 1, d)
+                T = self._segment_reduce(T, offsets, op, skipna=skipna, fill_value=fill_value)
+                out_tensors[f"dim{target_dim - 1}/{key}"] = T
+            else:
+                continue
+            if key != "bounds":
+                out_schema[key] = T.dtype
+
+        return self.__class__(processed_tensors=out_tensors, schema=out_schema)
+
+    @staticmethod
+    def _segment_reduce(
+        values: np.ndarray,
+        offsets: np.ndarray,
+        op: str,
+        skipna: bool = False,
+        fill_value: NUM_T | None = None,
+    ) -> np.ndarray:
+        """Reduces ``values`` over the segments ``values[offsets[i]:offsets[i + 1]]``. See `reduce`.
+
+        ``ufunc.reduceat`` returns ``values[offsets[i]]`` (rather than the identity) for empty segments and
+        cannot express a zero-length final segment, so it is only applied to the starts of the non-empty
+        segments. Because segments are contiguous, each non-empty segment then runs exactly up to the start of
+        the next non-empty one, and empty segments are filled separately.
+
+        Examples:
+            >>> vals = np.array([1, 5, 2, 7, 3], dtype=np.uint8)
+            >>> offsets = np.array([0, 2, 2, 5, 5])
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "sum")
+            array([ 6,  0, 12,  0], dtype=uint64)
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "min")
+            array([1, 0, 2, 0], dtype=uint8)
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "mean")
+            array([ 3., nan,  4., nan])
+            >>> nan = float("nan")
+            >>> vals, offsets = np.array([1.0, nan, nan, 2.0]), np.array([0, 2, 3, 4])
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "max")
+            array([nan, nan,  2.])
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "max", skipna=True)
+            array([ 1., nan,  2.])
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "count", skipna=True)
+            array([1, 0, 1])
+            >>> JointNestedRaggedTensorDict._segment_reduce(vals, offsets, "any", skipna=True)
+            array([ True, False,  True])
+        """
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        starts = offsets[:-1][nonempty]
+        values = values[: offsets[-1]]
+
+        nan_mask = np.isnan(values) if skipna and values.dtype.kind == "f" else None
+
+        def reduceat(ufunc, vals, identity, dtype):
+            out = np.full(len(lengths), identity, dtype=dtype)
+            if len(starts):
+                out[nonempty] = ufunc.reduceat(vals, starts, dtype=dtype)
+            return out
+
+        counts = lengths if nan_mask is None else reduceat(np.add, ~nan_mask, 0, np.int64)
+
+        match op:
+            case "count":
+                return counts.astype(np.int64)
+            case "any":
+                vals = values != 0
+                if nan_mask is not None:
+                    vals &= ~nan_mask
+                return reduceat(np.logical_or, vals, False, bool)
+            case "sum":
+                vals = values if nan_mask is None else np.where(nan_mask, 0, values)
+                return reduceat(np.add, vals, 0, np.zeros(0, dtype=values.dtype).sum().dtype)
+
+        out_dtype = np.float64 if op == "mean" and values.dtype.kind != "f" else values.dtype
+        if fill_value is None:
+            fill_value = np.nan if np.dtype(out_dtype).kind == "f" else 0
+
+        has_vals = counts > 0
+        if op == "mean":
+            vals = values if nan_mask is None else np.where(nan_mask, 0, values)
+            out = reduceat(np.add, vals, 0, out_dtype)
+            out[has_vals] /= counts[has_vals]
         else:
-            prev_bounds = self.tensors[f"dim{target_dim-1}/bounds"]
+            vals = values
+            if nan_mask is not None:
+                vals = np.where(nan_mask, np.inf if op == "min" else -np.inf, values).astype(values.dtype)
+            out = reduceat(np.minimum if op == "min" else np.maximum, vals, 0, out_dtype)
+        out[~has_vals] = fill_value
+        return out
+
+    def sum(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False
+    ) -> JointNestedRaggedTensorDict:
+        """Sums over ``dim`` and all deeper dims. See `reduce`."""
+        return self.reduce("sum", dim=dim, keys=keys, skipna=skipna)
 
-        for d in range(target_dim, self.max_n_dims):
-            curr_bounds = self.tensors[f"dim{d}/bounds"]
-            st = np.concatenate([[0], curr_bounds[prev_bounds[:-1] - 1]])
-            end = curr_bounds[prev_bounds - 1]
+    def mean(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False, fill_value=None
+    ) -> JointNestedRaggedTensorDict:
+        """Averages over ``dim`` and all deeper dims. See `reduce`."""
+        return self.reduce("mean", dim=dim, keys=keys, skipna=skipna, fill_value=fill_value)
 
-            prev_bounds = curr_bounds
+    def min(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False, fill_value=None
+    ) -> JointNestedRaggedTensorDict:
+        """Takes the minimum over ``dim`` and all deeper dims. See `reduce`."""
+        return self.reduce("min", dim=dim, keys=keys, skipna=skipna, fill_value=fill_value)
 
-            if d > 1:
-                new_bounds = np.cumsum(end - st)
-                out_tensors[f"dim{d-1}/bounds"] = new_bounds
+    def max(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False, fill_value=None
+    ) -> JointNestedRaggedTensorDict:
+        """Takes the maximum over ``dim`` and all deeper dims. See `reduce`."""
+        return self.reduce("max", dim=dim, keys=keys, skipna=skipna, fill_value=fill_value)
 
-            for k in self.keys_at_dim(d):
-                out_tensors[f"dim{d - 1}/{k}"] = self.tensors[f"dim{d}/{k}"]
-
-        outer_keys = self.keys_at_dim(target_dim - 1)
-        if outer_keys:
-            B = self.tensors[f"dim{target_dim}/bounds"]
-            L = int(B[-1]) if len(B) else 0
-            indices = np.concatenate([[0], B[:-1]])
-            if L == 0:
-                # All inner ragged rows were empty, so the flattened length is 0 and
-                # there are no positions to broadcast outer-dim values into. The
-                # zero-length output is semantically correct (flatten is a reshape,
-                # not a reduction), but the outer-dim data *is* dropped silently
-                # without a warning — see #46.
-                warnings.warn(
-                    f"flatten(): all inner ragged rows are empty, so the flattened "
-                    f"length is 0. Values at outer-dim key(s) {sorted(outer_keys)} "
-                    f"will be dropped because there are no positions to broadcast "
-                    f"them into.",
-                    stacklevel=2,
-                )
-            for k in outer_keys:
-                old_T = self.tensors[f"dim{target_dim-1}/{k}"]
-                new_T = np.zeros(shape=(L,), dtype=old_T.dtype)
-                if L > 0:
-                    new_T[indices] = old_T
-                out_tensors[f"dim{target_dim-1}/{k}"] = new_T
+    def count(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False
+    ) -> JointNestedRaggedTensorDict:
+        """Counts the elements under each element of ``dim - 1``. See `reduce`."""
+        return self.reduce("count", dim=dim, keys=keys, skipna=skipna)
 
-        return self.__class__(processed_tensors=out_tensors, schema=self.schema)
+    def any(
+        self, dim: int = -1, keys: Iterable[str] | None = None, skipna: bool = False
+    ) -> JointNestedRaggedTensorDict:
+        """Tests whether any element under each element of ``dim - 1`` is non-zero. See `reduce`."""
+        return self.reduce("any", dim=dim, keys=keys, skipna=skipna)
+
+    def to_csr(
+        self, code_key: str, dim: int = 0, weight_key: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Exports per-row counts (or summed weights) of an integer code key as a CSR sparse matrix.
+
+        Row ``i`` of the matrix is element ``i`` at ``dim`` (e.g., a subject for ``dim=0`` or an event for
+        ``dim=1``), and column ``c`` holds the number of occurrences of code ``c`` among that element's
+        descendants at ``code_key``'s dim, or the sum of ``weight_key`` over them. The result is computed with
+        a single ``np.lexsort`` over (row, code) followed by an ``np.add.reduceat`` over the runs of equal
+        pairs; no dense or per-row intermediate is built.
+
+        Args:
+            code_key: The key holding non-negative integer codes.
+            dim: The (possibly negative) dim whose elements form the rows. Must be shallower than
+                ``code_key``'s dim.
+            weight_key: An optional key at the same dim as ``code_key`` whose values are summed instead of
+                counted. ``NaN`` weights are summed as-is.
+
+        Returns:
+            The tuple ``(data, indices, indptr)``, in the argument order of ``scipy.sparse.csr_matrix``: row
+            ``i``'s columns are ``indices[indptr[i]:indptr[i + 1]]`` (sorted ascending, without duplicates)
+            with values ``data[indptr[i]:indptr[i + 1]]``. ``data`` is ``int64`` for counts and follows
+            numpy's sum dtype of ``weight_key`` otherwise.
+
+        Raises:
+            ValueError: If ``code_key`` is not an integer key, ``dim`` is not shallower than ``code_key``, or
+                ``weight_key`` is at a different dim.
+
+        Examples:
+            >>> J = JointNestedRaggedTensorDict({
+            ...     "T":    [[1,               2       ], [3,       4  ]],
+            ...     "code": [[[3,   1,   3  ], [1     ]], [[2,   0], [ ]]],
+            ...     "val":  [[[0.5, 1.0, 2.0], [4.0   ]], [[1.0, 3.0], []]],
+            ... })
+            >>> data, indices, indptr = J.to_csr("code")
+            >>> data, indices, indptr
+            (array([2, 2, 1, 1]), array([1, 3, 0, 2]), array([0, 2, 4]))
+            >>> J.to_csr("code", weight_key="val")[0]
+            array([5. , 2.5, 3. , 1. ], dtype=float32)
+
+            Rows can be any dim shallower than the codes; here there is one row per event, and the last event
+            has no codes:
+
+            >>> J.to_csr("code", dim=1)
+            (array([1, 2, 1, 1, 1]), array([1, 3, 1, 0, 2]), array([0, 2, 3, 5, 5]))
+
+            The arrays plug straight into ``scipy.sparse.csr_matrix((data, indices, indptr))``.
+
+            >>> J.to_csr("val")
+            Traceback (most recent call last):
+                ...
+            ValueError: code_key 'val' must hold integer codes; got float32.
+            >>> J.to_csr("code", dim=2)
+            Traceback (most recent call last):
+                ...
+            ValueError: dim must be shallower than code_key 'code' (at dim 2); got 2
+        """
+        code_dim = self._get_dim(code_key)
+        row_dim = self.max_n_dims + dim if dim < 0 else dim
+        if not 0 <= row_dim < code_dim:
+            raise ValueError(
+                f"dim must be shallower than code_key '{code_key}' (at dim {code_dim}); got {dim}"
+            )
+        if weight_key is not None and self._get_dim(weight_key) != code_dim:
+            raise ValueError(f"weight_key '{weight_key}' must be at the same dim as code_key '{code_key}'.")
+
+        codes = self.tensors[f"dim{code_dim}/{code_key}"]
+        if codes.dtype.kind not in "iu":
+            raise ValueError(f"code_key '{code_key}' must hold integer codes; got {codes.dtype}.")
+
+        offsets = self._segment_offsets(row_dim, code_dim)
+        n_rows = len(offsets) - 1
+        rows = np.repeat(np.arange(n_rows), np.diff(offsets))
+
+        order = np.lexsort((codes, rows))
+        rows, codes = rows[order], codes[order]
+        is_run_start = np.ones(len(order), dtype=bool)
+        is_run_start[1:] = (rows[1:] != rows[:-1]) | (codes[1:] != codes[:-1])
+        run_starts = np.flatnonzero(is_run_start)
+
+        if weight_key is None:
+            data = np.diff(np.append(run_starts, len(order))).astype(np.int64)
+        else:
+            weights = self.tensors[f"dim{code_dim}/{weight_key}"][order]
+            sum_dtype = np.zeros(0, dtype=weights.dtype).sum().dtype
+            data = np.zeros(0, dtype=sum_dtype)
+            if len(run_starts):
+                data = np.add.reduceat(weights, run_starts, dtype=sum_dtype)
+
+        indices = codes[run_starts].astype(np.int64)
+        indptr = np.searchsorted(rows[run_starts], np.arange(n_rows + 1))
+        return data, indices, indptr
 
     def __len__(self) -> int:
         """Returns the length (which is shared across all keys) of these tensors.
@@ -1852,11 +5051,20 @@ class JointNestedRaggedTensorDict:
         return cls.concatenate([T.unsqueeze(0) for T in tensor_dicts])
 
     @classmethod
-    def concatenate(cls, tensors: list) -> JointNestedRaggedTensorDict:
-        """Concatenates these tensors with other identically keyed tensors along the existing first dim.
+    def concatenate(cls, tensors: list, dim: int = 0) -> JointNestedRaggedTensorDict:
+        """Concatenates these tensors with other identically keyed tensors along an existing dim.
+
+        With ``dim=0`` (the default), the inputs' rows are stacked one after another. With ``dim >= 1``, the
+        inputs must have identical structure (bounds and keys) at all dims shallower than ``dim``, and each
+        segment at ``dim`` of the output is the concatenation of the corresponding segments of the inputs, in
+        order; e.g., ``dim=1`` appends the events of the second input to those of the first, subject by
+        subject. In that case the merged bounds are computed from the inputs' segment lengths and every key is
+        gathered into place with a single fancy-index over the stacked inputs, so the cost is linear in the
+        total number of elements.
 
         Args:
             tensors: The tensors to concatenate.
+            dim: The (possibly negative) dim along which to concatenate.
 
         Examples:
             >>> JointNestedRaggedTensorDict.concatenate([])
@@ -2028,6 +5236,45 @@ class JointNestedRaggedTensorDict:
             ... })
             >>> list(JointNestedRaggedTensorDict.concatenate([J1, J2]).tensors) == list(J1.tensors)
             True
+
+            Concatenating along an inner dim merges the inputs segment by segment. Here two event streams for
+            the same two subjects are merged along the event dim:
+
+            >>> labs = JointNestedRaggedTensorDict({
+            ...     "subject": [1,               2        ],
+            ...     "T":       [[1,       3   ], [2      ]],
+            ...     "code":    [[[10, 11], [12]], [[13, 14]]],
+            ... })
+            >>> meds = JointNestedRaggedTensorDict({
+            ...     "subject": [1,        2                ],
+            ...     "T":       [[2     ], [1,     4,   5  ]],
+            ...     "code":    [[[20]  ], [[21], [22], [23]]],
+            ... })
+            >>> merged = JointNestedRaggedTensorDict.concatenate([labs, meds], dim=1)
+            >>> merged.tensors["dim1/T"], merged.tensors["dim1/bounds"]
+            (array([1, 3, 2, 2, 1, 4, 5], dtype=uint8), array([3, 7]))
+            >>> merged.to_dense()["code"]
+            array([[[10, 11],
+                    [12,  0],
+                    [20,  0],
+                    [ 0,  0]],
+            <BLANKLINE>
+                   [[13, 14],
+                    [21,  0],
+                    [22,  0],
+                    [23,  0]]], dtype=uint8)
+            >>> units = labs.assign(code=labs.key_view("code") + 100)
+            >>> JointNestedRaggedTensorDict.concatenate([labs, units], dim=-1).to_dense()["code"]
+            array([[[ 10,  11, 110, 111],
+                    [ 12, 112,   0,   0]],
+            <BLANKLINE>
+                   [[ 13,  14, 113, 114],
+                    [  0,   0,   0,   0]]], dtype=uint8)
+            >>> first_subject_meds = meds.filter(np.array([True, False]), dim=0)
+            >>> JointNestedRaggedTensorDict.concatenate([labs, first_subject_meds], dim=1)
+            Traceback (most recent call last):
+                ...
+            ValueError: Can't concatenate along dim 1: inputs differ at dim 0.
         """
 
         if len(tensors) == 1:
@@ -2050,12 +5297,19 @@ class JointNestedRaggedTensorDict:
             if T.schema != out_schema:
                 raise ValueError(f"Schema inconsistent! {T.schema} != {out_schema}")
 
-            for dim in range(T.max_n_dims):
-                if T.keys_at_dim(dim) != out_keys_at_dim[dim]:
+            for d in range(T.max_n_dims):
+                if T.keys_at_dim(d) != out_keys_at_dim[d]:
                     raise ValueError(
-                        f"Keys inconsistent @ dim {dim}! {T.keys_at_dim(dim)} != {out_keys_at_dim[dim]}"
+                        f"Keys inconsistent @ dim {d}! {T.keys_at_dim(d)} != {out_keys_at_dim[d]}"
                     )
 
+        if dim < 0:
+            dim = out_max_n_dims + dim
+        if not 0 <= dim < out_max_n_dims:
+            raise ValueError(f"dim must be in [{-out_max_n_dims}, {out_max_n_dims}); got {dim}")
+        if dim > 0:
+            return cls._concatenate_inner(tensors, dim)
+
         # Gather all per-key arrays up front and do a single np.concatenate per key. The
         # previous implementation grew an accumulator with np.concatenate per input tensor,
         # which is O(N^2) in the number of inputs (see #68). Iterate keys in the order
@@ -2091,6 +5345,51 @@ class JointNestedRaggedTensorDict:
                     raise ValueError(f"Failed to concatenate {key} at dim {dim}: {shapes}") from e
         return cls(processed_tensors=out_tensors, schema=out_schema)
 
+    @classmethod
+    def _concatenate_inner(cls, tensors: list, dim: int) -> JointNestedRaggedTensorDict:
+        """Concatenates validated ``tensors`` segment by segment along ``dim >= 1``. See `concatenate`.
+
+        The output order at ``dim`` is, for each parent element ``p`` and each input ``t`` in turn, the
+        elements of ``p`` in ``t``. Indexing into the inputs stacked one after another, that is one run per
+        ``(p, t)`` pair, so the gather indices are a single `_concat_ranges` call; deeper dims follow their
+        parents as in `_take_subtree`.
+        """
+        first = tensors[0]
+        for T in tensors[1:]:
+            for d in range(dim):
+                shallow_keys = [f"dim{d}/{k}" for k in first.keys_at_dim(d)]
+                if d > 0:
+                    shallow_keys.append(f"dim{d}/bounds")
+                if (d == 0 and len(T) != len(first)) or any(
+                    not np.array_equal(T.tensors[k], first.tensors[k]) for k in shallow_keys
+                ):
+                    raise ValueError(f"Can't concatenate along dim {dim}: inputs differ at dim {d}.")
+
+        out_tensors = {k: v for k, v in first.tensors.items() if cls._get_dim_from_key_str(k) < dim}
+
+        offsets = [T._segment_offsets(dim - 1, dim) for T in tensors]
+        input_starts = np.cumsum([0] + [o[-1] for o in offsets[:-1]])
+        starts = np.stack([o[:-1] + st for o, st in zip(offsets, input_starts)], axis=1)
+        lengths = np.stack([np.diff(o) for o in offsets], axis=1)
+        out_tensors[f"dim{dim}/bounds"] = np.cumsum(lengths.sum(axis=1))
+        idx = cls._concat_ranges(starts.ravel(), lengths.ravel())
+
+        for d in range(dim, first.max_n_dims):
+            if d > dim:
+                bounds = [T.tensors[f"dim{d}/bounds"] for T in tensors]
+                input_starts = np.cumsum([0] + [int(B[-1]) if len(B) else 0 for B in bounds[:-1]])
+                ends = np.concatenate([B + st for B, st in zip(bounds, input_starts)])
+                lengths = np.concatenate([np.diff(B, prepend=0) for B in bounds])
+                starts, lengths = (ends - lengths)[idx], lengths[idx]
+                out_tensors[f"dim{d}/bounds"] = np.cumsum(lengths)
+                idx = cls._concat_ranges(starts, lengths)
+            for key in first.keys_at_dim(d):
+                k_str = f"dim{d}/{key}"
+                out_tensors[k_str] = np.concatenate([T.tensors[k_str] for T in tensors])[idx]
+
+        out_tensors = {k: out_tensors[k] for k in first.tensors}
+        return cls(processed_tensors=out_tensors, schema=first.schema)
+
     def _slice_single(
         self,
         indices: dict[str, slice],
@@ -2117,32 +5416,31 @@ class JointNestedRaggedTensorDict:
             TypeError: <class 'list'> not supported for JointNestedRaggedTensorDict slicing
         """
 
-        tensors = {}
-        schema = {}
+        def read_slice(T, key: str, S: slice) -> np.ndarray:
+            if S.start and S.stop is not None and S.stop <= S.start:
+                # The archive rejects empty slices at the end of a tensor, so empty results are cut from the
+                # element before them instead (which also gives them the tensor's dtype).
+                return T[S.start - 1 : S.start][:0]
+            if key == "bounds" and S.start is not None and S.start > 0:
+                try:
+                    L = T.get_shape()[0]
+                except Exception:
+                    L = len(T)
+                if S.start >= L:
+                    return np.array([], dtype=T.dtype)
+                return T[S] - T[S.start - 1]
+            return T[S]
 
+        reads = []
         for k, idx in indices.items():
-            old_dim, key = k.split("/")
-
-            new_key = k
-
             match idx:
                 case slice() as S:
-                    with self._tensor_at_key(k, archive=archive) as T:
-                        if key == "bounds" and S.start is not None and S.start > 0:
-                            try:
-                                L = T.get_shape()[0]
-                            except Exception:
-                                L = len(T)
-                            if S.start >= L:
-                                tensors[new_key] = np.array([], dtype=T.dtype)
-                            else:
-                                tensors[new_key] = T[S] - T[S.start - 1]
-                        else:
-                            tensors[new_key] = T[S]
+                    reads.append((k, partial(read_slice, key=k.split("/")[1], S=S)))
                 case _:
                     raise TypeError(f"{type(idx)} not supported for {self.__class__.__name__} slicing")
 
-            schema[new_key] = tensors[new_key].dtype
+        tensors = dict(zip(indices, self._read_tensors(reads, archive=archive)))
+        schema = {k: T.dtype for k, T in tensors.items()}
 
         out = self.__class__(processed_tensors=tensors, schema=schema)
         if squeeze_dims is not None:
@@ -2199,6 +5497,8 @@ class JointNestedRaggedTensorDict:
             ({'dim0/T': slice(1, 2, None)}, [0])
             >>> J._get_slice_indices(slice(1, 3))
             {'dim0/T': slice(1, 3, None)}
+            >>> J._get_slice_indices(np.int64(1))
+            ({'dim0/T': slice(1, 2, None)}, [0])
             >>> J._get_slice_indices([1, 2])
             Traceback (most recent call last):
                 ...
@@ -2210,6 +5510,12 @@ class JointNestedRaggedTensorDict:
             TypeError: <class 'float'> at index 1 not supported for JointNestedRaggedTensorDict tuple slicing
         """
 
+        # Integers of any type (e.g., ``np.int64``, as from iterating over an index array) index as `int`s.
+        if isinstance(idx, numbers.Integral):
+            idx = int(idx)
+        elif isinstance(idx, tuple):
+            idx = tuple(int(i) if isinstance(i, numbers.Integral) else i for i in idx)
+
         match idx:
             case np.ndarray() as arr if arr.dtype in (NP_INT_TYPES + NP_UINT_TYPES) and arr.ndim == 1:
                 normalized = [self._bounds_check_int(int(i), len(self), 0) for i in arr]
@@ -2393,8 +5699,8 @@ class JointNestedRaggedTensorDict:
              'dim2/bounds': slice(np.int64(6), np.int64(6), None),
              'dim2/val': slice(np.int64(9), np.int64(9), None)}
             >>> J._get_slice_indices_internal(slice(4, 4), 0, {}) # doctest: +NORMALIZE_WHITESPACE
-            {'dim0/T': slice(4, 4, None),
-             'dim1/bounds': slice(4, 4, None),
+            {'dim0/T': slice(3, 3, None),
+             'dim1/bounds': slice(3, 3, None),
              'dim1/id': slice(np.int64(6), np.int64(6), None),
              'dim2/bounds': slice(np.int64(6), np.int64(6), None),
              'dim2/val': slice(np.int64(9), np.int64(9), None)}
@@ -2410,6 +5716,13 @@ class JointNestedRaggedTensorDict:
         if idx.step not in (None, 1):
             raise ValueError(f"Only slices with step size of None or 1 are supported; got {idx.step}")
 
+        if starting_dim == 0:
+            # As in Python slicing, negative starts and stops count back from the end, and both are clamped to
+            # the rows (the archive rejects out-of-range reads, and the bounds translation below assumes
+            # in-range, non-negative ends).
+            st_i, end_i, _ = idx.indices(len(self))
+            end_i = max(st_i, end_i)
+
         out = {**curr_indices}
 
         adjusted = False
@@ -0,0 +1,133 @@
+"""Batch samplers over the rows of a `JointNestedRaggedTensorDict` that keep disk reads local.
+
+Fully random batches of a disk-backed collection touch rows scattered across the whole file, so once the
+file no longer fits in the page cache nearly every row costs its own cold read. The samplers here trade some
+of that randomness for locality: they only draw batches from a small working set of contiguous row blocks at
+a time, so a batch's rows come from a few contiguous regions of the file and the pages read for one batch are
+largely reused by the next. Samplers only produce indices; they do not import torch, but they follow the
+`torch.utils.data` batch sampler protocol (an iterable of index batches with a ``__len__``), so they can be
+passed as a DataLoader's ``batch_sampler``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+
+class BlockShuffleSampler:
+    """Samples batches of row indices by shuffling contiguous blocks of rows, then rows within a buffer.
+
+    The ``n_rows`` rows are split into blocks of ``block_size`` contiguous rows. Each epoch, the blocks are
+    visited in a random order and read into a shuffle buffer ``buffer_blocks`` blocks at a time; the rows in
+    the buffer are shuffled together and emitted ``batch_size`` at a time (rows left over when a buffer runs
+    out are carried into the next one). As long as ``batch_size`` is no larger than a buffer, every batch is
+    therefore drawn from the blocks of at most two consecutive buffers, and each batch's indices are returned
+    in ascending order so that reads of adjacent rows can be served together.
+
+    Randomness is controlled by ``block_size`` and ``buffer_blocks`` (larger values mix rows more widely at
+    the cost of locality), and either level can be switched off: with ``shuffle_rows=False`` the rows of each
+    buffer are emitted in file order, so batches are contiguous runs whenever ``block_size`` is a multiple of
+    ``batch_size``; with ``shuffle_blocks=False`` the blocks are visited in file order. ``seed`` and
+    `set_epoch` make the sequence reproducible while still changing it from one epoch to the next.
+
+    Args:
+        n_rows: The number of rows to sample from (usually ``len(J)``).
+        batch_size: The number of rows per batch.
+        block_size: The number of contiguous rows per block.
+        buffer_blocks: The number of blocks whose rows are shuffled together.
+        shuffle_blocks: Whether to visit the blocks in a random order.
+        shuffle_rows: Whether to shuffle the rows within each buffer.
+        drop_last: If ``True``, the final batch is dropped when it has fewer than ``batch_size`` rows.
+        seed: The seed for the random generator. If ``None``, each epoch is seeded from fresh OS entropy.
+
+    Raises:
+        ValueError: If any of ``batch_size``, ``block_size`` or ``buffer_blocks`` is not a positive integer,
+            or if ``n_rows`` is negative.
+
+    Examples:
+        >>> sampler = BlockShuffleSampler(10, batch_size=4, block_size=5, seed=0)
+        >>> len(sampler)
+        3
+        >>> [batch.tolist() for batch in sampler]
+        [[0, 2, 3, 4], [1, 6, 7, 9], [5, 8]]
+        >>> sampler.set_epoch(1)
+        >>> [batch.tolist() for batch in sampler]
+        [[0, 1, 3, 4], [2, 6, 8, 9], [5, 7]]
+
+        Without row shuffling, blocks are emitted whole (split into batches) in shuffled block order:
+
+        >>> sampler = BlockShuffleSampler(9, batch_size=3, block_size=3, shuffle_rows=False, seed=0)
+        >>> [batch.tolist() for batch in sampler]
+        [[6, 7, 8], [0, 1, 2], [3, 4, 5]]
+        >>> BlockShuffleSampler(10, batch_size=4, block_size=0)
+        Traceback (most recent call last):
+            ...
+        ValueError: block_size must be a positive integer; got 0
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        batch_size: int,
+        block_size: int,
+        buffer_blocks: int = 1,
+        shuffle_blocks: bool = True,
+        shuffle_rows: bool = True,
+        drop_last: bool = False,
+        seed: int | None = None,
+    ):
+        for name, value in [("batch_size", batch_size), ("block_size", block_size)]:
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{name} must be a positive integer; got {value}")
+        if not isinstance(buffer_blocks, int) or buffer_blocks <= 0:
+            raise ValueError(f"buffer_blocks must be a positive integer; got {buffer_blocks}")
+        if n_rows < 0:
+            raise ValueError(f"n_rows must be non-negative; got {n_rows}")
+
+        self.n_rows = int(n_rows)
+        self.batch_size = batch_size
+        self.block_size = block_size
+        self.buffer_blocks = buffer_blocks
+        self.shuffle_blocks = shuffle_blocks
+        self.shuffle_rows = shuffle_rows
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int):
+        """Sets the epoch, which is mixed into ``seed`` so that each epoch is shuffled differently."""
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return self.n_rows // self.batch_size
+        return -(-self.n_rows // self.batch_size)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        rng = np.random.default_rng(None if self.seed is None else (self.seed, self.epoch))
+
+        block_starts = np.arange(0, self.n_rows, self.block_size, dtype=np.int64)
+        if self.shuffle_blocks:
+            rng.shuffle(block_starts)
+
+        pending = np.zeros(0, dtype=np.int64)
+        for i in range(0, len(block_starts), self.buffer_blocks):
+            buffer = np.concatenate(
+                [
+                    np.arange(st, min(st + self.block_size, self.n_rows))
+                    for st in block_starts[i : i + self.buffer_blocks]
+                ]
+            )
+            if self.shuffle_rows:
+                rng.shuffle(buffer)
+            pending = np.concatenate([pending, buffer])
+
+            n_full = len(pending) // self.batch_size * self.batch_size
+            for st in range(0, n_full, self.batch_size):
+                yield np.sort(pending[st : st + self.batch_size])
+            pending = pending[n_full:]
+
+        if len(pending) and not self.drop_last:
+            yield np.sort(pending)
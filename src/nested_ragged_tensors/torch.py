@@ -0,0 +1,174 @@
+"""PyTorch datasets and collation over saved ``.nrt`` files.
+
+This module requires the optional ``torch`` extra (``pip install nested_ragged_tensors[torch]``); the core
+`nested_ragged_tensors.ragged_numpy` module never imports torch.
+
+Both datasets hold only a disk-backed `JointNestedRaggedTensorDict`, which pickles as its path and cached
+metadata, so they are cheap to send to DataLoader worker processes and each worker reads just the rows it is
+asked for. `collate` densifies a batch once and wraps the padded arrays with `torch.from_numpy`, so the
+returned tensors share memory with the freshly-allocated dense arrays instead of being copied again.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+
+from .ragged_numpy import JointNestedRaggedTensorDict
+
+
+def collate(
+    batch: JointNestedRaggedTensorDict | Sequence[JointNestedRaggedTensorDict], pin_memory: bool = False
+) -> dict[str, torch.Tensor]:
+    """Collates a batch into a dictionary of padded torch tensors.
+
+    Args:
+        batch: Either a single collection whose rows are the batch (as returned by
+            `NestedRaggedTensorDataset.__getitems__` and yielded by `NestedRaggedTensorIterableDataset`),
+            or a sequence of per-row collections (as returned by `NestedRaggedTensorDataset.__getitem__`),
+            which are stacked first.
+        pin_memory: If ``True``, the returned tensors are copied into page-locked memory, so that
+            host-to-device copies can be issued with ``non_blocking=True``. This requires an accelerator;
+            use it via ``functools.partial(collate, pin_memory=True)`` in place of the DataLoader's own
+            ``pin_memory`` flag when collation already runs in the workers.
+
+    Returns:
+        The `JointNestedRaggedTensorDict.to_dense` output of the batch, with each array wrapped (without a
+        copy, unless ``pin_memory`` is set) as a torch tensor.
+
+    Examples:
+        >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]], "id": [[[1], [2, 3], []], [[4]]]})
+        >>> out = collate([J[0], J[1]])
+        >>> out["T"]
+        tensor([[1, 2, 3],
+                [4, 0, 0]], dtype=torch.uint8)
+        >>> out["dim2/mask"].shape
+        torch.Size([2, 3, 2])
+        >>> all(torch.equal(out[k], v) for k, v in collate(J).items())
+        True
+    """
+    if not isinstance(batch, JointNestedRaggedTensorDict):
+        batch = JointNestedRaggedTensorDict.vstack(list(batch))
+    out = {k: torch.from_numpy(v) for k, v in batch.to_dense().items()}
+    if pin_memory:
+        out = {k: v.pin_memory() for k, v in out.items()}
+    return out
+
+
+class NestedRaggedTensorDataset(Dataset):
+    """A map-style dataset over the rows of a saved ``.nrt`` file.
+
+    Indexing returns the (disk-read) row as a `JointNestedRaggedTensorDict`. DataLoaders with automatic
+    batching fetch whole batches through `__getitems__`, which reads all of a batch's rows from the archive
+    with a single fancy-index read and hands the result to the ``collate_fn`` as one collection, so use
+    `collate` (which accepts both forms) as the ``collate_fn``.
+
+    Args:
+        tensors_fp: The path to the saved ``.nrt`` file.
+        keys: If specified, only these keys are read; see `JointNestedRaggedTensorDict`.
+        coalesce_gap: Rows of a batch at most this many rows apart are fetched with a shared read; see
+            `JointNestedRaggedTensorDict`. Raise it when batches come from a locality-preserving sampler such
+            as `nested_ragged_tensors.sampling.BlockShuffleSampler`.
+
+    Examples:
+        >>> import tempfile
+        >>> from torch.utils.data import DataLoader
+        >>> J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4], [5, 6]], "val": [[1, 2, 3], [4], [5, 6]]})
+        >>> with tempfile.TemporaryDirectory() as dirpath:
+        ...     fp = Path(dirpath) / "tensors.nrt"
+        ...     J.save(fp)
+        ...     dataset = NestedRaggedTensorDataset(fp, keys={"T"})
+        ...     print(len(dataset), dataset[1].keys())
+        ...     for batch in DataLoader(dataset, batch_size=2, collate_fn=collate):
+        ...         print(batch["T"].tolist(), batch["dim1/mask"].tolist())
+        3 {'T'}
+        [[1, 2, 3], [4, 0, 0]] [[True, True, True], [True, False, False]]
+        [[5, 6]] [[True, True]]
+    """
+
+    def __init__(self, tensors_fp: Path | str, keys: set[str] | None = None, coalesce_gap: int = 0):
+        self.data = JointNestedRaggedTensorDict(
+            tensors_fp=Path(tensors_fp), keys=keys, coalesce_gap=coalesce_gap
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, idx: int) -> JointNestedRaggedTensorDict:
+        return self.data[idx]
+
+    def __getitems__(self, indices: Sequence[int]) -> JointNestedRaggedTensorDict:
+        return self.data[np.asarray(indices, dtype=np.int64)]
+
+
+class NestedRaggedTensorIterableDataset(IterableDataset):
+    """An iterable dataset streaming contiguous batches of rows from a saved ``.nrt`` file.
+
+    Rows are read in order as contiguous slices of ``batch_size`` rows, so each batch costs one sequential
+    read of the archive. When iterated inside DataLoader workers, batches are sharded round-robin: worker
+    ``w`` of ``W`` reads batches ``w, w + W, w + 2W, ...``, which both splits the rows without overlap and,
+    because the DataLoader also visits its workers round-robin, yields the batches in file order. Use it with
+    ``batch_size=None`` (the dataset already batches) and ``collate_fn=collate``.
+
+    Args:
+        tensors_fp: The path to the saved ``.nrt`` file.
+        batch_size: The number of rows per yielded batch.
+        keys: If specified, only these keys are read; see `JointNestedRaggedTensorDict`.
+        drop_last: If ``True``, the final batch is dropped when it has fewer than ``batch_size`` rows.
+
+    Raises:
+        ValueError: If ``batch_size`` is not a positive integer.
+
+    Examples:
+        >>> import tempfile
+        >>> from torch.utils.data import DataLoader
+        >>> J = JointNestedRaggedTensorDict({"T": [[1], [2, 2], [3], [4, 4], [5]]})
+        >>> with tempfile.TemporaryDirectory() as dirpath:
+        ...     fp = Path(dirpath) / "tensors.nrt"
+        ...     J.save(fp)
+        ...     dataset = NestedRaggedTensorIterableDataset(fp, batch_size=2)
+        ...     print(len(dataset))
+        ...     for batch in DataLoader(dataset, batch_size=None, collate_fn=collate):
+        ...         print(batch["T"].tolist())
+        3
+        [[1, 0], [2, 2]]
+        [[3, 0], [4, 4]]
+        [[5]]
+        >>> NestedRaggedTensorIterableDataset("unused.nrt", batch_size=0)
+        Traceback (most recent call last):
+            ...
+        ValueError: batch_size must be a positive integer; got 0
+    """
+
+    def __init__(
+        self,
+        tensors_fp: Path | str,
+        batch_size: int,
+        keys: set[str] | None = None,
+        drop_last: bool = False,
+    ):
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer; got {batch_size}")
+        self.batch_size = batch_size
+        self.drop_last = drop_last
+        self.data = JointNestedRaggedTensorDict(tensors_fp=Path(tensors_fp), keys=keys)
+
+    def __len__(self) -> int:
+        """The total number of batches across all workers."""
+        if self.drop_last:
+            return len(self.data) // self.batch_size
+        return math.ceil(len(self.data) / self.batch_size)
+
+    def __iter__(self) -> Iterator[JointNestedRaggedTensorDict]:
+        worker_info = get_worker_info()
+        worker_id, num_workers = (0, 1) if worker_info is None else (worker_info.id, worker_info.num_workers)
+
+        N = len(self.data)
+        for b in range(worker_id, len(self), num_workers):
+            start = b * self.batch_size
+            yield self.data[start : min(start + self.batch_size, N)]
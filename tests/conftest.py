@@ -0,0 +1,95 @@
+"""Shared fixtures for tests of disk-backed collections: random collections saved to disk, and read recording.
+
+Correctness alone rarely shows that a disk path reads only what it should (a full read returns the same
+result), so tests of read behavior record the reads a collection issues against its archive.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+def _random_raw(n_rows: int, seed: int) -> dict:
+    """A random collection with a dim-1 key ``T``, dim-2 keys ``code`` and ``val`` and a dim-0 key ``static``.
+
+    Rows and events may be empty, except for the first event of the first row, so that every dim exists.
+    """
+    rng = np.random.default_rng(seed)
+    raw = {"T": [], "code": [], "val": [], "static": []}
+    for i in range(n_rows):
+        n_events = int(rng.integers(0 if i else 1, 5))
+        lens = [int(rng.integers(0 if i or j else 1, 4)) for j in range(n_events)]
+        raw["T"].append([int(t) for t in rng.integers(0, 100, size=n_events)])
+        raw["code"].append([[int(c) for c in rng.integers(0, 9, size=n)] for n in lens])
+        raw["val"].append([[float(v) for v in rng.random(size=n)] for n in lens])
+        raw["static"].append(int(rng.integers(0, 5)))
+    return raw
+
+
+@pytest.fixture
+def make_disk_jnrt(tmp_path):
+    """Returns ``make(n_rows=30, seed=0, **kwargs)``, which saves a random collection and reopens it.
+
+    The collection has a dim-1 key ``T``, dim-2 keys ``code`` and ``val`` and a dim-0 key ``static``.
+    ``kwargs`` are passed to the disk-backed `JointNestedRaggedTensorDict`. Each call saves to a new file.
+    """
+    counter = itertools.count()
+
+    def make(n_rows: int = 30, seed: int = 0, **kwargs) -> JointNestedRaggedTensorDict:
+        fp = tmp_path / f"{next(counter)}.nrt"
+        JointNestedRaggedTensorDict(_random_raw(n_rows, seed)).save(fp)
+        return JointNestedRaggedTensorDict(tensors_fp=fp, **kwargs)
+
+    return make
+
+
+class ReadLog(list):
+    """The ``(key, index)`` of every read of an archive tensor, in order.
+
+    The name of the thread that issued each read is kept, at the same position, in ``threads``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+        self._lock = threading.Lock()
+
+    def record(self, key: str, index):
+        with self._lock:
+            self.append((key, index))
+            self.threads.append(threading.current_thread().name)
+
+
+@pytest.fixture
+def read_recorder():
+    """Returns ``record(J)``, which patches ``J._tensor_at_key`` to log every read of ``J`` to a `ReadLog`."""
+
+    def record(J: JointNestedRaggedTensorDict) -> ReadLog:
+        reads = ReadLog()
+        orig = J._tensor_at_key
+
+        class Recorder:
+            def __init__(self, key, T):
+                self.key, self.T = key, T
+
+            def __getitem__(self, S):
+                reads.record(self.key, S)
+                return self.T[S]
+
+            def __getattr__(self, name):
+                return getattr(self.T, name)
+
+        @contextmanager
+        def recording(key, archive=None):
+            with orig(key, archive=archive) as T:
+                yield Recorder(key, T)
+
+        J._tensor_at_key = recording
+        return reads
+
+    return record
@@ -0,0 +1,112 @@
+"""Async reads should match their blocking counterparts, bound their concurrency and cancel cleanly."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors import ragged_numpy
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+@pytest.fixture
+def J(make_disk_jnrt):
+    return make_disk_jnrt(n_rows=25, max_async_reads=3)
+
+
+def test_async_reads_match_blocking_reads(J):
+    indices = [3, slice(4, 9), (2, slice(1, None)), np.array([7, 1, 7])]
+
+    async def main():
+        rows = await asyncio.gather(*(J.aget(idx) for idx in indices))
+        dense = await J.agather_dense([5, 0, 24], padding_side="left")
+        batches = [b async for b in J.aiter_batches(4, drop_last=True, prefetch=2)]
+        return rows, dense, batches
+
+    rows, dense, batches = asyncio.run(main())
+    for idx, row in zip(indices, rows):
+        assert row == J[idx]
+    expected = J[np.array([5, 0, 24])].to_dense(padding_side="left")
+    assert dense.keys() == expected.keys()
+    assert all(np.array_equal(dense[k], expected[k]) for k in expected)
+    assert len(batches) == 6
+    assert all(b == e for b, e in zip(batches, J.iter_batches(4, drop_last=True)))
+
+
+def test_async_reads_are_bounded(J):
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def slow_read(i):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return i
+
+    async def main():
+        return await asyncio.gather(*(J._run_async(slow_read, i) for i in range(12)))
+
+    assert asyncio.run(main()) == list(range(12))
+    assert peak[0] == 3
+
+
+def test_cancelled_reads_release_their_slots(J):
+    started = []
+
+    def slow_read(i):
+        started.append(i)
+        time.sleep(0.05)
+        return i
+
+    async def main():
+        tasks = [asyncio.create_task(J._run_async(slow_read, i)) for i in range(6)]
+        await asyncio.sleep(0.01)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(task.cancelled() for task in tasks)
+        # Only the reads that held a slot ever started, and every slot is free again afterwards.
+        return await asyncio.wait_for(asyncio.gather(*(J.aget(i) for i in range(3))), timeout=5)
+
+    rows = asyncio.run(main())
+    assert sorted(started) == [0, 1, 2]
+    assert all(row == J[i] for i, row in enumerate(rows))
+
+
+def test_reads_outliving_their_loop_finish_cleanly(J, caplog, monkeypatch):
+    # A pool of this test's own, so that shutting it down waits for the read and its done-callbacks.
+    pool = ThreadPoolExecutor(J._max_async_reads)
+    monkeypatch.setattr(ragged_numpy, "_thread_pool", lambda name, n_workers: pool)
+    release = threading.Event()
+
+    async def main():
+        task = asyncio.create_task(J._run_async(release.wait, 5))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return task.cancelled()
+
+    assert asyncio.run(main())
+    # The read only finishes, and frees its slot, once ``asyncio.run`` has closed its loop.
+    release.set()
+    pool.shutdown(wait=True)
+    assert not [r for r in caplog.records if r.name == "concurrent.futures"]
+
+
+def test_aiter_batches_closes_early(J):
+    async def main():
+        async for batch in J.aiter_batches(5, prefetch=1):
+            return batch
+
+    assert asyncio.run(main()) == J[:5]
+
+
+def test_max_async_reads_is_validated(J):
+    with pytest.raises(ValueError, match="max_async_reads must be a positive integer; got 0"):
+        JointNestedRaggedTensorDict(tensors_fp=J._tensors_fp, max_async_reads=0)
@@ -0,0 +1,99 @@
+"""Pooled ``to_dense`` outputs must match fresh ones, and a buffer must never be recycled while it is held.
+
+Released buffers are reused, so a stale value left over from a previous (larger) batch, or a buffer handed
+out again before its holder released it, would corrupt results silently. These tests cycle batches of
+varying shapes through one pool and compare against freshly allocated outputs.
+"""
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import DenseBufferPool, JointNestedRaggedTensorDict
+
+
+def _random_batch(rng, n_rows):
+    T, code = [], []
+    for _ in range(n_rows):
+        n_events = int(rng.integers(0, 6))
+        T.append([int(t) for t in rng.integers(1, 100, size=n_events)])
+        code.append([[int(c) for c in rng.integers(1, 50, size=int(rng.integers(0, 4)))] for _ in T[-1]])
+    return JointNestedRaggedTensorDict({"T": T, "code": code}, schema={"T": np.int64, "code": np.int64})
+
+
+@pytest.mark.parametrize("padding_side", ["left", "right"])
+def test_pooled_to_dense_matches_fresh(padding_side):
+    rng = np.random.default_rng(0)
+    pool = DenseBufferPool()
+    for n_rows in [8, 3, 8, 5, 1, 8, 8, 2]:
+        J = _random_batch(rng, n_rows)
+        fresh = J.to_dense(padding_side=padding_side)
+        with pool.borrowed(J.to_dense(padding_side=padding_side, out=pool)) as pooled:
+            assert pooled.keys() == fresh.keys()
+            for k in fresh:
+                np.testing.assert_array_equal(pooled[k], fresh[k])
+                assert pooled[k].dtype == fresh[k].dtype
+
+
+def test_steady_state_is_allocation_free():
+    rng = np.random.default_rng(1)
+    batches = [_random_batch(rng, 16) for _ in range(10)]
+    pool = DenseBufferPool()
+    pool.release(batches[0].to_dense(out=pool))
+    n_allocated = pool.n_allocated
+    for J in batches[1:]:
+        pool.release(J.to_dense(out=pool))
+    assert pool.n_allocated == n_allocated
+
+
+def test_unreleased_outputs_are_never_reused():
+    pool = DenseBufferPool()
+    J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]]})
+    first_row = J.to_dense(out=pool)["T"][0]  # Only a derived view survives, and nothing is released.
+    JointNestedRaggedTensorDict({"T": [[9, 9, 9], [9]]}).to_dense(out=pool)
+    np.testing.assert_array_equal(first_row, [1, 2, 3])
+    assert pool.n_allocated == 4
+
+
+def test_torch_tensors_of_held_outputs_are_not_overwritten():
+    torch = pytest.importorskip("torch")
+    pool = DenseBufferPool()
+    J = JointNestedRaggedTensorDict({"T": [[1, 2, 3], [4]]})
+    held = {k: torch.from_numpy(v) for k, v in J.to_dense(out=pool).items()}
+    JointNestedRaggedTensorDict({"T": [[9, 9, 9], [9]]}).to_dense(out=pool)
+    assert held["T"].tolist() == [[1, 2, 3], [4, 0, 0]]
+
+
+def test_released_buffers_are_reused_zeroed():
+    pool = DenseBufferPool()
+    big = pool.get((4, 5), np.int32)
+    big[...] = 3
+    pool.release(big)
+    small = pool.get((2, 3), np.int32)
+    assert pool.n_allocated == 1
+    assert not small.any()
+    small[...] = 5
+    pool.release(small)
+    # The tail written by the larger request is still re-zeroed when a larger request comes back.
+    assert not pool.get((4, 5), np.int32).any()
+    assert pool.n_allocated == 1
+
+
+def test_release_ignores_foreign_and_released_arrays():
+    pool = DenseBufferPool()
+    J = JointNestedRaggedTensorDict({"T": [[1, 2], [3]], "static": [7, 8]})
+    dense = J.to_dense(out=pool)
+    pool.release(dense)
+    pool.release(dense)  # Already released, including the dim-0 ``static`` key the pool never owned.
+    pool.release(np.zeros(3))
+    a, b = pool.get((2, 2), np.uint8), pool.get((2, 2), np.uint8)
+    assert a.base is not b.base
+    assert pool.n_allocated == 3
+
+
+def test_borrowed_releases_on_error():
+    pool = DenseBufferPool()
+    with pytest.raises(RuntimeError):
+        with pool.borrowed(pool.get((3,), np.float32)):
+            raise RuntimeError
+    pool.get((3,), np.float32)
+    assert pool.n_allocated == 1
@@ -49,6 +49,7 @@ def _count_safe_open(fn):
         ("slice", lambda J: J[0:3]),
         ("ndarray", lambda J: J[np.array([0, 1, 2])]),
         ("tuple", lambda J: J[0, :5]),
+        ("slice_by_value", lambda J: J.slice_by_value("val_a", 5, 20)),
     ],
 )
 def test_getitem_opens_archive_at_most_once(disk_jnrt, access_desc, access_fn):
@@ -126,3 +127,13 @@ def test_cached_len_is_consistent_across_load_modes(disk_jnrt):
     for J in (J_full, J_sub, J_mem):
         J[0]
         assert len(J) == 20
+
+
+def test_slice_by_value_reads_without_loading_all_tensors(disk_jnrt):
+    """Windowed queries should read spans through the archive rather than materializing ``.tensors``."""
+    J = JointNestedRaggedTensorDict(tensors_fp=disk_jnrt)
+    W = J.slice_by_value("val_a", 5, 20)
+    assert J._tensors is None
+    J_mem = JointNestedRaggedTensorDict(tensors_fp=disk_jnrt)
+    _ = J_mem.tensors
+    assert W == J_mem.slice_by_value("val_a", 5, 20)
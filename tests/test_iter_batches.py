@@ -0,0 +1,76 @@
+"""``iter_batches`` should match contiguous slicing while reading each stored tensor once per batch."""
+
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+@pytest.fixture
+def jnrt_fp(make_disk_jnrt):
+    return make_disk_jnrt(n_rows=23)._tensors_fp
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+@pytest.mark.parametrize("batch_size", [1, 5, 23, 40])
+@pytest.mark.parametrize("drop_last", [False, True])
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_batches_matches_slicing(jnrt_fp, on_disk, batch_size, drop_last, prefetch):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    if not on_disk:
+        _ = J.tensors
+
+    N = len(J)
+    stops = range(batch_size, N + (1 if drop_last else batch_size), batch_size)
+    expected = [J[st - batch_size : min(st, N)] for st in stops]
+    got = list(J.iter_batches(batch_size, drop_last=drop_last, prefetch=prefetch))
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected):
+        assert g == e
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {"T": [[1, 2], [3], []]},
+        {"T": [[1, 2], [3], [], []], "id": [[[1], [2, 3]], [[]], [], []]},
+        {"T": [[1], [2, 3], [4]], "id": [[[5, 6]], [[7], [8]], [[]]]},
+    ],
+)
+def test_iter_batches_with_empty_final_rows(tmp_path, raw):
+    # The last batch's elements at some dim form an empty range at the very end of the stored tensor.
+    JointNestedRaggedTensorDict(raw).save(tmp_path / "t.nrt")
+    J = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+    for batch_size in (1, 2):
+        expected = [J[st : st + batch_size] for st in range(0, len(J), batch_size)]
+        assert list(J.iter_batches(batch_size)) == expected
+
+
+def test_iter_batches_subset_keys(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, keys={"T"})
+    batches = list(J.iter_batches(10))
+    assert all(b.keys() == {"T"} for b in batches)
+    assert JointNestedRaggedTensorDict.concatenate(batches) == J[:]
+
+
+def test_iter_batches_reads_each_tensor_once_per_batch(jnrt_fp, read_recorder):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    reads = read_recorder(J)
+    n_batches = len(list(J.iter_batches(5)))
+    assert n_batches == 5
+    assert sorted(k for k, _ in reads) == sorted(sorted(J._tensor_keys) * n_batches)
+    assert J._tensors is None
+
+
+def test_iter_batches_prefetch_closes_early(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    it = J.iter_batches(2, prefetch=3)
+    assert next(it) == J[:2]
+    it.close()
+    # The archive is released and a fresh pass starts from the beginning.
+    assert next(J.iter_batches(2, prefetch=3)) == J[:2]
+
+
+def test_iter_batches_validates_prefetch(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    with pytest.raises(ValueError, match="prefetch must be a non-negative integer; got -1"):
+        J.iter_batches(2, prefetch=-1)
@@ -0,0 +1,114 @@
+"""``read_workers`` should spread disk reads over the read pool without changing any result."""
+
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors import ragged_numpy
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+@pytest.fixture
+def jnrt_fp(make_disk_jnrt):
+    return make_disk_jnrt(n_rows=30)._tensors_fp
+
+
+ACCESSES = [
+    ("int", lambda J: J[3]),
+    ("slice", lambda J: J[4:17]),
+    ("tuple", lambda J: J[0, 1:]),
+    ("fancy", lambda J: J[np.array([9, 2, 3, 28, 3, 15])]),
+    ("slice_by_value", lambda J: J.slice_by_value("T", 10, 60)),
+]
+
+
+@pytest.mark.parametrize("name,access", ACCESSES)
+@pytest.mark.parametrize("keys", [None, {"T", "code"}])
+def test_parallel_reads_match_serial_reads(jnrt_fp, name, access, keys):
+    J_serial = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, keys=keys)
+    J_parallel = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, keys=keys, read_workers=3)
+    assert access(J_parallel) == access(J_serial)
+
+
+def test_reads_run_on_pool_threads(jnrt_fp, read_recorder):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, read_workers=2)
+    reads = read_recorder(J)
+    J[2:5]
+    pool_reads = {key for (key, _), thread in zip(reads, reads.threads) if thread.startswith("nrt-read")}
+    # Locating the slice walks the bounds on the calling thread; the reads of the slice itself are pooled.
+    assert pool_reads == J._tensor_keys
+
+
+def test_concurrent_callers_get_consistent_results(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, read_workers=4, coalesce_gap=2)
+    J_mem = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    _ = J_mem.tensors
+
+    rng = np.random.default_rng(1)
+    requests = [rng.integers(0, 30, size=8) for _ in range(64)]
+    with ThreadPoolExecutor(8) as callers:
+        results = list(callers.map(lambda idx: J[idx], requests))
+    for idx, result in zip(requests, results):
+        assert result == J_mem[idx]
+
+
+def _read_in_child(J, expected, conn):
+    conn.send(J[1:3] == expected)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_pooled_reads_work_in_forked_children(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, read_workers=2)
+    expected = J[1:3]
+    J[0:2]  # Starts the read pool's threads in this process before forking.
+
+    ctx = multiprocessing.get_context("fork")
+    parent_conn, child_conn = ctx.Pipe()
+    child = ctx.Process(target=_read_in_child, args=(J, expected, child_conn))
+    child.start()
+    try:
+        assert parent_conn.poll(timeout=30), "the read in the forked child hung"
+        assert parent_conn.recv()
+    finally:
+        child.join(timeout=5)
+        if child.is_alive():
+            child.kill()
+    assert child.exitcode == 0
+
+
+def test_read_threads_keep_a_bounded_number_of_open_archives(make_disk_jnrt):
+    def open_handles():
+        return dict(ragged_numpy._THREAD_ARCHIVES.__dict__.setdefault("handles", {}))
+
+    limit = ragged_numpy._THREAD_ARCHIVES_PER_THREAD
+    pool = ragged_numpy._thread_pool("nrt-read", 1)
+    pool.submit(lambda: ragged_numpy._THREAD_ARCHIVES.__dict__.pop("handles", None)).result()
+    fps = []
+    for i in range(limit + 3):
+        J = make_disk_jnrt(n_rows=3, seed=i, read_workers=1)
+        fps.append(J._tensors_fp)
+        assert J[0:2] == JointNestedRaggedTensorDict(tensors_fp=J._tensors_fp)[0:2]
+        if i == 0:
+            (first_handle,) = pool.submit(open_handles).result().values()
+
+    handles = pool.submit(open_handles).result()
+    assert [k[0] for k in handles] == fps[-limit:]
+    # The handle evicted for the first file was closed, not just dropped.
+    with pytest.raises(Exception, match="File is closed"):
+        first_handle.keys()
+
+
+def test_read_workers_survives_pickling(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, read_workers=3)
+    J2 = pickle.loads(pickle.dumps(J))
+    assert J2._read_workers == 3
+    assert J2[1:4] == J[1:4]
+
+
+def test_read_workers_is_validated(jnrt_fp):
+    with pytest.raises(ValueError, match="read_workers must be a non-negative integer; got -2"):
+        JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, read_workers=-2)
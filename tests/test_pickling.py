@@ -0,0 +1,47 @@
+"""Unpickled disk-backed collections should be indistinguishable from freshly constructed ones.
+
+They are rebuilt through ``__init__``, so an attribute it sets can't go missing after a round trip (e.g., in a
+DataLoader worker), which would only show up as an ``AttributeError`` on whichever path first reads it.
+"""
+
+import pickle
+
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict, RowCache
+
+
+class _WithExtraAttribute(JointNestedRaggedTensorDict):
+    """Stands in for a future version of ``__init__`` that sets one more attribute."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.extra = "set in __init__"
+
+
+@pytest.mark.parametrize("keys", [None, {"T"}, {"code", "static"}])
+def test_unpickled_disk_instances_match_fresh_ones(make_disk_jnrt, keys):
+    kwargs = dict(keys=keys, coalesce_gap=3, read_workers=2, max_async_reads=4, row_cache=RowCache(1024))
+    J = make_disk_jnrt(n_rows=10, **kwargs)
+    fresh = JointNestedRaggedTensorDict(tensors_fp=J._tensors_fp, **kwargs)
+    _ = len(J), J.schema  # Cached metadata, pickled along with the path.
+
+    J2 = pickle.loads(pickle.dumps(J))
+    assert J2._tensors is None
+    assert vars(fresh).keys() <= vars(J2).keys()
+    assert (J2._subset_keys, J2._coalesce_gap, J2._read_workers, J2._max_async_reads) == (
+        J._subset_keys,
+        3,
+        2,
+        4,
+    )
+    assert J2.schema == J.schema
+    assert J2 == J
+
+
+def test_attributes_set_in_init_survive_unpickling(make_disk_jnrt):
+    J = _WithExtraAttribute(tensors_fp=make_disk_jnrt(n_rows=5)._tensors_fp, keys={"T"})
+    J2 = pickle.loads(pickle.dumps(J))
+    assert type(J2) is _WithExtraAttribute
+    assert J2.extra == "set in __init__"
+    assert J2 == J
@@ -0,0 +1,58 @@
+"""Integer-array indexing should coalesce nearby disk rows into shared reads, returning rows as requested."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+@pytest.fixture
+def jnrt_fp(make_disk_jnrt):
+    return make_disk_jnrt(n_rows=40)._tensors_fp
+
+
+@pytest.mark.parametrize("coalesce_gap", [0, 3, 100])
+@pytest.mark.parametrize("seed", range(5))
+def test_fancy_index_matches_per_row_reads(jnrt_fp, coalesce_gap, seed):
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(-40, 40, size=int(rng.integers(1, 25)))
+    J_mem = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    _ = J_mem.tensors
+    J_disk = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, coalesce_gap=coalesce_gap)
+
+    expected = JointNestedRaggedTensorDict.concatenate([J_mem[int(i) % 40 : int(i) % 40 + 1] for i in idx])
+    assert J_mem[idx] == expected
+    assert J_disk[idx] == expected
+    assert J_disk[(idx % 40).astype(np.uint16)] == expected
+
+
+def test_adjacent_rows_cost_one_read_per_tensor(jnrt_fp, read_recorder):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    reads = read_recorder(J)
+    J[np.array([7, 5, 6, 8, 6])]
+    assert sorted(k for k, _ in reads) == sorted(J._tensor_keys)
+
+
+@pytest.mark.parametrize("coalesce_gap,n_runs", [(0, 3), (2, 2), (4, 1)])
+def test_coalesce_gap_merges_runs(jnrt_fp, read_recorder, coalesce_gap, n_runs):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, coalesce_gap=coalesce_gap)
+    reads = read_recorder(J)
+    J[np.array([20, 10, 12, 11, 15])]
+    assert len([S for k, S in reads if k == "dim0/static"]) == n_runs
+
+
+def test_empty_index(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    assert J[np.array([], dtype=np.int64)] == J[:0]
+
+
+def test_coalesce_gap_survives_pickling(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, coalesce_gap=7)
+    assert pickle.loads(pickle.dumps(J))._coalesce_gap == 7
+
+
+def test_coalesce_gap_is_validated(jnrt_fp):
+    with pytest.raises(ValueError, match="coalesce_gap must be a non-negative integer; got -1"):
+        JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, coalesce_gap=-1)
@@ -0,0 +1,145 @@
+"""``RowCache`` should serve repeated row reads from memory within its byte budget, and never stale rows."""
+
+import os
+import pickle
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict, RowCache
+
+
+@pytest.fixture
+def jnrt_fp(make_disk_jnrt):
+    return make_disk_jnrt(n_rows=20)._tensors_fp
+
+
+@pytest.mark.parametrize("idx", [3, -1, (2, slice(1, None)), (4, 0)])
+def test_cached_reads_match_uncached_reads(jnrt_fp, idx):
+    cache = RowCache(max_bytes=1 << 20)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    J_plain = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+
+    first, second = J[idx], J[idx]
+    assert second is not first
+    assert first == second == J_plain[idx]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_hits_are_independent_collections(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=RowCache(max_bytes=1 << 20))
+    expected = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)[3]
+    miss, hit = J[3], J[3]
+    for out in (miss, hit):
+        out.tensors.clear()
+    assert J[3] == expected
+
+
+def test_numpy_integer_indices_share_entries_with_ints(jnrt_fp):
+    cache = RowCache(max_bytes=1 << 20)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    J_plain = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+
+    assert J[np.int64(3)] == J[3] == J_plain[3]
+    assert J[np.int32(-1), np.uint8(0)] == J[19, 0] == J_plain[-1, 0]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+
+def test_only_int_and_tuple_indices_are_cached(jnrt_fp):
+    cache = RowCache(max_bytes=1 << 20)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    J[2:5]
+    J[np.array([1, 2])]
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_key_subsets_do_not_share_entries(jnrt_fp):
+    cache = RowCache(max_bytes=1 << 20)
+    J_all = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    J_T = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, keys={"T"}, row_cache=cache)
+    assert J_T[1].keys() == {"T"}
+    assert J_all[1].keys() == {"T", "code", "val", "static"}
+    assert len(cache) == 2
+
+
+def test_lru_eviction_by_bytes(jnrt_fp):
+    J_plain = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    sizes = [sum(T.nbytes for T in J_plain[i].tensors.values()) for i in range(3)]
+    cache = RowCache(max_bytes=sizes[0] + sizes[1] + sizes[2] - 1)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+
+    J[0], J[1]
+    J[0]  # Row 1 is now the least recently used.
+    J[2]
+    assert cache.evictions == 1
+    assert cache.n_bytes == sizes[0] + sizes[2]
+    misses = cache.misses
+    J[0], J[2]
+    assert cache.misses == misses
+    J[1]
+    assert cache.misses == misses + 1
+
+
+def test_results_larger_than_the_budget_are_not_cached(jnrt_fp):
+    cache = RowCache(max_bytes=1)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    assert J[0] == JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)[0]
+    assert (len(cache), cache.n_bytes, cache.evictions) == (0, 0, 0)
+
+
+def test_cached_arrays_are_read_only(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=RowCache(max_bytes=1 << 20))
+    row = J[0]
+    for T in row.tensors.values():
+        with pytest.raises(ValueError, match="read-only"):
+            T[...] = 0
+
+
+def test_rewritten_files_invalidate_their_entries(jnrt_fp, make_disk_jnrt):
+    cache = RowCache(max_bytes=1 << 20)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache)
+    old, _ = J[0], J[1]
+
+    J_new = make_disk_jnrt(n_rows=20, seed=1)
+    shutil.copyfile(J_new._tensors_fp, jnrt_fp)
+    stat = jnrt_fp.stat()
+    os.utime(jnrt_fp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # Robust to coarse mtime clocks.
+
+    assert J_new[0] != old
+    assert J[0] == J_new[0]
+    assert len(cache) == 1
+    assert cache.hits == 0
+
+
+def test_concurrent_callers_share_the_cache(jnrt_fp):
+    cache = RowCache(max_bytes=1 << 20)
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=cache, read_workers=2)
+    J_mem = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp)
+    _ = J_mem.tensors
+
+    rng = np.random.default_rng(2)
+    requests = [int(i) for i in rng.integers(-20, 20, size=400)]
+    with ThreadPoolExecutor(8) as callers:
+        results = list(callers.map(lambda i: J[i], requests))
+    for i, result in zip(requests, results):
+        assert result == J_mem[i]
+    assert cache.hits + cache.misses == len(requests)
+    rows = {i % 20 for i in requests}
+    assert len(cache) == len(rows)
+    assert cache.n_bytes == sum(T.nbytes for i in rows for T in J[i].tensors.values())
+
+
+def test_row_cache_survives_pickling_empty(jnrt_fp):
+    J = JointNestedRaggedTensorDict(tensors_fp=jnrt_fp, row_cache=RowCache(max_bytes=4096))
+    J[0]
+    J2 = pickle.loads(pickle.dumps(J))
+    assert isinstance(J2._row_cache, RowCache)
+    assert (J2._row_cache.max_bytes, len(J2._row_cache)) == (4096, 0)
+    assert J2[0] == J[0]
+
+
+def test_row_cache_requires_tensors_fp():
+    with pytest.raises(ValueError, match="`row_cache` may only be specified alongside `tensors_fp`."):
+        JointNestedRaggedTensorDict({"T": [1, 2]}, row_cache=RowCache(max_bytes=1024))
@@ -0,0 +1,78 @@
+"""Row-group zone maps should let ``filter_rows`` skip non-candidate groups without reading their values.
+
+As with the archive-reuse tests, correctness alone doesn't show that pushdown happens (a full scan returns the
+same indices), so we record the reads ``filter_rows`` issues against the archive.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import AnyIn, AnyInRange, JointNestedRaggedTensorDict
+
+
+@pytest.fixture
+def sorted_time_jnrt():
+    """100 subjects whose timestamps increase with the subject index, as in a time-sorted cohort."""
+    rng = np.random.default_rng(0)
+    T, code = [], []
+    for i in range(100):
+        n_events = int(rng.integers(1, 5))
+        T.append([10 * i + j for j in range(n_events)])
+        # Codes are all even, except for the two planted below.
+        code.append(
+            [[2 * int(c) for c in rng.integers(0, 25, size=int(rng.integers(1, 4)))] for _ in range(n_events)]
+        )
+    code[42][0][0] = 1000
+    code[73][0][0] = 25
+    return JointNestedRaggedTensorDict({"T": T, "code": code})
+
+
+@pytest.mark.parametrize(
+    "predicate,expected",
+    [
+        (AnyInRange("T", lo=500, hi=509), [50]),
+        (AnyIn("code", [1000]), [42]),
+        (AnyIn("code", [25]), [73]),
+    ],
+)
+def test_filter_rows_matches_full_scan(sorted_time_jnrt, predicate, expected):
+    with tempfile.TemporaryDirectory() as td:
+        fp = Path(td) / "t.nrt"
+        sorted_time_jnrt.save(fp, row_group_size=10, bitset_keys=["code"])
+        J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+        np.testing.assert_array_equal(J_disk.filter_rows(predicate), expected)
+        np.testing.assert_array_equal(sorted_time_jnrt.filter_rows(predicate), expected)
+
+
+def test_filter_rows_skips_non_candidate_groups(sorted_time_jnrt, read_recorder):
+    with tempfile.TemporaryDirectory() as td:
+        fp = Path(td) / "t.nrt"
+        sorted_time_jnrt.save(fp, row_group_size=10)
+        J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+        reads = read_recorder(J_disk)
+        assert list(J_disk.filter_rows(AnyInRange("T", lo=500, hi=509))) == [50]
+
+    value_reads = [(k, S) for k, S in reads if k == "dim1/T" and isinstance(S, slice)]
+    assert len(value_reads) == 1, value_reads
+    # Only rows 50-59 (one row group) should have had their values read.
+    offsets = sorted_time_jnrt._segment_offsets(0, 1)
+    assert (value_reads[0][1].start, value_reads[0][1].stop) == (offsets[50], offsets[60])
+    # Keys not referenced by the predicate are never read.
+    assert not any(k.endswith("/code") for k, _ in reads)
+
+
+def test_filter_rows_bitsets_prune_groups(sorted_time_jnrt, read_recorder):
+    with tempfile.TemporaryDirectory() as td:
+        fp = Path(td) / "t.nrt"
+        sorted_time_jnrt.save(fp, row_group_size=10, bitset_keys=["code"], bitset_n_bits=64)
+        J_disk = JointNestedRaggedTensorDict(tensors_fp=fp)
+        reads = read_recorder(J_disk)
+        assert list(J_disk.filter_rows(AnyIn("code", [25]))) == [73]
+
+    value_reads = [S for k, S in reads if k == "dim2/code" and isinstance(S, slice)]
+    # 25 lies within every group's [min, max] zone map, but it is the only odd code, so its bit is only set in
+    # the bitset of the group holding row 73.
+    assert len(value_reads) == 1
@@ -0,0 +1,63 @@
+"""``BlockShuffleSampler`` should cover every row once per epoch while keeping each batch to a few blocks."""
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.sampling import BlockShuffleSampler
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 97, 256])
+@pytest.mark.parametrize(
+    "batch_size,block_size,buffer_blocks", [(8, 32, 1), (16, 8, 4), (10, 7, 3), (64, 64, 2)]
+)
+@pytest.mark.parametrize("shuffle_rows", [True, False])
+def test_sampler_covers_rows_locally(n_rows, batch_size, block_size, buffer_blocks, shuffle_rows):
+    sampler = BlockShuffleSampler(
+        n_rows, batch_size, block_size, buffer_blocks=buffer_blocks, shuffle_rows=shuffle_rows, seed=0
+    )
+    batches = list(sampler)
+    assert len(batches) == len(sampler)
+    assert all(len(b) == batch_size for b in batches[:-1])
+
+    all_rows = np.concatenate([np.zeros(0, dtype=np.int64), *batches])
+    np.testing.assert_array_equal(np.sort(all_rows), np.arange(n_rows))
+    for b in batches:
+        assert np.all(np.diff(b) > 0)
+        assert len(np.unique(b // block_size)) <= 2 * buffer_blocks
+
+
+def test_sampler_drop_last():
+    sampler = BlockShuffleSampler(10, batch_size=4, block_size=3, drop_last=True, seed=0)
+    batches = list(sampler)
+    assert len(batches) == len(sampler) == 2
+    assert all(len(b) == 4 for b in batches)
+
+
+def test_sampler_is_reproducible_per_epoch():
+    def epoch(sampler, e):
+        sampler.set_epoch(e)
+        return [b.tolist() for b in sampler]
+
+    a = BlockShuffleSampler(200, batch_size=16, block_size=20, buffer_blocks=2, seed=3)
+    b = BlockShuffleSampler(200, batch_size=16, block_size=20, buffer_blocks=2, seed=3)
+    assert epoch(a, 0) == epoch(b, 0)
+    assert epoch(a, 1) == epoch(b, 1)
+    assert epoch(a, 0) != epoch(a, 1)
+
+
+def test_sampler_without_shuffling_is_sequential():
+    sampler = BlockShuffleSampler(10, batch_size=4, block_size=3, shuffle_blocks=False, shuffle_rows=False)
+    assert [b.tolist() for b in sampler] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"batch_size": 0}, "batch_size must be a positive integer; got 0"),
+        ({"buffer_blocks": 0}, "buffer_blocks must be a positive integer; got 0"),
+        ({"n_rows": -1}, "n_rows must be non-negative; got -1"),
+    ],
+)
+def test_sampler_validates_arguments(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        BlockShuffleSampler(**{"n_rows": 10, "batch_size": 4, "block_size": 3, **kwargs})
@@ -0,0 +1,82 @@
+"""Shared-memory handles should give worker processes zero-copy access to one physical copy of the tensors.
+
+Workers are started with the ``spawn`` context so nothing is inherited through ``fork``: the only way a worker
+can see the data is by attaching to the segment named in the pickled handle.
+"""
+
+import multiprocessing as mp
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict, SharedTensorsHandle
+
+
+@pytest.fixture
+def jnrt():
+    rng = np.random.default_rng(0)
+    return JointNestedRaggedTensorDict({"T": [list(range(int(rng.integers(1, 6)))) for _ in range(20)]})
+
+
+def _worker_sum(handle: SharedTensorsHandle) -> tuple[int, bool]:
+    """Sums ``dim1/T`` through the attached collection; also reports whether it is a view, not a copy."""
+    J = handle.attach()
+    T = J.tensors["dim1/T"]
+    out = int(T.sum()), T.base is not None
+    del J, T
+    handle.close()
+    return out
+
+
+def _worker_write(handle: SharedTensorsHandle):
+    J = handle.attach()
+    J.tensors["dim1/T"][0] = 99
+    del J
+    handle.close()
+
+
+def test_spawned_workers_share_one_copy(jnrt):
+    expected = int(jnrt.tensors["dim1/T"].sum())
+    with jnrt.share_memory() as handle:
+        with mp.get_context("spawn").Pool(2) as pool:
+            assert pool.map(_worker_sum, [handle, handle]) == [(expected, True)] * 2
+            pool.apply(_worker_write, (handle,))
+        # The worker's write lands in the parent's mapping: there is only one physical copy.
+        shared = handle.attach()
+        assert shared.tensors["dim1/T"][0] == 99
+        assert shared[1:] == jnrt[1:]
+        del shared
+
+
+def test_disk_backed_share_memory_round_trips(jnrt):
+    with tempfile.TemporaryDirectory() as td:
+        fp = Path(td) / "t.nrt"
+        jnrt.save(fp)
+        J_disk = JointNestedRaggedTensorDict(tensors_fp=fp, keys={"T"})
+        with J_disk.share_memory() as handle:
+            assert J_disk._tensors is None
+            shared = handle.attach()
+            assert shared.keys() == {"T"}
+            assert shared == JointNestedRaggedTensorDict(tensors_fp=fp, keys={"T"})
+            del shared
+
+
+def test_zero_byte_tensors_fit_in_segment():
+    J = JointNestedRaggedTensorDict({"T": [[], []]}, schema={"T": np.float32})
+    with J.share_memory() as handle:
+        shared = handle.attach()
+        assert shared == J
+        del shared
+
+
+def test_unlink_destroys_segment(jnrt):
+    handle = jnrt.share_memory()
+    name = handle.name
+    handle.close()
+    handle.unlink()
+    with pytest.raises(FileNotFoundError):
+        SharedTensorsHandle(name, handle.layout, handle.schema).attach()
+    with pytest.raises(ValueError, match="Only the handle"):
+        handle.unlink()
@@ -0,0 +1,76 @@
+"""``slice_by_value`` on disk should read only the windows' element ranges and the probes of its search."""
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors import ragged_numpy
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+def _sorted_time_jnrt(
+    seed: int, n_rows: int, max_events: int, min_events: int = 0
+) -> JointNestedRaggedTensorDict:
+    rng = np.random.default_rng(seed)
+    T, code = [], []
+    for i in range(n_rows):
+        n_events = int(rng.integers(max(min_events, 0 if i else 1), max_events))
+        T.append(sorted(int(t) for t in rng.integers(0, 1000, size=n_events)))
+        code.append([[int(c) for c in rng.integers(0, 9, size=int(rng.integers(1, 4)))] for _ in T[-1]])
+    return JointNestedRaggedTensorDict({"T": T, "code": code, "static": list(range(n_rows))})
+
+
+def _read_elements(reads, key):
+    return np.concatenate(
+        [np.arange(S.start, S.stop) for k, S in reads if k == key] + [np.zeros(0, dtype=np.int64)]
+    )
+
+
+@pytest.mark.parametrize("max_events", [5, 1000])
+@pytest.mark.parametrize("read_gap", [0, 50])
+@pytest.mark.parametrize("seed", range(3))
+def test_slice_by_value_matches_in_memory(tmp_path, max_events, read_gap, seed, monkeypatch):
+    # With up to 1000 events per row, some rows are searched by bisection on disk and others read whole.
+    monkeypatch.setattr(ragged_numpy, "_WHOLE_SEGMENT_SEARCH_LEN", 100)
+    monkeypatch.setattr(ragged_numpy, "_ELEMENT_READ_GAP", read_gap)
+    J = _sorted_time_jnrt(seed, 15, max_events)
+    J.save(tmp_path / "t.nrt")
+    J_disk = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+
+    rng = np.random.default_rng(seed)
+    lo = rng.integers(0, 1000, size=15)
+    for window in [(300, 320), (None, 500), (lo, lo + 50), (lo, None), (2000, None)]:
+        assert J_disk.slice_by_value("T", *window) == J.slice_by_value("T", *window)
+    np.testing.assert_array_equal(
+        J_disk.searchsorted("T", lo, side="right"), J.searchsorted("T", lo, "right")
+    )
+
+
+def test_slice_by_value_reads_only_the_windows(tmp_path, read_recorder, monkeypatch):
+    # Rows long enough that the search bisects each on disk rather than reading it whole, and no windows
+    # sharing reads, so that every read is of a window.
+    monkeypatch.setattr(ragged_numpy, "_WHOLE_SEGMENT_SEARCH_LEN", 256)
+    monkeypatch.setattr(ragged_numpy, "_ELEMENT_READ_GAP", 0)
+    J = _sorted_time_jnrt(0, 20, 1000, min_events=300)
+    J.save(tmp_path / "t.nrt")
+    J_disk = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+    _ = J_disk.schema  # Cached metadata, read from the first element of each key.
+    reads = read_recorder(J_disk)
+    W = J_disk.slice_by_value("T", 400, 410)
+    assert W == J.slice_by_value("T", 400, 410)
+
+    # The kept elements, at dim 1 and (through the bounds) at dim 2.
+    starts, ends = J.searchsorted("T", 400), J.searchsorted("T", 410)
+    row_offsets = J._segment_offsets(0, 1)[:-1]
+    kept_events = J._concat_ranges(row_offsets + starts, ends - starts)
+    event_offsets = J._segment_offsets(1, 2)
+    kept_codes = J._concat_ranges(event_offsets[kept_events], np.diff(event_offsets)[kept_events])
+
+    # Every code is read once, and only within the windows.
+    np.testing.assert_array_equal(_read_elements(reads, "dim2/code"), kept_codes)
+    # The dim-2 bounds of the kept events are read along with the end of each preceding event.
+    bounds_read = set(_read_elements(reads, "dim2/bounds"))
+    assert set(kept_events) <= bounds_read <= set(kept_events) | set(kept_events - 1)
+    # ``T`` itself is only probed by the search (plus the kept events), far less than the whole key.
+    assert len(_read_elements(reads, "dim1/T")) < len(J.tensors["dim1/T"]) // 10
+    # The dim-0 key and the dim-1 bounds are read in full: every row is part of the result.
+    assert {k for k, _ in reads} == {"dim0/static", "dim1/bounds", "dim1/T", "dim2/bounds", "dim2/code"}
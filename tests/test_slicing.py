@@ -0,0 +1,48 @@
+"""Dim-0 slices should follow Python's slice semantics, in memory and on disk alike.
+
+Slice bounds past either end, negative bounds and empty slices at the end of the rows all used to either
+return the wrong rows or fail in the archive, which rejects out-of-range and end-of-tensor reads.
+"""
+
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+RAW = {
+    "T": [[1, 2], [3], [], [4, 5, 6], [7]],
+    "code": [[[1], [2, 3]], [[4]], [], [[5, 6], [7], [8]], [[9]]],
+    "static": [10, 11, 12, 13, 14],
+}
+SCHEMA = {"T": int, "code": int, "static": int}
+
+
+@pytest.mark.parametrize(
+    "S",
+    [
+        slice(2, 100),
+        slice(None, 9),
+        slice(0, -1),
+        slice(-2, None),
+        slice(-3, -1),
+        slice(-100, 2),
+        slice(5, None),
+        slice(7, 9),
+        slice(4, 2),
+        slice(-1, -3),
+    ],
+)
+def test_dim0_slices_match_python_slicing(tmp_path, S):
+    J = JointNestedRaggedTensorDict(RAW, schema=SCHEMA)
+    J.save(tmp_path / "t.nrt")
+    J_disk = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+
+    assert len(J[S]) == len(J_disk[S]) == len(range(5)[S])
+    if len(range(5)[S]) == 0:
+        # Collections cannot be built from empty lists; an empty slice has every tensor, all empty.
+        for out in (J[S], J_disk[S]):
+            assert out.tensors.keys() == J.tensors.keys()
+            assert all(len(T) == 0 for T in out.tensors.values())
+    else:
+        expected = JointNestedRaggedTensorDict({k: v[S] for k, v in RAW.items()}, schema=SCHEMA)
+        assert J[S] == expected
+        assert J_disk[S] == expected
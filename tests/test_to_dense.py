@@ -0,0 +1,133 @@
+"""Randomized and disk-read checks for ``to_dense`` beyond the hand-picked doctest shapes.
+
+``to_dense(max_lens=...)`` must match truncating first and densifying after, for every side combination, as
+a dropped element must take its whole subtree with it during the vectorized fill. Key selection on a
+disk-backed instance must not read excluded keys, which only shows up by instrumenting the archive reads.
+"""
+
+import numpy as np
+import pytest
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict
+
+
+def _random_jnrt(rng, n_rows):
+    T, code = [], []
+    for i in range(n_rows):
+        # Keep the first row non-empty; an all-empty collection has no inner dims to truncate.
+        n_events = int(rng.integers(0 if i else 1, 6))
+        T.append([int(t) for t in rng.integers(1, 9, size=n_events)])
+        code.append(
+            [[int(c) for c in rng.integers(1, 9, size=int(rng.integers(1, 5)))] for _ in range(n_events)]
+        )
+    return JointNestedRaggedTensorDict({"T": T, "code": code}, schema={"T": np.int64, "code": np.int64})
+
+
+@pytest.mark.parametrize("truncate_side", ["left", "right"])
+@pytest.mark.parametrize("padding_side", ["left", "right"])
+@pytest.mark.parametrize("max_lens", [{1: 2}, {2: 1}, {1: 3, 2: 2}])
+def test_max_lens_matches_truncate(truncate_side, padding_side, max_lens):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        J = _random_jnrt(rng, int(rng.integers(1, 6)))
+        truncated = J
+        for dim, max_len in max_lens.items():
+            truncated = truncated.truncate(dim, max_len, side=truncate_side)
+        expected = truncated.to_dense(padding_side=padding_side)
+        got = J.to_dense(padding_side=padding_side, max_lens=max_lens, truncate_side=truncate_side)
+        assert got.keys() == expected.keys()
+        for k in expected:
+            np.testing.assert_array_equal(got[k], expected[k])
+
+
+def test_bucketed_shapes_are_stable_and_bounded():
+    rng = np.random.default_rng(1)
+    shapes = set()
+    for _ in range(20):
+        dense = _random_jnrt(rng, 4).to_dense(pad_to_multiple_of=8, max_lens={2: 3})
+        shapes.add(dense["code"].shape)
+    assert shapes == {(4, 8, 3)}
+
+
+def test_key_selection_skips_reads_on_disk(make_disk_jnrt, read_recorder):
+    J_disk = make_disk_jnrt(n_rows=10)
+    expected = JointNestedRaggedTensorDict(tensors_fp=J_disk._tensors_fp).to_dense()
+    reads = read_recorder(J_disk)
+    got = J_disk.to_dense(keys=["T"])
+
+    assert J_disk._tensors is None
+    assert {k for k, _ in reads} == {"dim1/T", "dim1/bounds"}
+    assert got.keys() == {"T", "dim1/mask"}
+    for k in got:
+        np.testing.assert_array_equal(got[k], expected[k])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"padding_side": "left"},
+        {"pad_to_multiple_of": 4, "max_lens": {2: 2}, "truncate_side": "left"},
+        {"keys": ["code"], "masks": [2]},
+    ],
+)
+def test_memmap_export_matches_to_dense(tmp_path, kwargs):
+    rng = np.random.default_rng(3)
+    J = _random_jnrt(rng, 23)
+    J.save(tmp_path / "t.nrt")
+    J_disk = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+
+    out = J_disk.to_dense_memmap(tmp_path / "dense", chunk_size=5, **kwargs)
+    expected = J.to_dense(**kwargs)
+    assert J_disk._tensors is None
+    assert out.keys() == expected.keys()
+    for k in expected:
+        np.testing.assert_array_equal(out[k], expected[k])
+        np.testing.assert_array_equal(np.load(tmp_path / "dense" / f"{k.replace('/', '.')}.npy"), expected[k])
+
+
+def test_memmap_export_key_selection_skips_reads_on_disk(tmp_path, make_disk_jnrt, read_recorder):
+    J_disk = make_disk_jnrt(n_rows=10)
+    expected = JointNestedRaggedTensorDict(tensors_fp=J_disk._tensors_fp).to_dense(keys=["T"])
+    _ = J_disk.schema  # Cached metadata, read from the first element of each key.
+    reads = read_recorder(J_disk)
+    out = J_disk.to_dense_memmap(tmp_path / "dense", chunk_size=3, keys=["T"])
+
+    assert {k for k, _ in reads} == {"dim1/T", "dim1/bounds"}
+    assert out.keys() == expected.keys()
+    for k in expected:
+        np.testing.assert_array_equal(out[k], expected[k])
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+@pytest.mark.parametrize(
+    "raw",
+    [
+        # The first chunk has no ``id`` elements, so its dense output has no ``id`` key.
+        {"T": [[1], [2, 3], [4]], "id": [[[]], [[], []], [[5, 6]]]},
+        # The last chunk's elements are empty ranges at the end of the stored tensors.
+        {"T": [[1, 2], [3], []], "id": [[[1], [2, 3]], [[4]], []]},
+    ],
+)
+def test_memmap_export_with_chunks_missing_elements(tmp_path, raw, on_disk):
+    J = JointNestedRaggedTensorDict(raw)
+    if on_disk:
+        J.save(tmp_path / "t.nrt")
+        J = JointNestedRaggedTensorDict(tensors_fp=tmp_path / "t.nrt")
+
+    out = J.to_dense_memmap(tmp_path / "dense", chunk_size=1)
+    expected = J.to_dense()
+    assert out.keys() == expected.keys()
+    for k in expected:
+        np.testing.assert_array_equal(out[k], expected[k])
+        assert out[k].dtype == expected[k].dtype
+
+
+@pytest.mark.parametrize("keys", ["T", b"T"])
+def test_bare_string_keys_are_rejected(tmp_path, keys):
+    J = _random_jnrt(np.random.default_rng(4), 3)
+    with pytest.raises(TypeError, match="not a bare str/bytes"):
+        J.to_dense(keys=keys)
+    with pytest.raises(TypeError, match="not a bare str/bytes"):
+        J.to_dense_memmap(tmp_path / "dense", keys=keys)
+    assert not (tmp_path / "dense").exists()
@@ -0,0 +1,66 @@
+"""The torch datasets should shard rows across workers without overlap and collate without copies."""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+from torch.utils.data import DataLoader  # noqa: E402
+
+from nested_ragged_tensors.ragged_numpy import JointNestedRaggedTensorDict  # noqa: E402
+from nested_ragged_tensors.torch import (  # noqa: E402
+    NestedRaggedTensorDataset,
+    NestedRaggedTensorIterableDataset,
+    collate,
+)
+
+
+@pytest.fixture(scope="module")
+def nrt_fp():
+    rng = np.random.default_rng(0)
+    # Row i holds the value i in every element, so batches identify the rows they came from.
+    J = JointNestedRaggedTensorDict(
+        {"T": [[i] * int(rng.integers(1, 6)) for i in range(23)]}, schema={"T": np.int64}
+    )
+    with tempfile.TemporaryDirectory() as td:
+        fp = Path(td) / "t.nrt"
+        J.save(fp)
+        yield fp
+
+
+def _rows(batch: dict) -> list[int]:
+    return batch["T"][:, 0].tolist()
+
+
+@pytest.mark.parametrize("num_workers", [0, 2, 3])
+@pytest.mark.parametrize("drop_last", [False, True])
+def test_iterable_dataset_shards_in_order(nrt_fp, num_workers, drop_last):
+    dataset = NestedRaggedTensorIterableDataset(nrt_fp, batch_size=4, drop_last=drop_last)
+    loader = DataLoader(dataset, batch_size=None, collate_fn=collate, num_workers=num_workers)
+    rows = [r for batch in loader for r in _rows(batch)]
+    assert rows == list(range(20 if drop_last else 23))
+    assert len(loader) == len(dataset) == (5 if drop_last else 6)
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_map_dataset_batched_fetch_matches_per_row(nrt_fp, num_workers):
+    dataset = NestedRaggedTensorDataset(nrt_fp)
+    indices = [7, 3, 22, 0]
+    batched = collate(dataset.__getitems__(indices))
+    per_row = collate([dataset[i] for i in indices])
+    assert batched.keys() == per_row.keys()
+    assert all(torch.equal(batched[k], per_row[k]) for k in batched)
+
+    loader = DataLoader(dataset, batch_size=5, shuffle=True, collate_fn=collate, num_workers=num_workers)
+    assert sorted(r for batch in loader for r in _rows(batch)) == list(range(23))
+
+
+def test_collate_does_not_copy():
+    J = JointNestedRaggedTensorDict({"T": [[1, 2], [3]]})
+    dense = J.to_dense()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(JointNestedRaggedTensorDict, "to_dense", lambda self: dense)
+        out = collate(J)
+    assert all(out[k].data_ptr() == dense[k].ctypes.data for k in dense)